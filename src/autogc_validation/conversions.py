@@ -9,9 +9,22 @@ Relationships:
     ppmC = ppmV * carbon_count
     ppbV = ppmV * 1000
     ppbC = ppmC * 1000
+
+:func:`convert` handles one compound at a time; :func:`convert_array` and
+:func:`convert_frame` convert whole columns or wide AQS-code frames in a
+single NumPy expression.
 """
 
-from autogc_validation.database.enums import ConcentrationUnit, get_carbon_count
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from autogc_validation.database.enums import (
+    COMPOUND_REGISTRY,
+    ConcentrationUnit,
+    get_carbon_count,
+)
 
 _PPB_PPM_FACTOR = 1000
 
@@ -68,6 +81,22 @@ def ppmc_to_ppbc(value):
 # High-level conversion dispatcher
 # ---------------------------------------------------------------------------
 
+_CONVERTERS = {
+    (ConcentrationUnit.PPBC, ConcentrationUnit.PPBV): ppbc_to_ppbv,
+    (ConcentrationUnit.PPBV, ConcentrationUnit.PPBC): ppbv_to_ppbc,
+    (ConcentrationUnit.PPMC, ConcentrationUnit.PPMV): ppmc_to_ppmv,
+    (ConcentrationUnit.PPMV, ConcentrationUnit.PPMC): ppmv_to_ppmc,
+    (ConcentrationUnit.PPBV, ConcentrationUnit.PPMV): lambda v, cc: ppbv_to_ppmv(v),
+    (ConcentrationUnit.PPMV, ConcentrationUnit.PPBV): lambda v, cc: ppmv_to_ppbv(v),
+    (ConcentrationUnit.PPBC, ConcentrationUnit.PPMC): lambda v, cc: ppbc_to_ppmc(v),
+    (ConcentrationUnit.PPMC, ConcentrationUnit.PPBC): lambda v, cc: ppmc_to_ppbc(v),
+    (ConcentrationUnit.PPBC, ConcentrationUnit.PPMV): lambda v, cc: ppbv_to_ppmv(ppbc_to_ppbv(v, cc)),
+    (ConcentrationUnit.PPMV, ConcentrationUnit.PPBC): lambda v, cc: ppbv_to_ppbc(ppmv_to_ppbv(v), cc),
+    (ConcentrationUnit.PPBV, ConcentrationUnit.PPMC): lambda v, cc: ppbc_to_ppmc(ppbv_to_ppbc(v, cc)),
+    (ConcentrationUnit.PPMC, ConcentrationUnit.PPBV): lambda v, cc: ppbc_to_ppbv(ppmc_to_ppbc(v), cc),
+}
+
+
 def convert(value, aqs_code: int, from_unit: ConcentrationUnit, to_unit: ConcentrationUnit):
     """Convert a concentration value between units for a given compound.
 
@@ -90,23 +119,131 @@ def convert(value, aqs_code: int, from_unit: ConcentrationUnit, to_unit: Concent
 
     carbon_count = get_carbon_count(aqs_code)
 
-    _converters = {
-        (ConcentrationUnit.PPBC, ConcentrationUnit.PPBV): lambda v: ppbc_to_ppbv(v, carbon_count),
-        (ConcentrationUnit.PPBV, ConcentrationUnit.PPBC): lambda v: ppbv_to_ppbc(v, carbon_count),
-        (ConcentrationUnit.PPMC, ConcentrationUnit.PPMV): lambda v: ppmc_to_ppmv(v, carbon_count),
-        (ConcentrationUnit.PPMV, ConcentrationUnit.PPMC): lambda v: ppmv_to_ppmc(v, carbon_count),
-        (ConcentrationUnit.PPBV, ConcentrationUnit.PPMV): ppbv_to_ppmv,
-        (ConcentrationUnit.PPMV, ConcentrationUnit.PPBV): ppmv_to_ppbv,
-        (ConcentrationUnit.PPBC, ConcentrationUnit.PPMC): ppbc_to_ppmc,
-        (ConcentrationUnit.PPMC, ConcentrationUnit.PPBC): ppmc_to_ppbc,
-        (ConcentrationUnit.PPBC, ConcentrationUnit.PPMV): lambda v: ppbv_to_ppmv(ppbc_to_ppbv(v, carbon_count)),
-        (ConcentrationUnit.PPMV, ConcentrationUnit.PPBC): lambda v: ppbv_to_ppbc(ppmv_to_ppbv(v), carbon_count),
-        (ConcentrationUnit.PPBV, ConcentrationUnit.PPMC): lambda v: ppbc_to_ppmc(ppbv_to_ppbc(v, carbon_count)),
-        (ConcentrationUnit.PPMC, ConcentrationUnit.PPBV): lambda v: ppbc_to_ppbv(ppmc_to_ppbc(v), carbon_count),
-    }
-
     key = (from_unit, to_unit)
-    if key not in _converters:
+    if key not in _CONVERTERS:
         raise ValueError(f"Unsupported conversion: {from_unit} -> {to_unit}")
 
-    return _converters[key](value)
+    return _CONVERTERS[key](value, carbon_count)
+
+
+# ---------------------------------------------------------------------------
+# Vectorized conversion over AQS-code arrays
+# ---------------------------------------------------------------------------
+
+# Every unit is (ppb/ppm magnitude) x (volume or carbon basis). Converting
+# from unit i to unit j multiplies by _MAGNITUDE_FACTOR[i, j] and by the
+# carbon count raised to _CARBON_EXPONENT[i, j] (-1, 0 or +1).
+_UNITS = list(ConcentrationUnit)
+_UNIT_POS = {unit: i for i, unit in enumerate(_UNITS)}
+_MAGNITUDE = np.array([
+    _PPB_PPM_FACTOR if u in (ConcentrationUnit.PPMV, ConcentrationUnit.PPMC) else 1
+    for u in _UNITS
+], dtype=float)
+_CARBON_BASIS = np.array([
+    u in (ConcentrationUnit.PPBC, ConcentrationUnit.PPMC) for u in _UNITS
+], dtype=int)
+_MAGNITUDE_FACTOR = _MAGNITUDE[:, None] / _MAGNITUDE[None, :]
+_CARBON_EXPONENT = _CARBON_BASIS[None, :] - _CARBON_BASIS[:, None]
+
+_CARBON_COUNT = COMPOUND_REGISTRY.carbon_count.astype(float)
+
+
+def _unit_positions(units) -> np.ndarray:
+    """Map a unit or array of units to positions in _UNITS."""
+    arr = np.asarray(units, dtype=object)
+    uniques, inverse = np.unique(arr.astype(str), return_inverse=True)
+    try:
+        lookup = np.array([_UNIT_POS[ConcentrationUnit(u)] for u in uniques], dtype=np.intp)
+    except ValueError as e:
+        raise ValueError(f"Unsupported concentration unit: {e}") from None
+    return lookup[inverse].reshape(arr.shape)
+
+
+def _carbon_counts(aqs_codes: np.ndarray, required: np.ndarray) -> np.ndarray:
+    """Carbon counts for *aqs_codes*; NaN where unknown and not *required*.
+
+    Raises:
+        ValueError: If any code where *required* is True is not a known
+            target compound.
+    """
+    codes = np.asarray(aqs_codes, dtype=np.int64)
+    idx = COMPOUND_REGISTRY.indices(codes, strict=False)
+    missing = required & (idx < 0)
+    if missing.any():
+        unknown = sorted({int(c) for c in codes[missing]})
+        raise ValueError(f"AQS code(s) {unknown} are not known target compounds")
+    return np.where(idx >= 0, _CARBON_COUNT[idx], np.nan)
+
+
+def convert_array(values, aqs_codes, from_units, to_unit: ConcentrationUnit) -> np.ndarray:
+    """Convert concentrations for many compounds in one vectorized step.
+
+    *values*, *aqs_codes* and *from_units* are broadcast against each other,
+    so a scalar unit or code applies to every value, and a 1-D array of
+    codes converts the columns of a 2-D value array.
+
+    Args:
+        values: Concentration values (array-like).
+        aqs_codes: AQS code per value (scalar or array-like of int).
+        from_units: Source unit per value (scalar or array-like).
+        to_unit: Target concentration unit.
+
+    Returns:
+        Float ndarray of converted values with the broadcast shape.
+
+    Raises:
+        ValueError: If a unit is not a ConcentrationUnit, or an AQS code
+            that needs a unit change is not a known target compound.
+    """
+    values = np.asarray(values, dtype=float)
+    values, codes, src = np.broadcast_arrays(
+        values, np.asarray(aqs_codes), _unit_positions(from_units),
+    )
+    dst = _UNIT_POS[ConcentrationUnit(to_unit)]
+
+    exponent = _CARBON_EXPONENT[src, dst]
+    carbon = _carbon_counts(codes, required=src != dst)
+    with np.errstate(invalid="ignore"):
+        carbon_factor = np.where(exponent == 0, 1.0, carbon ** exponent)
+    return values * _MAGNITUDE_FACTOR[src, dst] * carbon_factor
+
+
+def convert_frame(
+    df: pd.DataFrame,
+    to_unit: ConcentrationUnit,
+    from_unit: Optional[ConcentrationUnit] = None,
+) -> pd.DataFrame:
+    """Convert a wide AQS-code DataFrame to another unit.
+
+    Integer (AQS code) columns are converted; any other columns, such as
+    'filename', are passed through unchanged.
+
+    Args:
+        df: Wide DataFrame with AQS code columns (e.g. MDL or canister
+            periods).
+        to_unit: Target concentration unit.
+        from_unit: Source unit. Defaults to df.attrs['units'].
+
+    Returns:
+        New DataFrame with converted values and attrs['units'] = to_unit.
+
+    Raises:
+        ValueError: If from_unit is not given and df.attrs has no 'units'.
+    """
+    if from_unit is None:
+        from_unit = df.attrs.get("units")
+        if from_unit is None:
+            raise ValueError("from_unit not given and df.attrs['units'] is not set")
+
+    codes = [c for c in df.columns if isinstance(c, (int, np.integer))]
+    result = df.copy()
+    if codes:
+        converted = convert_array(
+            df[codes].to_numpy(dtype=float, na_value=np.nan),
+            np.array(codes, dtype=np.int64),
+            from_unit,
+            to_unit,
+        )
+        result[codes] = converted
+    result.attrs["units"] = to_unit
+    return result
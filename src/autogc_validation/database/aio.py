@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+"""
+Asyncio interface to the reference-data queries.
+
+SQLite and the AirVision ODBC driver are both blocking, so each query runs
+in a worker thread via :func:`asyncio.to_thread`. That lets independent
+queries — MDL periods, canister periods and station temperatures — run
+at the same time instead of one after another::
+
+    ref = await gather_reference_data(database, site_id, start, end,
+                                      ConcentrationUnit.PPBC, station="EQ")
+
+Notebook and Quarto cells can ``await`` directly; plain scripts can call
+:func:`load_reference_data`, which runs the same gather and blocks.
+
+Passing a :class:`~autogc_validation.database.conn.Session` is safe: each
+worker thread gets its own pooled connection.
+"""
+
+import asyncio
+import logging
+import threading
+from pathlib import Path
+from typing import Dict, NamedTuple, Optional, Sequence, Union
+
+import pandas as pd
+
+from autogc_validation.database.airvision.cache import get_station_temperatures
+from autogc_validation.database.airvision.station_temp import Connector, query_av_rtemp
+from autogc_validation.database.conn import DatabaseLike
+from autogc_validation.database.enums import ConcentrationUnit
+from autogc_validation.database.operations import get_canister_periods_by_type, get_mdl_periods
+
+logger = logging.getLogger(__name__)
+
+
+class ReferenceData(NamedTuple):
+    """Reference data for one site and date range."""
+    mdl_periods: pd.DataFrame
+    canister_periods: Dict[str, pd.DataFrame]  # keyed by canister type (CVS, LCS, RTS)
+    temperatures: Optional[pd.Series]          # None if not requested or unavailable
+
+
+async def get_mdl_periods_async(
+    database: DatabaseLike,
+    site_id: int,
+    start_date: str,
+    end_date: str,
+    output_unit: ConcentrationUnit,
+) -> pd.DataFrame:
+    """Async :func:`~autogc_validation.database.operations.get_mdl_periods`."""
+    return await asyncio.to_thread(
+        get_mdl_periods, database, site_id, start_date, end_date, output_unit
+    )
+
+
+async def get_canister_periods_by_type_async(
+    database: DatabaseLike,
+    site_id: int,
+    start_date: str,
+    end_date: str,
+    output_unit: ConcentrationUnit,
+    canister_types: Optional[Sequence[str]] = None,
+) -> Dict[str, pd.DataFrame]:
+    """Async :func:`~autogc_validation.database.operations.get_canister_periods_by_type`."""
+    return await asyncio.to_thread(
+        get_canister_periods_by_type,
+        database, site_id, start_date, end_date, output_unit, canister_types,
+    )
+
+
+async def query_av_rtemp_async(
+    start_date: pd.Timestamp,
+    end_date: pd.Timestamp,
+    site: str,
+    connect: Optional[Connector] = None,
+) -> pd.Series:
+    """Async :func:`~autogc_validation.database.airvision.query_av_rtemp`."""
+    return await asyncio.to_thread(query_av_rtemp, start_date, end_date, site, connect)
+
+
+async def _station_temperatures(
+    start_date: str,
+    end_date: str,
+    station: str,
+    connect: Optional[Connector],
+    cache_path: Optional[Union[str, Path]],
+) -> Optional[pd.Series]:
+    """Cached temperatures, or None (with a warning) if AirVision fails."""
+    start = pd.Timestamp(start_date)
+    # "HH:MM" end dates cover the whole final minute
+    end = pd.Timestamp(end_date).floor("min") + pd.Timedelta(seconds=59)
+    try:
+        temperatures = await asyncio.to_thread(
+            get_station_temperatures, start, end, [station], connect, cache_path,
+        )
+        return temperatures[station]
+    except Exception as e:
+        logger.warning("Station temperatures for %s unavailable: %s", station, e)
+        return None
+
+
+async def gather_reference_data(
+    database: DatabaseLike,
+    site_id: int,
+    start_date: str,
+    end_date: str,
+    output_unit: ConcentrationUnit,
+    station: Optional[str] = None,
+    connect: Optional[Connector] = None,
+    cache_path: Optional[Union[str, Path]] = None,
+) -> ReferenceData:
+    """Query MDL periods, canister periods and station temperatures concurrently.
+
+    Args:
+        database: Path to the database file, or a Session.
+        site_id: Site identifier.
+        start_date: Start of range (YYYY-MM-DD HH:MM).
+        end_date: End of range (YYYY-MM-DD HH:MM).
+        output_unit: Unit for MDL and canister concentrations.
+        station: AQS 2-letter site code for the station temperatures, read
+            through the local AirVision cache; skipped if None.
+        connect: AirVision connection factory, as for query_av_rtemp.
+        cache_path: AirVision temperature cache file; the default if None.
+
+    Returns:
+        ReferenceData. temperatures is None if station is None or the
+        AirVision query failed; database errors are raised.
+    """
+    mdl_periods, canister_periods, temperatures = await asyncio.gather(
+        get_mdl_periods_async(database, site_id, start_date, end_date, output_unit),
+        get_canister_periods_by_type_async(database, site_id, start_date, end_date, output_unit),
+        _station_temperatures(start_date, end_date, station, connect, cache_path) if station else asyncio.sleep(0),
+    )
+    return ReferenceData(mdl_periods, canister_periods, temperatures)
+
+
+def load_reference_data(*args, **kwargs) -> ReferenceData:
+    """Blocking :func:`gather_reference_data`, usable with or without a running loop.
+
+    Inside Jupyter (where an event loop is already running in this thread)
+    the gather runs on a private loop in a helper thread.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(gather_reference_data(*args, **kwargs))
+
+    result: list = []
+
+    def run() -> None:
+        try:
+            result.append(asyncio.run(gather_reference_data(*args, **kwargs)))
+        except BaseException as e:
+            result.append(e)
+
+    worker = threading.Thread(target=run, name="load_reference_data")
+    worker.start()
+    worker.join()
+    if isinstance(result[0], BaseException):
+        raise result[0]
+    return result[0]
@@ -4,6 +4,7 @@ Created on Fri Feb 27 11:20:01 2026
 
 @author: aengstrom
 """
-from .station_temp import query_av_rtemp
+from .station_temp import connect_airvision, query_av_rtemp, query_av_rtemp_many
+from .cache import get_station_temperatures
 
-__all__ = ["query_av_rtemp"]
+__all__ = ["connect_airvision", "query_av_rtemp", "query_av_rtemp_many", "get_station_temperatures"]
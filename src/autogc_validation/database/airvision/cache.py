@@ -0,0 +1,185 @@
+# -*- coding: utf-8 -*-
+"""
+Local cache of AirVision minute station temperatures.
+
+Readings are stored in a small SQLite file keyed by AirVision site and
+month. A month fetched after it ended (plus :data:`FINAL_AFTER`) is
+complete and is never fetched again; the current month is refetched on
+each request. Missing months for several sites are fetched with one
+batched query per month over a single connection.
+"""
+
+import logging
+from pathlib import Path
+from typing import Dict, Optional, Sequence, Union
+
+import pandas as pd
+
+from autogc_validation.database.conn import connection, transaction
+from .station_temp import Connector, _validate_range, airvision_site, connect_airvision, fetch_rtemp
+
+logger = logging.getLogger(__name__)
+
+# Project root is 4 levels up: airvision/ -> database/ -> autogc_validation/ -> src/
+DEFAULT_CACHE_PATH = str(Path(__file__).parents[4] / "data" / "airvision_cache.db")
+
+#: How long after a month ends its readings are treated as final.
+FINAL_AFTER = pd.Timedelta(days=1)
+
+_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS rtemp (
+        site TEXT NOT NULL,
+        date_time TEXT NOT NULL,
+        temperature REAL,
+        PRIMARY KEY (site, date_time)
+    ) WITHOUT ROWID
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS rtemp_months (
+        site TEXT NOT NULL,
+        month TEXT NOT NULL,
+        fetched_on TEXT NOT NULL,
+        complete INTEGER NOT NULL,
+        PRIMARY KEY (site, month)
+    ) WITHOUT ROWID
+    """,
+)
+
+
+def _month_bounds(month: pd.Period) -> tuple[str, str]:
+    return (
+        month.start_time.strftime(_DATE_FORMAT),
+        month.end_time.floor("s").strftime(_DATE_FORMAT),
+    )
+
+
+def _complete_months(cache_path: str, sites: Sequence[str], months: pd.PeriodIndex) -> set[tuple[str, str]]:
+    """(site, 'YYYY-MM') pairs already cached in full."""
+    with transaction(cache_path) as conn:
+        for sql in _SCHEMA:
+            conn.execute(sql)
+    with connection(cache_path) as conn:
+        rows = conn.execute(
+            f"""
+            SELECT site, month FROM rtemp_months
+            WHERE complete = 1
+            AND site IN ({", ".join("?" for _ in sites)})
+            AND month BETWEEN ? AND ?
+            """,
+            (*sites, str(months[0]), str(months[-1])),
+        ).fetchall()
+    return {(row[0], row[1]) for row in rows}
+
+
+def _store_month(cache_path: str, month: pd.Period, sites: Sequence[str], df: pd.DataFrame) -> None:
+    """Replace the cached readings for *sites* in *month* with *df*."""
+    first, last = _month_bounds(month)
+    now = pd.Timestamp.now()
+    complete = int(now >= month.end_time + FINAL_AFTER)
+    rows = list(zip(
+        df["Site"],
+        pd.to_datetime(df["Date"]).dt.strftime(_DATE_FORMAT),
+        df["Temperature"].astype(float).tolist(),  # NaN is stored as NULL
+    ))
+    with transaction(cache_path) as conn:
+        conn.executemany(
+            "DELETE FROM rtemp WHERE site = ? AND date_time BETWEEN ? AND ?",
+            [(site, first, last) for site in sites],
+        )
+        conn.executemany("INSERT OR REPLACE INTO rtemp VALUES (?, ?, ?)", rows)
+        conn.executemany(
+            "INSERT OR REPLACE INTO rtemp_months VALUES (?, ?, ?, ?)",
+            [(site, str(month), now.strftime(_DATE_FORMAT), complete) for site in sites],
+        )
+
+
+def get_station_temperatures(
+    start_date: pd.Timestamp,
+    end_date: pd.Timestamp,
+    sites: Sequence[str],
+    connect: Optional[Connector] = None,
+    cache_path: Optional[Union[str, Path]] = None,
+    refresh: bool = False,
+) -> Dict[str, pd.Series]:
+    """Minute station temperatures for several sites, read through the local cache.
+
+    Only site-months not already cached in full are fetched from AirVision.
+
+    Args:
+        start_date: Start of the range (inclusive).
+        end_date: End of the range (inclusive).
+        sites: AQS 2-letter site codes (e.g. ['EQ', 'HW']).
+        connect: Zero-argument callable returning a DB-API connection;
+            defaults to connect_airvision.
+        cache_path: Cache database file; DEFAULT_CACHE_PATH if None.
+        refresh: Refetch every month in the range even if cached.
+
+    Returns:
+        Dict mapping each requested site code to its temperature Series,
+        indexed by reading time.
+
+    Raises:
+        TypeError: If the dates are not pandas Timestamps.
+        ValueError: If start_date is not before end_date.
+    """
+    _validate_range(start_date, end_date)
+    cache_path = str(cache_path or DEFAULT_CACHE_PATH)
+    Path(cache_path).parent.mkdir(parents=True, exist_ok=True)
+
+    av_sites = {site: airvision_site(site) for site in sites}
+    unique_sites = sorted(set(av_sites.values()))
+    months = pd.period_range(start_date.to_period("M"), end_date.to_period("M"), freq="M")
+
+    cached = set() if refresh else _complete_months(cache_path, unique_sites, months)
+    missing = {
+        month: [site for site in unique_sites if (site, str(month)) not in cached]
+        for month in months
+    }
+    missing = {month: fetch_sites for month, fetch_sites in missing.items() if fetch_sites}
+
+    if missing:
+        cnxn = (connect or connect_airvision)()
+        try:
+            for month, fetch_sites in missing.items():
+                first, last = month.start_time, month.end_time.floor("s")
+                df = fetch_rtemp(cnxn, first, last, fetch_sites)
+                _store_month(cache_path, month, fetch_sites, df)
+                logger.info(
+                    "Cached %d AirVision temperature readings for %s in %s",
+                    len(df), ", ".join(fetch_sites), month,
+                )
+        finally:
+            cnxn.close()
+    else:
+        logger.debug("AirVision temperatures served from cache: %s", cache_path)
+
+    with connection(cache_path) as conn:
+        df = pd.read_sql_query(
+            f"""
+            SELECT site, date_time, temperature FROM rtemp
+            WHERE site IN ({", ".join("?" for _ in unique_sites)})
+            AND date_time BETWEEN ? AND ?
+            ORDER BY site, date_time
+            """,
+            conn,
+            params=[
+                *unique_sites,
+                start_date.strftime(_DATE_FORMAT),
+                end_date.strftime(_DATE_FORMAT),
+            ],
+        )
+    df["date_time"] = pd.to_datetime(df["date_time"], format=_DATE_FORMAT)
+
+    by_site = {
+        site: pd.Series(
+            group["temperature"].to_numpy(dtype=float),
+            index=pd.DatetimeIndex(group["date_time"], name="Date"),
+            name="Temperature",
+        )
+        for site, group in df.groupby("site")
+    }
+    empty = pd.Series(dtype=float, index=pd.DatetimeIndex([], name="Date"), name="Temperature")
+    return {site: by_site.get(av, empty) for site, av in av_sites.items()}
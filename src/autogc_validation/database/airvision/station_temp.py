@@ -4,56 +4,171 @@ Created on Fri Feb 27 11:19:47 2026
 
 @author: aengstrom
 """
+import logging
+from typing import Callable, Dict, Optional, Sequence
+
 import pandas as pd
 
+logger = logging.getLogger(__name__)
+
+AIRVISION_SERVER = "168.178.3.149"
+AIRVISION_DATABASE = "AVData"
+
+#: Zero-argument callable returning a DB-API connection to AirVision.
+Connector = Callable[[], object]
+
+# AQS 2-letter site codes that AirVision abbreviates differently.
+_SITE_ALIASES = {"EQ": "UT"}
+
+# Two-part name: the connection already selects the AVData database, and a
+# local SQLite stand-in can provide the table as an attached "Reporting" schema.
+_RTEMP_QUERY = """SELECT
+    SiteAbbreviation as Site,
+    Date,
+    FinalValue as Temperature
+    FROM Reporting.ReadingAverageDataFull
+    WHERE SiteAbbreviation IN ({placeholders})
+    AND Date >= ?
+    AND Date <= ?
+    AND [IntervalName] = '001m'
+    AND ParameterName = 'RTEMP'
+    AND ParameterEnabled = 1
+    ORDER BY SiteAbbreviation, Date"""
 
-def query_av_rtemp(start_date: pd.Timestamp, end_date: pd.Timestamp, site: str) -> pd.Series:
+# Driver that last connected successfully; tried first next time.
+_preferred_driver: Optional[str] = None
+
+
+def connect_airvision():
+    """Open a connection to the AirVision SQL Server database.
+
+    Tries the driver that last connected successfully first, then each
+    other installed SQL Server ODBC driver in turn.
+
+    Raises:
+        RuntimeError: If no driver is installed or none can connect.
+    """
+    global _preferred_driver
     import pyodbc
-    # Convert AQS 2-letter code to Airvision 2-letter code for site EQ
-    if site == 'EQ':
-        site = 'UT'
-    # Validate inputs
-    if not all(isinstance(d, pd.Timestamp) for d in [start_date, end_date]):
-        raise TypeError("start_date and end_date must be pandas Timestamps")
-    if start_date >= end_date:
-        raise ValueError("start_date must be earlier than end_date")
 
-    #Convert datetime to explicitly match SQL DATETIME
-    start_date_str = start_date.strftime('%Y-%m-%d %H:%M:%S')
-    end_date_str = end_date.strftime('%Y-%m-%d %H:%M:%S')
-    
     sql_drivers = [d for d in pyodbc.drivers() if "SQL Server" in d]
     if not sql_drivers:
         raise RuntimeError("No SQL Server ODBC driver found on this machine.")
-
-    query = f"""SELECT
-        Date,
-        FinalValue as Temperature
-        FROM AVData.Reporting.ReadingAverageDataFull
-        WHERE SiteAbbreviation = '{site}'
-        AND Date >= '{start_date_str}'
-        AND Date <= '{end_date_str}'
-        AND [IntervalName] = '001m'
-        AND ParameterName = 'RTEMP'
-        AND ParameterEnabled = 1
-        ORDER BY Date"""
+    if _preferred_driver in sql_drivers:
+        sql_drivers.remove(_preferred_driver)
+        sql_drivers.insert(0, _preferred_driver)
 
     last_error = None
     for driver in sql_drivers:
         try:
-            with pyodbc.connect(
+            cnxn = pyodbc.connect(
                 f'DRIVER={{{driver}}};'
-                'SERVER=168.178.3.149;'
-                'DATABASE=AVData;'
+                f'SERVER={AIRVISION_SERVER};'
+                f'DATABASE={AIRVISION_DATABASE};'
                 'timeout=10;ENCRYPT=yes;Trusted_Connection=yes;TrustServerCertificate=yes;'
-            ) as cnxn:
-                df = pd.read_sql_query(query, cnxn, parse_dates=['Date']).set_index('Date')
-            print(f"Connected using driver: {driver}")
-            return df['Temperature']
+            )
+            logger.info("Connected to AirVision using driver: %s", driver)
+            _preferred_driver = driver
+            return cnxn
         except pyodbc.Error as e:
-            print(f"Driver '{driver}' failed: {e}")
+            logger.warning("Driver '%s' failed: %s", driver, e)
             last_error = e
 
     raise RuntimeError(
         f"All SQL Server drivers failed to connect. Last error: {last_error}"
     )
+
+
+def airvision_site(site: str) -> str:
+    """Return AirVision's abbreviation for an AQS 2-letter site code."""
+    return _SITE_ALIASES.get(site, site)
+
+
+def _validate_range(start_date: pd.Timestamp, end_date: pd.Timestamp) -> None:
+    if not all(isinstance(d, pd.Timestamp) for d in [start_date, end_date]):
+        raise TypeError("start_date and end_date must be pandas Timestamps")
+    if start_date >= end_date:
+        raise ValueError("start_date must be earlier than end_date")
+
+
+def fetch_rtemp(cnxn, start_date: pd.Timestamp, end_date: pd.Timestamp, sites: Sequence[str]) -> pd.DataFrame:
+    """Run the RTEMP query for several AirVision sites on an open connection.
+
+    Args:
+        cnxn: Open DB-API connection (AirVision or a stand-in).
+        start_date: Start of the range (inclusive).
+        end_date: End of the range (inclusive).
+        sites: AirVision site abbreviations (already aliased).
+
+    Returns:
+        DataFrame with columns Site, Date (datetime64) and Temperature.
+    """
+    query = _RTEMP_QUERY.format(placeholders=", ".join("?" for _ in sites))
+    #Convert datetime to explicitly match SQL DATETIME
+    params = [
+        *sites,
+        start_date.strftime('%Y-%m-%d %H:%M:%S'),
+        end_date.strftime('%Y-%m-%d %H:%M:%S'),
+    ]
+    return pd.read_sql_query(query, cnxn, params=params, parse_dates=['Date'])
+
+
+def query_av_rtemp_many(
+    start_date: pd.Timestamp,
+    end_date: pd.Timestamp,
+    sites: Sequence[str],
+    connect: Optional[Connector] = None,
+) -> Dict[str, pd.Series]:
+    """Query minute station room temperatures for several sites in one round trip.
+
+    Args:
+        start_date: Start of the range (inclusive).
+        end_date: End of the range (inclusive).
+        sites: AQS 2-letter site codes (e.g. ['EQ', 'HW']).
+        connect: Zero-argument callable returning a DB-API connection;
+            defaults to connect_airvision. Tests pass a local SQLite stand-in.
+
+    Returns:
+        Dict mapping each requested site code to its temperature Series,
+        indexed by reading time (empty if AirVision has no readings).
+
+    Raises:
+        TypeError: If the dates are not pandas Timestamps.
+        ValueError: If start_date is not before end_date.
+    """
+    _validate_range(start_date, end_date)
+    av_sites = {site: airvision_site(site) for site in sites}
+
+    cnxn = (connect or connect_airvision)()
+    try:
+        df = fetch_rtemp(cnxn, start_date, end_date, sorted(set(av_sites.values())))
+    finally:
+        cnxn.close()
+
+    by_site = {av: group.set_index('Date')['Temperature'] for av, group in df.groupby('Site')}
+    empty = pd.Series(dtype=float, index=pd.DatetimeIndex([], name='Date'), name='Temperature')
+    return {site: by_site.get(av, empty) for site, av in av_sites.items()}
+
+
+def query_av_rtemp(
+    start_date: pd.Timestamp,
+    end_date: pd.Timestamp,
+    site: str,
+    connect: Optional[Connector] = None,
+) -> pd.Series:
+    """Query minute station room temperatures for one site from AirVision.
+
+    Args:
+        start_date: Start of the range (inclusive).
+        end_date: End of the range (inclusive).
+        site: AQS 2-letter site code (e.g. 'EQ').
+        connect: Connection factory, as for query_av_rtemp_many.
+
+    Returns:
+        Temperature Series indexed by reading time.
+
+    Raises:
+        TypeError: If the dates are not pandas Timestamps.
+        ValueError: If start_date is not before end_date.
+    """
+    return query_av_rtemp_many(start_date, end_date, [site], connect=connect)[site]
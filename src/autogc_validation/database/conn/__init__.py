@@ -5,6 +5,19 @@ Created on Fri Jan 23 13:52:18 2026
 @author: aengstrom
 """
 from .connection import connection, transaction
+from .session import DatabaseLike, Session, read_only_uri, snapshot
+from .cache import (
+    reference_cache,
+    invalidate_reference_cache,
+    set_reference_cache_enabled,
+)
 
 __all__ = ["connection",
-           "transaction"]
+           "transaction",
+           "reference_cache",
+           "invalidate_reference_cache",
+           "set_reference_cache_enabled",
+           "DatabaseLike",
+           "Session",
+           "read_only_uri",
+           "snapshot"]
@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+"""
+Read-through cache for reference-data queries.
+
+MDLs, canister concentrations and VOC info change a few times a year but
+are queried on every run. Functions decorated with :func:`reference_cache`
+keep their results in memory, keyed by database file and call arguments.
+
+An entry is dropped when:
+
+* any :func:`~autogc_validation.database.conn.transaction` on the same
+  database commits (this covers insert, insert_many, delete, retire_mdl
+  and retire_site_canister), or
+* the database file or its WAL file changes on disk, e.g. when another
+  process writes to it.
+
+Callers receive copies, so mutating a returned DataFrame never changes
+the cached value.
+"""
+
+import copy
+import functools
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Callable, Optional
+
+import pandas as pd
+
+from .session import DatabaseLike, Session
+
+logger = logging.getLogger(__name__)
+
+_MAX_ENTRIES = 256
+
+_lock = threading.Lock()
+_entries: "OrderedDict[tuple, tuple[tuple, object]]" = OrderedDict()
+_generations: dict[str, int] = {}
+_enabled = True
+
+
+def _database_key(database: DatabaseLike) -> Optional[str]:
+    """Absolute path identifying *database*, or None if it cannot be cached."""
+    path = database.database if isinstance(database, Session) else os.fspath(database)
+    if path == ":memory:" or path.startswith("file:"):
+        return None
+    return os.path.abspath(path)
+
+
+def _file_stamp(path: str) -> tuple:
+    """(mtime_ns, size) of the database file and its WAL, for change detection."""
+    stamp = []
+    for p in (path, path + "-wal"):
+        try:
+            st = os.stat(p)
+            stamp.append((st.st_mtime_ns, st.st_size))
+        except FileNotFoundError:
+            stamp.append(None)
+    return tuple(stamp)
+
+
+def _freeze(value):
+    if isinstance(value, (list, tuple, set, frozenset)):
+        items = sorted(value, key=repr) if isinstance(value, (set, frozenset)) else value
+        return tuple(_freeze(v) for v in items)
+    return value
+
+
+def _copy(value):
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        return value.copy()
+    if isinstance(value, dict):
+        return {k: _copy(v) for k, v in value.items()}
+    return copy.deepcopy(value)
+
+
+def invalidate_reference_cache(database: Optional[DatabaseLike] = None) -> None:
+    """Drop cached reference data for *database*, or for every database.
+
+    Args:
+        database: Path or Session whose entries to drop. None clears all.
+    """
+    with _lock:
+        if database is None:
+            _entries.clear()
+            _generations.clear()
+            return
+        key = _database_key(database)
+        if key is None:
+            return
+        _generations[key] = _generations.get(key, 0) + 1
+        for entry_key in [k for k in _entries if k[0] == key]:
+            del _entries[entry_key]
+
+
+def set_reference_cache_enabled(enabled: bool) -> None:
+    """Turn the reference cache on or off (clearing it either way)."""
+    global _enabled
+    invalidate_reference_cache()
+    _enabled = enabled
+
+
+def reference_cache(func: Callable) -> Callable:
+    """Cache *func*'s result per (database, arguments).
+
+    *func* must take the database (path or Session) as its first argument
+    and otherwise depend only on its arguments and the database contents.
+    """
+    @functools.wraps(func)
+    def wrapper(database, *args, **kwargs):
+        db_key = _database_key(database) if _enabled else None
+        if db_key is None:
+            return func(database, *args, **kwargs)
+        try:
+            key = (db_key, func.__qualname__, _freeze(args), _freeze(tuple(sorted(kwargs.items()))))
+            hash(key)
+        except TypeError:
+            return func(database, *args, **kwargs)
+
+        with _lock:
+            generation = _generations.get(db_key, 0)
+        stamp = (generation, _file_stamp(db_key))
+        with _lock:
+            hit = _entries.get(key)
+            if hit is not None and hit[0] == stamp:
+                _entries.move_to_end(key)
+                logger.debug("Reference cache hit: %s%r", func.__qualname__, args)
+                return _copy(hit[1])
+
+        result = func(database, *args, **kwargs)
+        with _lock:
+            # Only store if nothing committed while we were querying.
+            if _generations.get(db_key, 0) == generation:
+                _entries[key] = (stamp, _copy(result))
+                _entries.move_to_end(key)
+                while len(_entries) > _MAX_ENTRIES:
+                    _entries.popitem(last=False)
+        return result
+
+    return wrapper
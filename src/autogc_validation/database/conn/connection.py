@@ -7,17 +7,37 @@ Created on Fri Jan 23 13:53:01 2026
 import sqlite3
 from contextlib import contextmanager
 import logging
+
+from .cache import invalidate_reference_cache
+from .session import DatabaseLike, Session
+
 logger = logging.getLogger(__name__)
 
-def get_connection(database: str):
-    """Internal helper to create configured connection."""
+def get_connection(database: str, wal: bool = False):
+    """Internal helper to create configured connection.
+
+    With *wal*, file databases are switched to WAL, which persists in the
+    file, so readers (including read-only Sessions) never block on a
+    writer. Only writers ask for it: setting the journal mode is itself a
+    write, which fails on a read-only file.
+    """
     conn = sqlite3.connect(database)
     conn.row_factory = sqlite3.Row
     conn.execute("PRAGMA foreign_keys = ON")
+    if wal and str(database) != ":memory:":
+        conn.execute("PRAGMA journal_mode = WAL")
     return conn
 
 @contextmanager
-def connection(database: str):
+def connection(database: DatabaseLike):
+    """Yield a connection to *database*.
+
+    A path opens a new connection that is closed on exit. A Session yields
+    the calling thread's pooled connection and leaves it open.
+    """
+    if isinstance(database, Session):
+        yield database.connect()
+        return
     logger.debug("Opening database connection: %s", database)
     conn = get_connection(database)
     try:
@@ -30,12 +50,29 @@ def connection(database: str):
         logger.debug("Closed database connection: %s", database)
 
 @contextmanager
-def transaction(database: str):
+def transaction(database: DatabaseLike):
+    """Yield a connection and commit on success, roll back on error.
+
+    Accepts a path or a Session, as :func:`connection` does. A commit
+    invalidates cached reference data for the database.
+    """
+    if isinstance(database, Session):
+        conn = database.connect()
+        try:
+            yield conn
+            conn.commit()
+            invalidate_reference_cache(database)
+        except Exception:
+            conn.rollback()
+            logger.warning("Transaction rolled back: %s", database)
+            raise
+        return
     logger.debug("Starting transaction: %s", database)
-    conn = get_connection(database)
+    conn = get_connection(database, wal=True)
     try:
         yield conn
         conn.commit()
+        invalidate_reference_cache(database)
         logger.debug("Transaction committed: %s", database)
     except Exception:
         conn.rollback()
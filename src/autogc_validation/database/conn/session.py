@@ -0,0 +1,216 @@
+# -*- coding: utf-8 -*-
+"""
+Reusable SQLite connections for one database.
+
+A :class:`Session` keeps one open connection per thread and hands it to
+:func:`connection` / :func:`transaction` instead of opening a new one per
+call. Every ``database.operations`` function accepts a Session wherever it
+accepts a database path::
+
+    with Session("autogc.db") as db:
+        mdls = get_mdl_periods(db, site_id, start, end, ConcentrationUnit.PPBC)
+        canisters = get_canister_periods_by_type(db, site_id, start, end, ConcentrationUnit.PPBC)
+
+Analysts reading a database that month-end runs are writing to should use
+``Session(path, read_only=True)``: connections are opened with
+``mode=ro`` and ``query_only``, so a notebook can never take a write lock
+or modify the shared file. :func:`snapshot` goes further and reads from a
+private, immutable copy.
+"""
+
+import logging
+import os
+import sqlite3
+import tempfile
+import threading
+from pathlib import Path
+from typing import Optional, Union
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MMAP_SIZE = 256 * 1024 * 1024
+DEFAULT_CACHED_STATEMENTS = 256
+
+
+class Session:
+    """Thread-local pool of configured SQLite connections for one database.
+
+    Each thread that uses the session gets its own connection, opened on
+    first use with foreign keys enabled and the performance pragmas below.
+    The connections stay open until :meth:`close` (or the end of a
+    ``with`` block).
+
+    Args:
+        database: Path to the SQLite database file.
+        journal_mode: SQLite journal mode. WAL lets readers proceed while
+            a writer commits. Ignored for in-memory databases.
+        synchronous: SQLite synchronous level; NORMAL is safe with WAL.
+        mmap_size: Bytes of the database file to memory-map for reads.
+        cached_statements: Size of each connection's prepared statement cache.
+        read_only: Open connections with ``mode=ro``; any write raises
+            sqlite3.OperationalError. The journal mode is left unchanged.
+        immutable: With read_only, also pass ``immutable=1`` so SQLite skips
+            locking and change detection entirely. Only safe for files that
+            nothing writes to (such as a :func:`snapshot`); a WAL database
+            opened this way does not see un-checkpointed commits.
+    """
+
+    def __init__(
+        self,
+        database: Union[str, os.PathLike],
+        journal_mode: str = "WAL",
+        synchronous: str = "NORMAL",
+        mmap_size: int = DEFAULT_MMAP_SIZE,
+        cached_statements: int = DEFAULT_CACHED_STATEMENTS,
+        read_only: bool = False,
+        immutable: bool = False,
+    ):
+        if immutable and not read_only:
+            raise ValueError("immutable=True requires read_only=True")
+        self.database = os.fspath(database)
+        self.journal_mode = journal_mode
+        self.synchronous = synchronous
+        self.mmap_size = mmap_size
+        self.cached_statements = cached_statements
+        self.read_only = read_only
+        self.immutable = immutable
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._connections: list[sqlite3.Connection] = []
+        self._closed = False
+
+    def __repr__(self) -> str:
+        mode = ", read_only=True" if self.read_only else ""
+        return f"{type(self).__name__}({self.database!r}{mode})"
+
+    def __enter__(self) -> "Session":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _open(self) -> sqlite3.Connection:
+        # check_same_thread=False only so close() can close every thread's
+        # connection; each connection is still used by a single thread.
+        if self.read_only:
+            conn = sqlite3.connect(
+                read_only_uri(self.database, immutable=self.immutable),
+                uri=True,
+                cached_statements=self.cached_statements,
+                check_same_thread=False,
+            )
+            conn.execute("PRAGMA query_only = ON")
+        else:
+            conn = sqlite3.connect(
+                self.database,
+                cached_statements=self.cached_statements,
+                check_same_thread=False,
+            )
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA foreign_keys = ON")
+        if self.database != ":memory:" and not self.read_only:
+            conn.execute(f"PRAGMA journal_mode = {self.journal_mode}")
+        conn.execute(f"PRAGMA synchronous = {self.synchronous}")
+        conn.execute(f"PRAGMA mmap_size = {int(self.mmap_size)}")
+        logger.debug("Opened session connection: %s", self.database)
+        return conn
+
+    def connect(self) -> sqlite3.Connection:
+        """Return this thread's connection, opening it on first use.
+
+        Raises:
+            sqlite3.ProgrammingError: If the session has been closed.
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            with self._lock:
+                if self._closed:
+                    raise sqlite3.ProgrammingError(f"{self!r} is closed")
+                conn = self._open()
+                self._connections.append(conn)
+            self._local.conn = conn
+        return conn
+
+    def close(self) -> None:
+        """Close every connection opened by this session."""
+        with self._lock:
+            self._closed = True
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            conn.close()
+        self._local = threading.local()
+        logger.debug("Closed %d session connection(s): %s", len(connections), self.database)
+
+
+class _SnapshotSession(Session):
+    """Read-only session over a private copy that is deleted on close."""
+
+    def close(self) -> None:
+        super().close()
+        Path(self.database).unlink(missing_ok=True)
+        logger.debug("Removed database snapshot: %s", self.database)
+
+
+def read_only_uri(database: Union[str, os.PathLike], immutable: bool = False) -> str:
+    """Return a ``file:`` URI that opens *database* read-only.
+
+    Args:
+        database: Path to the SQLite database file.
+        immutable: Add ``immutable=1`` (no locking; see :class:`Session`).
+    """
+    uri = f"{Path(database).resolve().as_uri()}?mode=ro"
+    if immutable:
+        uri += "&immutable=1"
+    return uri
+
+
+def snapshot(
+    database: Union[str, os.PathLike],
+    directory: Optional[Union[str, os.PathLike]] = None,
+) -> Session:
+    """Copy *database* and return an immutable read-only Session on the copy.
+
+    The copy is made with SQLite's online backup API, so it is a consistent
+    point-in-time image even while another process is writing. Reads from
+    the returned session never touch the shared file or its locks. The copy
+    is deleted when the session is closed.
+
+    Args:
+        database: Path to the SQLite database file.
+        directory: Where to put the copy; the system temp directory if None.
+
+    Returns:
+        A read-only Session over the copy; use it as a context manager.
+
+    Raises:
+        FileNotFoundError: If the database does not exist.
+    """
+    source_path = Path(database)
+    if not source_path.exists():
+        raise FileNotFoundError(f"Database not found: {source_path}")
+
+    fd, copy_path = tempfile.mkstemp(
+        prefix=f"{source_path.stem}-snapshot-", suffix=".db", dir=directory
+    )
+    os.close(fd)
+    source = sqlite3.connect(read_only_uri(source_path), uri=True)
+    target = sqlite3.connect(copy_path)
+    try:
+        source.backup(target)
+        # Readers of an immutable file ignore WAL, so store the copy in
+        # rollback-journal mode with everything in the main file.
+        target.execute("PRAGMA journal_mode = DELETE")
+    except BaseException:
+        target.close()
+        Path(copy_path).unlink(missing_ok=True)
+        raise
+    finally:
+        source.close()
+    target.close()
+
+    logger.info("Snapshot of %s taken at %s", source_path, copy_path)
+    return _SnapshotSession(copy_path, read_only=True, immutable=True)
+
+
+#: Anything the connection helpers and database operations accept.
+DatabaseLike = Union[str, os.PathLike, Session]
@@ -41,10 +41,14 @@ TARGET_CODES = frozenset(code for code in CompoundAQSCode if code not in TOTAL_C
 # ---------------------------------------------------------------------------
 # Importing here is safe — config.py has no dependencies on this package.
 from autogc_validation.database.config import VOC_DATA as _VOC_DATA
+from .compound_registry import CompoundRegistry
+
+# Array-backed metadata for every target compound, built once at import.
+COMPOUND_REGISTRY = CompoundRegistry(_VOC_DATA)
 
 # AQS codes for compounds that elute on each GC column.
-PLOT_CODES = frozenset(v["aqs_code"] for v in _VOC_DATA if v["column"] == "PLOT")
-BP_CODES = frozenset(v["aqs_code"] for v in _VOC_DATA if v["column"] == "BP")
+PLOT_CODES = frozenset(COMPOUND_REGISTRY.codes_by_column(ColumnType.PLOT))
+BP_CODES = frozenset(COMPOUND_REGISTRY.codes_by_column(ColumnType.BP))
 
 # Calibrant compound for each GC column.  Used by QC qualifier generation to
 # determine whether a whole-column LL/LK qualifier applies.
@@ -68,9 +72,24 @@ RT_REFERENCE_CODES: frozenset[int] = frozenset({
 # Lookup helpers
 # ---------------------------------------------------------------------------
 
+# Name <-> code maps, built once from the enums instead of constructing two
+# enum members per lookup.
+_AQS_TO_NAME: dict[int, str] = {
+    code.value: CompoundName[code.name].value
+    for code in CompoundAQSCode if code.name in CompoundName.__members__
+}
+_NAME_TO_AQS: dict[str, int] = {
+    name.value: CompoundAQSCode[name.name].value
+    for name in CompoundName if name.name in CompoundAQSCode.__members__
+}
+
+
 def aqs_to_name(code: int) -> str:
     """Convert an AQS code integer to a compound name string."""
-    return CompoundName[CompoundAQSCode(code).name].value
+    try:
+        return _AQS_TO_NAME[code]
+    except (KeyError, TypeError):
+        raise ValueError(f"{code!r} is not a valid CompoundAQSCode") from None
 
 
 def name_to_aqs(name: str) -> int:
@@ -80,7 +99,10 @@ def name_to_aqs(name: str) -> int:
     so that e.g. ``"propane"`` and ``"Propane"`` both resolve correctly.
     """
     name = name.capitalize()
-    return CompoundAQSCode[CompoundName(name).name].value
+    try:
+        return _NAME_TO_AQS[name]
+    except KeyError:
+        raise ValueError(f"{name!r} is not a valid CompoundName") from None
 
 
 def get_column_type(code: int) -> ColumnType:
@@ -113,7 +135,7 @@ def get_codes_by_category(category: VOCCategory) -> list[int]:
     Returns:
         List of AQS code integers in elution order.
     """
-    return [v["aqs_code"] for v in _VOC_DATA if v["category"] == category.value]
+    return list(COMPOUND_REGISTRY.codes_by_category(category))
 
 
 def get_codes_by_column(column: ColumnType) -> list[int]:
@@ -127,7 +149,7 @@ def get_codes_by_column(column: ColumnType) -> list[int]:
     Returns:
         List of AQS code integers in elution order.
     """
-    return [v["aqs_code"] for v in _VOC_DATA if v["column"] == column.value]
+    return list(COMPOUND_REGISTRY.codes_by_column(column))
 
 
 def get_carbon_count(code: int) -> int:
@@ -142,10 +164,7 @@ def get_carbon_count(code: int) -> int:
     Raises:
         ValueError: If the code is not a known target compound.
     """
-    for v in _VOC_DATA:
-        if v["aqs_code"] == code:
-            return v["carbon_count"]
-    raise ValueError(f"AQS code {code} is not a known target compound")
+    return int(COMPOUND_REGISTRY.carbon_count[COMPOUND_REGISTRY.index(code)])
 
 
 __all__ = [
@@ -167,6 +186,8 @@ __all__ = [
     "BP_CODES",
     "COLUMN_CALIBRANTS",
     "RT_REFERENCE_CODES",
+    "CompoundRegistry",
+    "COMPOUND_REGISTRY",
     "aqs_to_name",
     "name_to_aqs",
     "get_column_type",
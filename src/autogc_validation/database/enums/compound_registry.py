@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+"""
+Array-backed compound metadata registry.
+
+Built once from VOC_DATA at import time. Each compound occupies one row
+index; per-compound metadata is stored in parallel NumPy arrays so that
+scalar lookups are a dict hit and vectorized lookups are a single fancy
+index into a dense code -> row table.
+"""
+
+from typing import Iterable, Sequence
+
+import numpy as np
+
+from .column_type import ColumnType
+from .voc_category import VOCCategory
+
+
+class CompoundRegistry:
+    """Frozen, array-backed view of the target compound metadata.
+
+    Rows are in VOC_DATA order (PLOT then BP, each in elution order).
+
+    Attributes:
+        codes: AQS codes, int64 array.
+        names: Compound names, tuple of str.
+        carbon_count: Carbon atoms per molecule, int64 array.
+        molecular_weight: Molecular weight (g/mol), float64 array.
+        column: GC column per compound, object array of ColumnType.
+        category: VOC category per compound, object array of VOCCategory.
+        elution_order: Elution order within the compound's column, int64 array.
+        priority: Priority flag (1 = priority compound), int64 array.
+    """
+
+    __slots__ = (
+        "codes", "names", "carbon_count", "molecular_weight", "column",
+        "category", "elution_order", "priority",
+        "_index", "_lookup", "_by_column", "_by_category",
+    )
+
+    def __init__(self, voc_data: Sequence[dict]):
+        def frozen(values, dtype):
+            arr = np.array(values, dtype=dtype)
+            arr.flags.writeable = False
+            return arr
+
+        codes = [int(v["aqs_code"]) for v in voc_data]
+        if len(set(codes)) != len(codes):
+            raise ValueError("VOC_DATA contains duplicate AQS codes")
+
+        setattr_ = object.__setattr__
+        setattr_(self, "codes", frozen(codes, np.int64))
+        setattr_(self, "names", tuple(v["compound"] for v in voc_data))
+        setattr_(self, "carbon_count", frozen([v["carbon_count"] for v in voc_data], np.int64))
+        setattr_(self, "molecular_weight", frozen([v["molecular_weight"] for v in voc_data], float))
+        setattr_(self, "column", frozen([ColumnType(v["column"]) for v in voc_data], object))
+        setattr_(self, "category", frozen([VOCCategory(v["category"]) for v in voc_data], object))
+        setattr_(self, "elution_order", frozen([v["elution_order"] for v in voc_data], np.int64))
+        setattr_(self, "priority", frozen([v["priority"] for v in voc_data], np.int64))
+
+        setattr_(self, "_index", {code: i for i, code in enumerate(codes)})
+        lookup = np.full(max(codes, default=0) + 1, -1, dtype=np.intp)
+        lookup[codes] = np.arange(len(codes))
+        lookup.flags.writeable = False
+        setattr_(self, "_lookup", lookup)
+        setattr_(self, "_by_column", {
+            column: tuple(c for c, col in zip(codes, self.column) if col == column)
+            for column in ColumnType
+        })
+        setattr_(self, "_by_category", {
+            category: tuple(c for c, cat in zip(codes, self.category) if cat == category)
+            for category in VOCCategory
+        })
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __contains__(self, code) -> bool:
+        return code in self._index
+
+    def index(self, code: int) -> int:
+        """Return the row index of *code*.
+
+        Raises:
+            ValueError: If the code is not a known target compound.
+        """
+        try:
+            return self._index[code]
+        except (KeyError, TypeError):
+            raise ValueError(f"AQS code {code} is not a known target compound") from None
+
+    def indices(self, codes: Iterable[int], strict: bool = True) -> np.ndarray:
+        """Return row indices for an array of AQS codes.
+
+        Args:
+            codes: Array-like of AQS code integers.
+            strict: If True, raise on unknown codes. If False, unknown codes
+                map to -1.
+
+        Returns:
+            intp ndarray with the same shape as *codes*.
+
+        Raises:
+            ValueError: If *strict* and any code is not a known target compound.
+        """
+        codes = np.asarray(codes, dtype=np.int64)
+        in_range = (codes >= 0) & (codes < len(self._lookup))
+        idx = np.where(in_range, self._lookup[np.where(in_range, codes, 0)], -1)
+        if strict and (idx < 0).any():
+            unknown = sorted({int(c) for c in codes[idx < 0]})
+            raise ValueError(f"AQS code(s) {unknown} are not known target compounds")
+        return idx
+
+    def codes_by_column(self, column: ColumnType) -> tuple[int, ...]:
+        """AQS codes on *column*, in elution order."""
+        return self._by_column[ColumnType(column)]
+
+    def codes_by_category(self, category: VOCCategory) -> tuple[int, ...]:
+        """AQS codes in *category*, in VOC_DATA order."""
+        return self._by_category[VOCCategory(category)]
@@ -7,6 +7,9 @@ Created on Fri Jan 16 15:03:05 2026
 """Database management utilities."""
 
 from .init_db import initialize_database
-from .backup import dump_database, restore_database
+from .backup import dump_database, restore_database, backup_database, restore_backup
+from .migrate import migrate_database, get_applied_versions, SCHEMA_VERSION
 
-__all__ = ['initialize_database', 'dump_database', 'restore_database']
+__all__ = ['initialize_database', 'dump_database', 'restore_database',
+           'backup_database', 'restore_backup',
+           'migrate_database', 'get_applied_versions', 'SCHEMA_VERSION']
@@ -12,6 +12,12 @@ import sys
 import logging
 
 from .init_db import initialize_database
+from .migrate import migrate_database
+from .backup import backup_database, dump_database, restore_backup, restore_database
+
+
+def _log_progress(copied: int, total: int) -> None:
+    logging.info(f"Copied {copied}/{total} pages")
 
 
 def main():
@@ -35,6 +41,54 @@ def main():
         help='Force reinitialization'
     )
 
+    # Migrate command
+    migrate_parser = subparsers.add_parser('migrate', help='Apply pending schema migrations')
+    migrate_parser.add_argument(
+        '--database', '-d',
+        required=True,
+        help='Database path'
+    )
+
+    # Backup command
+    backup_parser = subparsers.add_parser(
+        'backup', help='Back up the database (binary copy, or SQL dump with --sql)'
+    )
+    backup_parser.add_argument(
+        '--database', '-d',
+        required=True,
+        help='Database path'
+    )
+    backup_parser.add_argument(
+        '--output', '-o',
+        required=True,
+        help='Backup file path'
+    )
+    backup_parser.add_argument(
+        '--sql',
+        action='store_true',
+        help='Write a plain-text SQL dump instead of a binary copy'
+    )
+
+    # Restore command
+    restore_parser = subparsers.add_parser(
+        'restore', help='Restore the database from a backup or .sql dump'
+    )
+    restore_parser.add_argument(
+        '--input', '-i',
+        required=True,
+        help='Backup file path (.sql files are restored as SQL dumps)'
+    )
+    restore_parser.add_argument(
+        '--database', '-d',
+        required=True,
+        help='Database path'
+    )
+    restore_parser.add_argument(
+        '--force', '-f',
+        action='store_true',
+        help='Overwrite an existing database'
+    )
+
     # Common arguments
     parser.add_argument(
         '--verbose', '-v',
@@ -55,6 +109,18 @@ def main():
     try:
         if args.command == 'init':
             initialize_database(args.database, force=args.force)
+        elif args.command == 'migrate':
+            migrate_database(args.database)
+        elif args.command == 'backup':
+            if args.sql:
+                dump_database(args.database, args.output)
+            else:
+                backup_database(args.database, args.output, progress=_log_progress)
+        elif args.command == 'restore':
+            if args.input.lower().endswith('.sql'):
+                restore_database(args.input, args.database, force=args.force)
+            else:
+                restore_backup(args.input, args.database, force=args.force, progress=_log_progress)
         else:
             parser.print_help()
             return 1
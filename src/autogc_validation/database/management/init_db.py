@@ -7,10 +7,12 @@ Created on Fri Jan 16 15:03:24 2026
 
 import logging
 from pathlib import Path
+from autogc_validation.database.conn import Session
 from autogc_validation.database.enums import CanisterType
 from autogc_validation.database.models import MODEL_REGISTRY, CanisterTypes
-from autogc_validation.database.operations import create_table, insert
+from autogc_validation.database.operations import create_table, insert_many
 from autogc_validation.database.utils.data_loaders import load_standard_voc_data
+from .migrate import migrate_database
 
 logger = logging.getLogger(__name__)
 
@@ -40,26 +42,29 @@ def initialize_database(database_path: str, force: bool = False) -> None:
     
     logger.info("Initializing database at %s", db_path)
     
-    # Create tables
-    logger.info("Creating tables...")
-    for tablename in MODEL_REGISTRY.keys():
-        create_table(database=str(db_path), tablename=tablename)
-        
-    
-    # Load and insert VOC reference data
-    logger.info("Loading VOC reference data...")
-    voc_data = load_standard_voc_data()
-    logger.info("Loaded %d VOC compounds", len(voc_data))
-    
-    logger.info("Inserting VOC data into database...")
-    inserted = sum(1 for voc in voc_data if insert(str(db_path), voc))
-    logger.info("Inserted %d/%d VOC records", inserted, len(voc_data))
+    # One session for the whole initialization instead of a connection per row
+    with Session(db_path) as db:
+        # Create tables
+        logger.info("Creating tables...")
+        for tablename in MODEL_REGISTRY.keys():
+            create_table(database=db, tablename=tablename)
+
+        # Tables are created at the current schema; record it as migrated
+        migrate_database(db)
+
+        # Load and insert VOC reference data
+        logger.info("Loading VOC reference data...")
+        voc_data = load_standard_voc_data()
+        logger.info("Loaded %d VOC compounds", len(voc_data))
+
+        logger.info("Inserting VOC data into database...")
+        counts = insert_many(db, voc_data)
+        logger.info("Inserted %d/%d VOC records", counts.inserted, len(voc_data))
 
-    # Seed canister types
-    logger.info("Inserting canister types...")
-    for ct in CanisterType:
-        insert(str(db_path), CanisterTypes(canister_type=ct))
-    logger.info("Inserted %d canister types", len(CanisterType))
+        # Seed canister types
+        logger.info("Inserting canister types...")
+        insert_many(db, [CanisterTypes(canister_type=ct) for ct in CanisterType])
+        logger.info("Inserted %d canister types", len(CanisterType))
 
     logger.info("Database initialization complete!")
 
@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+"""
+Schema migrations for existing databases.
+
+Each migration is applied once, in order, and recorded in the SchemaVersion
+table (the Version model) in the same transaction as its schema change.
+New databases created by initialize_database already have the current
+schema, so migrating them only records the versions.
+"""
+
+import logging
+from datetime import datetime
+from typing import Callable
+
+from autogc_validation.database.conn import DatabaseLike, connection, transaction
+from autogc_validation.database.models import (
+    MDL,
+    CanisterConcentration,
+    Result,
+    SiteCanister,
+    Version,
+)
+from autogc_validation.database.operations import create_table
+
+logger = logging.getLogger(__name__)
+
+
+def _initial_schema(conn) -> None:
+    """Baseline schema; tables are created by initialize_database."""
+
+
+def _add_period_indexes(conn) -> None:
+    """Create the indexes used by the MDL and canister period queries."""
+    for model in (MDL, CanisterConcentration, SiteCanister):
+        for index_sql in model.__index_sql__:
+            conn.execute(index_sql)
+
+
+def _add_results_table(conn) -> None:
+    """Create the results warehouse table and its indexes."""
+    conn.execute(Result.__table_sql__)
+    for index_sql in Result.__index_sql__:
+        conn.execute(index_sql)
+
+
+# (version, description, apply function), in the order they must run.
+MIGRATIONS: list[tuple[str, str, Callable]] = [
+    ("1", "Initial schema", _initial_schema),
+    ("2", "Covering indexes for MDL and site canister date-range queries", _add_period_indexes),
+    ("3", "Results warehouse table", _add_results_table),
+]
+
+SCHEMA_VERSION = MIGRATIONS[-1][0]
+
+
+def get_applied_versions(database: DatabaseLike) -> set[str]:
+    """Return the schema versions recorded in the SchemaVersion table.
+
+    Args:
+        database: Path to the database file, or a Session.
+
+    Returns:
+        Set of applied version strings (empty if the table does not exist).
+    """
+    with connection(database) as conn:
+        exists = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?",
+            (Version.__tablename__,),
+        ).fetchone()
+        if not exists:
+            return set()
+        rows = conn.execute(f"SELECT version FROM {Version.__tablename__}").fetchall()
+    return {row[0] for row in rows}
+
+
+def migrate_database(database: DatabaseLike) -> list[str]:
+    """Apply any migrations not yet recorded in SchemaVersion.
+
+    Args:
+        database: Path to the database file, or a Session.
+
+    Returns:
+        List of versions applied by this call, in order.
+    """
+    create_table(database, Version.__tablename__)
+    applied = get_applied_versions(database)
+
+    newly_applied = []
+    for version, description, apply in MIGRATIONS:
+        if version in applied:
+            continue
+        with transaction(database) as conn:
+            apply(conn)
+            conn.execute(
+                f"INSERT INTO {Version.__tablename__} (version, applied_on) VALUES (?, ?)",
+                (version, datetime.now().strftime("%Y-%m-%d %H:%M:%S")),
+            )
+        logger.info("Applied schema migration %s: %s", version, description)
+        newly_applied.append(version)
+
+    if not newly_applied:
+        logger.info("Database schema is up to date (version %s)", SCHEMA_VERSION)
+    return newly_applied
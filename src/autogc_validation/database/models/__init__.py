@@ -8,6 +8,7 @@ from .base import BaseModel
 from .canister import CanisterTypes, PrimaryCanister, CanisterConcentration, SiteCanister
 from .site import Site
 from .mdl import MDL
+from .result import Result
 from .voc import VOCInfo
 from .version import Version
 
@@ -20,6 +21,7 @@ MODELS = [
     CanisterConcentration,
     SiteCanister,
     MDL,
+    Result,
     Version
 ]
 
@@ -38,6 +40,7 @@ __all__ = [
     "SiteCanister",
     "Site",
     "MDL",
+    "Result",
     "VOCInfo",
     "Version",
     
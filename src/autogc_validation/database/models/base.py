@@ -17,6 +17,7 @@ class BaseModel:
     
     __tablename__: ClassVar[str] # Name of SQL table
     __table_sql__: ClassVar[str] # SQL command that creates the table
+    __index_sql__: ClassVar[tuple[str, ...]] = () # CREATE INDEX statements for the table
     def to_dict(self) -> Dict[str, Any]:
         """Convert model to dictionary."""
         return asdict(self)
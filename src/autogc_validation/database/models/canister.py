@@ -105,6 +105,16 @@ class CanisterConcentration(BaseModel):
                     );
                     """
 
+    # Covers the join from site_canisters: the primary key already orders by
+    # primary_canister_id, this adds the selected columns so the join never
+    # touches the table rows.
+    __index_sql__ = (
+        """
+        CREATE INDEX IF NOT EXISTS idx_pcc_canister
+        ON primary_canister_concentration (primary_canister_id, aqs_code, concentration, units)
+        """,
+    )
+
     @field_validator('primary_canister_id')
     @classmethod
     def validate_id(cls, v: str) -> str:
@@ -163,6 +173,15 @@ class SiteCanister(BaseModel):
                     );
                     """
 
+    # Covers the active-canister / canister-period lookups: site_id equality
+    # plus a date_on range, carrying the join key and dilution ratio.
+    __index_sql__ = (
+        """
+        CREATE INDEX IF NOT EXISTS idx_site_canisters_site_date
+        ON site_canisters (site_id, date_on, date_off, primary_canister_id, dilution_ratio)
+        """,
+    )
+
     @field_validator('site_canister_id')
     @classmethod
     def validate_id(cls, v: str) -> str:
@@ -46,6 +46,15 @@ class MDL(BaseModel):
                     );
                     """
 
+    # Covers the active-MDL / MDL-period lookups: site_id equality plus a
+    # date_on range, with every selected column in the index.
+    __index_sql__ = (
+        """
+        CREATE INDEX IF NOT EXISTS idx_mdls_site_date
+        ON mdls (site_id, date_on, date_off, aqs_code, concentration, units)
+        """,
+    )
+
     @field_validator('concentration')
     @classmethod
     def validate_concentration(cls, v: float) -> float:
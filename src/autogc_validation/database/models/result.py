@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+"""
+Validated result data model.
+
+One row per site, sample datetime and compound, so multi-year analyses can
+read concentrations and retention times from SQLite instead of re-parsing
+CDF files.
+"""
+
+from typing import Optional
+
+from pydantic.dataclasses import dataclass
+from pydantic import field_validator
+from .base import BaseModel
+
+
+@dataclass
+class Result(BaseModel):
+    """
+    A validated concentration and retention time for one compound in one sample.
+
+    Attributes:
+        site_id: Site identifier
+        date_time: Sample collection time (YYYY-MM-DD HH:MM:SS)
+        aqs_code: Compound AQS code
+        value: Concentration (ppbC), None if the compound was not found
+        rt: Retention time (minutes), None if the compound was not found
+        sample_type: Sample type code (e.g. "s", "b", "c")
+        filename: Base filename of the source chromatogram pair
+        qualifiers: Comma-separated qualifier codes (e.g. "LB,QX"), if any
+    """
+    site_id: int
+    date_time: str
+    aqs_code: int
+    value: Optional[float] = None
+    rt: Optional[float] = None
+    sample_type: Optional[str] = None
+    filename: Optional[str] = None
+    qualifiers: Optional[str] = None
+
+    __tablename__ = "results"
+
+    # Clustered on (site_id, date_time, aqs_code) so date-range reads for a
+    # site are a single contiguous b-tree range.
+    __table_sql__ = """
+                    CREATE TABLE IF NOT EXISTS results (
+                        site_id INTEGER NOT NULL,
+                        date_time TEXT NOT NULL,
+                        aqs_code INTEGER NOT NULL,
+                        value REAL,
+                        rt REAL,
+                        sample_type TEXT,
+                        filename TEXT,
+                        qualifiers TEXT,
+                        PRIMARY KEY (site_id, date_time, aqs_code),
+                        FOREIGN KEY (site_id) REFERENCES sites(site_id)
+                    ) WITHOUT ROWID;
+                    """
+
+    # Per-compound trend queries: site_id and aqs_code equality, date range.
+    __index_sql__ = (
+        """
+        CREATE INDEX IF NOT EXISTS idx_results_site_code_date
+        ON results (site_id, aqs_code, date_time)
+        """,
+    )
+
+    @field_validator('site_id')
+    @classmethod
+    def validate_site_id(cls, v: int) -> int:
+        if v <= 0:
+            raise ValueError(f"site_id must be positive, got {v}")
+        return v
+
+    @field_validator('date_time')
+    @classmethod
+    def validate_date_time(cls, v: str) -> str:
+        return BaseModel.validate_date_format(v)
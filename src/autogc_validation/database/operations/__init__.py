@@ -7,16 +7,23 @@ Created on Tue Jan 13 14:05:26 2026
 
 from .create_table import create_table
 from .get_table import get_table
-from .insert import insert
+from .insert import insert, insert_many, InsertCounts
 from .delete import delete
 from .update import retire_site_canister, retire_mdl
 from .voc_info import get_by_aqs_code, get_all_voc_data, get_all_voc_data_as_dataframe
 from .mdl_info import get_active_mdls, get_mdl_periods
-from .canister_info import get_active_canister_concentrations, get_canister_periods
+from .canister_info import (
+    get_active_canister_concentrations,
+    get_canister_periods,
+    get_canister_periods_by_type,
+)
+from .results import load_results, load_dataset_results, get_results, get_results_wide
 
 __all__ = ["create_table",
            "get_table",
            "insert",
+           "insert_many",
+           "InsertCounts",
            "delete",
            "retire_site_canister",
            "retire_mdl",
@@ -26,4 +33,9 @@ __all__ = ["create_table",
            "get_active_mdls",
            "get_mdl_periods",
            "get_active_canister_concentrations",
-           "get_canister_periods"]
\ No newline at end of file
+           "get_canister_periods",
+           "get_canister_periods_by_type",
+           "load_results",
+           "load_dataset_results",
+           "get_results",
+           "get_results_wide"]
\ No newline at end of file
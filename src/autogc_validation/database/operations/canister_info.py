@@ -8,17 +8,18 @@ canister type, and date, or all periods within a date range.
 
 import logging
 import pandas as pd
-from typing import Dict
+from typing import Dict, Iterable, Optional
 
-from autogc_validation.database.conn import connection
-from autogc_validation.database.enums import ConcentrationUnit
-from autogc_validation.conversions import convert 
+from autogc_validation.database.conn import DatabaseLike, connection, reference_cache
+from autogc_validation.database.enums import CanisterType, ConcentrationUnit
+from autogc_validation.conversions import convert_array
 
 logger = logging.getLogger(__name__)
 
 
+@reference_cache
 def get_active_canister_concentrations(
-    database: str,
+    database: DatabaseLike,
     site_id: int,
     canister_type: str,
     date: str,
@@ -31,7 +32,7 @@ def get_active_canister_concentrations(
     the requested unit.
 
     Args:
-        database: Path to SQLite database.
+        database: Path to SQLite database, or a Session.
         site_id: Site identifier.
         canister_type: Canister type ('CVS', 'RTS', or 'LCS').
         date: Date string (YYYY-MM-DD HH:MM or YYYY-MM-DD HH:MM:SS).
@@ -65,14 +66,8 @@ def get_active_canister_concentrations(
         wide.attrs["units"] = output_unit
         return wide
 
-    df["concentration"] = df.apply(
-        lambda row: convert(
-            value=row["concentration"],
-            aqs_code=row["aqs_code"],
-            from_unit=row["units"],
-            to_unit=output_unit,
-        ),
-        axis=1,
+    df["concentration"] = convert_array(
+        df["concentration"], df["aqs_code"], df["units"], output_unit,
     )
 
     wide = pd.DataFrame([df.set_index("aqs_code")["concentration"].to_dict()])
@@ -81,7 +76,7 @@ def get_active_canister_concentrations(
 
 
 def get_canister_periods(
-    database: str,
+    database: DatabaseLike,
     site_id: int,
     canister_type: str,
     start_date: str,
@@ -92,11 +87,11 @@ def get_canister_periods(
 
     Finds breakpoints where the active site canister changes — the start of
     the range plus any date_on values in site_canisters that fall within
-    (start_date, end_date]. For each breakpoint, retrieves the diluted
-    concentrations active at that date.
+    (start_date, end_date]. The diluted concentrations active at each
+    breakpoint are fetched in the same query as the breakpoints.
 
     Args:
-        database: Path to SQLite database.
+        database: Path to SQLite database, or a Session.
         site_id: Site identifier.
         canister_type: Canister type ('CVS', 'RTS', or 'LCS').
         start_date: Start of date range (YYYY-MM-DD HH:MM or YYYY-MM-DD HH:MM:SS).
@@ -109,31 +104,118 @@ def get_canister_periods(
         If the canister does not change within the range, returns a single-row
         DataFrame indexed by start_date.
     """
-    sql = """
-        SELECT DISTINCT sc.date_on
-        FROM site_canisters sc
-        JOIN primary_canisters p
-          ON sc.primary_canister_id = p.primary_canister_id
-        WHERE sc.site_id = ?
-          AND p.canister_type = ?
-          AND sc.date_on > ?
-          AND sc.date_on <= ?
-        ORDER BY sc.date_on
+    return get_canister_periods_by_type(
+        database, site_id, start_date, end_date, output_unit,
+        canister_types=[canister_type],
+    )[str(canister_type)]
+
+
+@reference_cache
+def get_canister_periods_by_type(
+    database: DatabaseLike,
+    site_id: int,
+    start_date: str,
+    end_date: str,
+    output_unit: ConcentrationUnit,
+    canister_types: Optional[Iterable[str]] = None,
+) -> Dict[str, pd.DataFrame]:
+    """Get canister concentration periods for several canister types at once.
+
+    Same result as calling :func:`get_canister_periods` once per type, but
+    the breakpoints and diluted concentrations for every type are fetched
+    in a single query.
+
+    Args:
+        database: Path to SQLite database, or a Session.
+        site_id: Site identifier.
+        start_date: Start of date range (YYYY-MM-DD HH:MM or YYYY-MM-DD HH:MM:SS).
+        end_date: End of date range (inclusive).
+        output_unit: Concentration unit for returned values.
+        canister_types: Canister types to query. Defaults to every
+            CanisterType (CVS, RTS, LCS).
+
+    Returns:
+        Dict mapping canister type to a wide DataFrame with DatetimeIndex
+        (one row per breakpoint) and AQS codes as columns, as returned by
+        get_canister_periods. Units stored in each df.attrs['units'].
     """
+    if canister_types is None:
+        canister_types = list(CanisterType)
+    types = [str(t) for t in canister_types]
+    if not types:
+        return {}
+
+    # Breakpoints are the range start plus every site canister date_on inside
+    # the range, per type; each is joined to the canister active at that
+    # instant and its diluted concentrations. Breakpoints come from the
+    # site canisters alone, so a canister with no concentration rows still
+    # starts a period (of NaN) instead of extending the previous one.
+    type_values = ", ".join("(?)" for _ in types)
+    sql = f"""
+        WITH types(canister_type) AS (VALUES {type_values}),
+        site_cans AS (
+            SELECT p.canister_type, sc.primary_canister_id, sc.date_on,
+                   sc.date_off, sc.dilution_ratio
+            FROM site_canisters sc
+            JOIN primary_canisters p
+              ON sc.primary_canister_id = p.primary_canister_id
+            WHERE sc.site_id = ?
+              AND p.canister_type IN (SELECT canister_type FROM types)
+        ),
+        site_conc AS (
+            SELECT s.canister_type, s.date_on, s.date_off, pc.aqs_code,
+                   pc.concentration * s.dilution_ratio AS concentration, pc.units
+            FROM site_cans s
+            LEFT JOIN primary_canister_concentration pc
+              ON s.primary_canister_id = pc.primary_canister_id
+        ),
+        breakpoints(canister_type, date) AS (
+            SELECT canister_type, ? FROM types
+            UNION
+            SELECT canister_type, date_on
+            FROM site_cans
+            WHERE date_on > ?
+              AND date_on <= ?
+        )
+        SELECT b.canister_type, b.date AS breakpoint,
+               c.aqs_code, c.concentration, c.units
+        FROM breakpoints b
+        LEFT JOIN site_conc c
+          ON c.canister_type = b.canister_type
+         AND c.date_on <= b.date
+         AND (c.date_off IS NULL OR c.date_off > b.date)
+        ORDER BY b.canister_type, b.date
+    """
+    params = (*types, site_id, start_date, start_date, end_date)
     with connection(database) as conn:
-        cursor = conn.execute(sql, (site_id, canister_type, start_date, end_date))
-        mid_breakpoints = [row[0] for row in cursor.fetchall()]
+        cursor = conn.execute(sql, params)
+        columns = [desc[0] for desc in cursor.description]
+        df = pd.DataFrame(cursor.fetchall(), columns=columns)
 
-    breakpoints = [start_date] + mid_breakpoints
+    df["breakpoint"] = pd.to_datetime(df["breakpoint"], format="ISO8601")
+    active = df.dropna(subset=["aqs_code"]).copy()
+    active["aqs_code"] = active["aqs_code"].astype(int)
+    active["concentration"] = convert_array(
+        active["concentration"], active["aqs_code"], active["units"], output_unit,
+    )
 
-    period_rows = []
-    for date in breakpoints:
-        row_df = get_active_canister_concentrations(
-            database, site_id, canister_type, date, output_unit
+    periods = {}
+    for canister_type in types:
+        breakpoints = df.loc[df["canister_type"] == canister_type, "breakpoint"].drop_duplicates()
+        rows = active[active["canister_type"] == canister_type]
+        result = (
+            rows.groupby(["breakpoint", "aqs_code"])["concentration"].last()
+            .unstack("aqs_code")
+            .reindex(pd.DatetimeIndex(breakpoints))
         )
-        row_df.index = pd.DatetimeIndex([date])
-        period_rows.append(row_df)
-
-    result = pd.concat(period_rows).sort_index()
-    result.attrs["units"] = output_unit
-    return result
+        result.index.name = None
+        result.columns.name = None
+        result.attrs["units"] = output_unit
+        periods[canister_type] = result
+
+    logger.debug(
+        "Loaded canister periods for site %s between %s and %s: %s",
+        site_id, start_date, end_date,
+        {t: len(p) for t, p in periods.items()},
+    )
+    return periods
@@ -5,18 +5,18 @@ Created on Tue Jan 13 15:34:20 2026
 @author: aengstrom
 """
 from autogc_validation.database.models import MODEL_REGISTRY
-from autogc_validation.database.conn import transaction
+from autogc_validation.database.conn import DatabaseLike, transaction
 import logging
 
 logger = logging.getLogger(__name__)
 
 
-def create_table(database: str, tablename: str) -> None:
+def create_table(database: DatabaseLike, tablename: str) -> None:
     """
-    Create a table in the database.
+    Create a table in the database, along with its indexes.
 
     Args:
-        database: Path to the database file.
+        database: Path to the database file, or a Session.
         tablename: Name of the table to create (must be in MODEL_REGISTRY).
 
     Raises:
@@ -32,6 +32,8 @@ def create_table(database: str, tablename: str) -> None:
     try:
         with transaction(database) as conn:
             conn.execute(model.__table_sql__)
+            for index_sql in model.__index_sql__:
+                conn.execute(index_sql)
             logger.info("Created table %s", tablename)
     except Exception:
         logger.exception("Error creating table %s", tablename)
@@ -10,13 +10,13 @@ from enum import Enum
 
 import logging
 
-from autogc_validation.database.conn import transaction, connection
+from autogc_validation.database.conn import DatabaseLike, transaction, connection
 from autogc_validation.database.models import MODELS
 
 logger = logging.getLogger(__name__)
 
 
-def delete(database: str, obj) -> bool:
+def delete(database: DatabaseLike, obj) -> bool:
     """Delete a record from the database by exact match on all fields.
 
     Intended for removing erroneously inserted records. To retire a
@@ -29,7 +29,7 @@ def delete(database: str, obj) -> bool:
         3. Pass it to delete().
 
     Args:
-        database: Path to the database file.
+        database: Path to the database file, or a Session.
         obj: A model instance exactly matching the record to delete.
 
     Returns:
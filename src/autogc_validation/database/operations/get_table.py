@@ -7,19 +7,19 @@ Created on Fri Jan 16 16:25:38 2026
 from dataclasses import fields
 from typing import Optional
 from autogc_validation.database.models import MODEL_REGISTRY
-from autogc_validation.database.conn import connection
+from autogc_validation.database.conn import DatabaseLike, connection
 import logging
 import pandas as pd
 
 logger = logging.getLogger(__name__)
 
 
-def get_table(database: str, tablename: str, order_by: Optional[list[str]] = None) -> pd.DataFrame:
+def get_table(database: DatabaseLike, tablename: str, order_by: Optional[list[str]] = None) -> pd.DataFrame:
     """
     Retrieve a full table as a DataFrame.
 
     Args:
-        database: Path to the database file.
+        database: Path to the database file, or a Session.
         tablename: Name of the table to query (must be in MODEL_REGISTRY).
         order_by: Optional list of column names to sort by.
 
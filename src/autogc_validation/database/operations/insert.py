@@ -6,24 +6,31 @@ Created on Fri Jan 16 16:02:07 2026
 """
 import sqlite3
 from enum import Enum
+from typing import Iterable, NamedTuple
 from dataclasses import fields
-from autogc_validation.database.conn import transaction
+from autogc_validation.database.conn import DatabaseLike, transaction
 import logging
 from autogc_validation.database.models import MODELS
 
 logger = logging.getLogger(__name__)
 
+# (verb, upsert clause) per on_conflict value. ON CONFLICT DO NOTHING only
+# covers uniqueness conflicts, unlike OR IGNORE, which also drops rows that
+# break NOT NULL or CHECK constraints.
+_CONFLICT_CLAUSES = {
+    "skip": ("INSERT", "ON CONFLICT DO NOTHING"),
+    "replace": ("INSERT OR REPLACE", ""),
+}
 
-def insert(database: str, obj) -> bool:
-    """
-    Insert a model instance into the database.
 
-    Args:
-        database: Path to the database file.
-        obj: A model instance to insert.
+class InsertCounts(NamedTuple):
+    """Row counts reported by :func:`insert_many`."""
+    inserted: int
+    duplicates: int
 
-    Returns:
-        True if the row was inserted, False if it was a duplicate.
+
+def _row(obj) -> tuple[str, list[str], list]:
+    """Return (table, columns, values) for a model instance.
 
     Raises:
         TypeError: If obj is not a recognized model type.
@@ -44,13 +51,38 @@ def insert(database: str, obj) -> bool:
         v.value if isinstance(v, Enum) else v
         for v in (getattr(obj, col) for col in columns)
     ]
+    return table, columns, values
+
 
-    sql = f"""
-    INSERT INTO {table}
+def _insert_sql(
+    table: str, columns: list[str], verb: str = "INSERT", upsert_clause: str = "",
+) -> str:
+    return f"""
+    {verb} INTO {table}
     ({", ".join(columns)})
     VALUES ({", ".join("?" for _ in columns)})
+    {upsert_clause}
     """
 
+
+def insert(database: DatabaseLike, obj) -> bool:
+    """
+    Insert a model instance into the database.
+
+    Args:
+        database: Path to the database file, or a Session.
+        obj: A model instance to insert.
+
+    Returns:
+        True if the row was inserted, False if it was a duplicate.
+
+    Raises:
+        TypeError: If obj is not a recognized model type.
+        AttributeError: If obj is missing __tablename__.
+    """
+    table, columns, values = _row(obj)
+    sql = _insert_sql(table, columns)
+
     try:
         with transaction(database) as conn:
             conn.execute(sql, values)
@@ -59,3 +91,60 @@ def insert(database: str, obj) -> bool:
     except sqlite3.IntegrityError as e:
         logger.warning("Duplicate entry skipped for %s: %s", table, e)
         return False
+
+
+def insert_many(database: DatabaseLike, objs: Iterable, on_conflict: str = "skip") -> InsertCounts:
+    """Insert many model instances in a single transaction.
+
+    Instances are grouped by table (in order of first appearance, so parent
+    rows listed first are inserted first) and each group is written with
+    one executemany call.
+
+    Args:
+        database: Path to the database file, or a Session.
+        objs: Model instances to insert; may mix model types.
+        on_conflict: What to do with an instance that collides with an
+            existing row on a primary key or unique constraint: "skip"
+            keeps the existing row, "replace" overwrites it.
+
+    Returns:
+        InsertCounts with the number of rows inserted and the number that
+        were duplicates (skipped or replaced).
+
+    Raises:
+        ValueError: If on_conflict is not "skip" or "replace".
+        TypeError: If any obj is not a recognized model type.
+        AttributeError: If any obj is missing __tablename__.
+        sqlite3.IntegrityError: On a foreign key, NOT NULL or CHECK
+            violation; nothing from the batch is written.
+    """
+    if on_conflict not in _CONFLICT_CLAUSES:
+        raise ValueError(
+            f"on_conflict must be one of {sorted(_CONFLICT_CLAUSES)}, got {on_conflict!r}"
+        )
+
+    groups: dict[str, tuple[list[str], list[list]]] = {}  # table -> (columns, rows)
+    for obj in objs:
+        table, columns, values = _row(obj)
+        groups.setdefault(table, (columns, []))[1].append(values)
+
+    total_inserted = total_duplicates = 0
+    with transaction(database) as conn:
+        for table, (columns, rows) in groups.items():
+            sql = _insert_sql(table, columns, *_CONFLICT_CLAUSES[on_conflict])
+            if on_conflict == "replace":
+                # REPLACE reports every row as changed; count new rows by size.
+                before = conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+                conn.executemany(sql, rows)
+                after = conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+                inserted = after - before
+            else:
+                inserted = conn.executemany(sql, rows).rowcount
+            total_inserted += inserted
+            total_duplicates += len(rows) - inserted
+            logger.info(
+                "%s: inserted %d/%d rows (%s duplicates)",
+                table, inserted, len(rows), "replaced" if on_conflict == "replace" else "skipped",
+            )
+
+    return InsertCounts(total_inserted, total_duplicates)
@@ -10,15 +10,16 @@ import logging
 
 import pandas as pd
 
-from autogc_validation.database.conn import connection
+from autogc_validation.database.conn import DatabaseLike, connection, reference_cache
 from autogc_validation.database.enums import ConcentrationUnit
-from autogc_validation.conversions import convert
+from autogc_validation.conversions import convert_array
 
 logger = logging.getLogger(__name__)
 
 
+@reference_cache
 def get_active_mdls(
-    database: str,
+    database: DatabaseLike,
     site_id: int,
     date: str,
     output_unit: ConcentrationUnit,
@@ -30,7 +31,7 @@ def get_active_mdls(
     with one column per AQS code.
 
     Args:
-        database: Path to SQLite database.
+        database: Path to SQLite database, or a Session.
         site_id: Site identifier.
         date: Date string (YYYY-MM-DD HH:MM or YYYY-MM-DD HH:MM:SS).
         output_unit: Concentration unit for the returned values.
@@ -53,14 +54,8 @@ def get_active_mdls(
         columns = [desc[0] for desc in cursor.description]
         df = pd.DataFrame(rows, columns=columns)
 
-    df["concentration"] = df.apply(
-        lambda row: convert(
-            value=row["concentration"],
-            aqs_code=row["aqs_code"],
-            from_unit=row["units"],
-            to_unit=output_unit,
-        ),
-        axis=1,
+    df["concentration"] = convert_array(
+        df["concentration"], df["aqs_code"], df["units"], output_unit,
     )
 
     wide = pd.DataFrame([df.set_index("aqs_code")["concentration"].to_dict()])
@@ -68,8 +63,9 @@ def get_active_mdls(
     return wide
 
 
+@reference_cache
 def get_mdl_periods(
-    database: str,
+    database: DatabaseLike,
     site_id: int,
     start_date: str,
     end_date: str,
@@ -78,11 +74,11 @@ def get_mdl_periods(
     """Get all MDL periods within [start_date, end_date] as a date-indexed wide DataFrame.
 
     Finds breakpoints where the active MDL set changes — the start of the range
-    plus any date_on values that fall within (start_date, end_date]. For each
-    breakpoint, retrieves the MDLs active at that date.
+    plus any date_on values that fall within (start_date, end_date] — and the
+    MDLs active at each breakpoint in a single query.
 
     Args:
-        database: Path to SQLite database.
+        database: Path to SQLite database, or a Session.
         site_id: Site identifier.
         start_date: Start of date range (YYYY-MM-DD HH:MM or YYYY-MM-DD HH:MM:SS).
         end_date: End of date range (inclusive).
@@ -94,26 +90,51 @@ def get_mdl_periods(
         If MDLs do not change within the range, returns a single-row DataFrame
         indexed by start_date.
     """
+    # Breakpoints are the range start plus every date_on inside the range;
+    # each is joined to the MDL records active at that instant.
     sql = """
-        SELECT DISTINCT date_on
-        FROM mdls
-        WHERE site_id = ?
-          AND date_on > ?
-          AND date_on <= ?
-        ORDER BY date_on
+        WITH breakpoints(date) AS (
+            SELECT ?
+            UNION
+            SELECT date_on
+            FROM mdls
+            WHERE site_id = ?
+              AND date_on > ?
+              AND date_on <= ?
+        )
+        SELECT b.date AS breakpoint, m.aqs_code, m.concentration, m.units
+        FROM breakpoints b
+        LEFT JOIN mdls m
+          ON m.site_id = ?
+         AND m.date_on <= b.date
+         AND (m.date_off IS NULL OR m.date_off > b.date)
+        ORDER BY b.date
     """
+    params = (start_date, site_id, start_date, end_date, site_id)
     with connection(database) as conn:
-        cursor = conn.execute(sql, (site_id, start_date, end_date))
-        mid_breakpoints = [row[0] for row in cursor.fetchall()]
+        cursor = conn.execute(sql, params)
+        columns = [desc[0] for desc in cursor.description]
+        df = pd.DataFrame(cursor.fetchall(), columns=columns)
 
-    breakpoints = [start_date] + mid_breakpoints
+    breakpoints = pd.to_datetime(df["breakpoint"].drop_duplicates(), format="ISO8601")
+    df["breakpoint"] = pd.to_datetime(df["breakpoint"], format="ISO8601")
 
-    period_rows = []
-    for date in breakpoints:
-        row_df = get_active_mdls(database, site_id, date, output_unit)
-        row_df.index = pd.DatetimeIndex([date])
-        period_rows.append(row_df)
+    active = df.dropna(subset=["aqs_code"]).copy()
+    active["aqs_code"] = active["aqs_code"].astype(int)
+    active["concentration"] = convert_array(
+        active["concentration"], active["aqs_code"], active["units"], output_unit,
+    )
 
-    result = pd.concat(period_rows).sort_index()
+    result = (
+        active.groupby(["breakpoint", "aqs_code"])["concentration"].last()
+        .unstack("aqs_code")
+        .reindex(pd.DatetimeIndex(breakpoints))
+    )
+    result.index.name = None
+    result.columns.name = None
     result.attrs["units"] = output_unit
+    logger.debug(
+        "Loaded %d MDL period(s) for site %s between %s and %s",
+        len(result), site_id, start_date, end_date,
+    )
     return result
@@ -0,0 +1,292 @@
+# -*- coding: utf-8 -*-
+"""
+Results warehouse operations.
+
+Bulk-load validated concentrations and retention times from a Dataset (or
+Dataset-shaped frames) into the results table, and query them back by
+site, date range, compound and sample type.
+"""
+
+import logging
+from typing import Iterable, Optional
+
+import numpy as np
+import pandas as pd
+
+from autogc_validation.database.conn import DatabaseLike, connection, transaction
+from autogc_validation.database.models import Result
+from autogc_validation.database.operations.insert import InsertCounts
+
+logger = logging.getLogger(__name__)
+
+_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+# (verb, upsert clause) per on_conflict value; DO NOTHING, unlike OR IGNORE,
+# does not hide NOT NULL or CHECK violations.
+_CONFLICT_CLAUSES = {
+    "skip": ("INSERT", "ON CONFLICT DO NOTHING"),
+    "replace": ("INSERT OR REPLACE", ""),
+}
+_COLUMNS = ["site_id", "date_time", "aqs_code", "value", "rt", "sample_type", "filename", "qualifiers"]
+
+
+def _code_columns(df: pd.DataFrame) -> list[int]:
+    return [c for c in df.columns if isinstance(c, (int, np.integer))]
+
+
+def _aligned(frame: Optional[pd.DataFrame], data: pd.DataFrame, codes: list[int]) -> Optional[pd.DataFrame]:
+    """Reindex *frame* onto data's rows and the given code columns."""
+    if frame is None:
+        return None
+    if frame.index.equals(data.index):
+        return frame.reindex(columns=codes)
+    return frame.reindex(index=data.index, columns=codes)
+
+
+def _nullable(values: np.ndarray) -> np.ndarray:
+    """Object array with NaN replaced by None (SQL NULL)."""
+    out = values.astype(object)
+    out[pd.isna(values)] = None
+    return out
+
+
+def _result_rows(
+    site_id: int,
+    data: pd.DataFrame,
+    rt: Optional[pd.DataFrame],
+    qualifiers: Optional[pd.DataFrame],
+) -> list[tuple]:
+    """Flatten wide data/rt/qualifier frames into results table rows.
+
+    Cells with no concentration, no retention time and no qualifier are
+    dropped.
+    """
+    codes = _code_columns(data)
+    if data.empty or not codes:
+        return []
+
+    n_rows, n_codes = len(data), len(codes)
+    values = data[codes].to_numpy(dtype=float, na_value=np.nan).ravel()
+    rt_frame = _aligned(rt, data, codes)
+    rts = (
+        rt_frame.to_numpy(dtype=float, na_value=np.nan).ravel()
+        if rt_frame is not None else np.full(values.shape, np.nan)
+    )
+    qual_frame = _aligned(qualifiers, data, codes)
+    quals = (
+        qual_frame.to_numpy(dtype=object).ravel()
+        if qual_frame is not None else np.full(values.shape, None, dtype=object)
+    )
+    quals = np.where(pd.isna(quals) | (quals == ""), None, quals)
+
+    index = pd.DatetimeIndex(data.index)
+    if index.tz is not None:
+        index = index.tz_localize(None)
+    dates = np.repeat(index.strftime(_DATE_FORMAT).to_numpy(dtype=object), n_codes)
+    sample_types = np.repeat(data["sample_type"].to_numpy(dtype=object), n_codes)
+    filenames = np.repeat(data["filename"].to_numpy(dtype=object), n_codes)
+    aqs = np.tile(np.array([int(c) for c in codes], dtype=object), n_rows)
+
+    keep = ~(np.isnan(values) & np.isnan(rts) & pd.isna(quals))
+    columns = (
+        np.full(int(keep.sum()), site_id, dtype=object),
+        dates[keep], aqs[keep],
+        _nullable(values[keep]), _nullable(rts[keep]),
+        sample_types[keep], filenames[keep], quals[keep],
+    )
+    return list(zip(*columns))
+
+
+def load_results(
+    database: DatabaseLike,
+    site_id: int,
+    data: pd.DataFrame,
+    rt: Optional[pd.DataFrame] = None,
+    qualifiers: Optional[pd.DataFrame] = None,
+    on_conflict: str = "replace",
+) -> InsertCounts:
+    """Load Dataset-shaped frames into the results table in one transaction.
+
+    Args:
+        database: Path to the database file, or a Session.
+        site_id: Site the samples were collected at.
+        data: Concentration frame shaped like Dataset.data — DatetimeIndex,
+            'sample_type' and 'filename' columns, AQS code columns.
+        rt: Retention time frame shaped like Dataset.rt, or None.
+        qualifiers: Optional frame with the same index and AQS code columns
+            holding qualifier code strings (e.g. "LB" or "LB,QX").
+        on_conflict: "replace" overwrites rows already stored for the same
+            (site_id, date_time, aqs_code); "skip" keeps them.
+
+    Returns:
+        InsertCounts with rows inserted and duplicates (replaced or skipped).
+
+    Raises:
+        ValueError: If on_conflict is not "skip" or "replace".
+    """
+    if on_conflict not in _CONFLICT_CLAUSES:
+        raise ValueError(
+            f"on_conflict must be one of {sorted(_CONFLICT_CLAUSES)}, got {on_conflict!r}"
+        )
+
+    rows = _result_rows(site_id, data, rt, qualifiers)
+    if not rows:
+        logger.info("No results to load for site %s", site_id)
+        return InsertCounts(0, 0)
+
+    first, last = min(r[1] for r in rows), max(r[1] for r in rows)
+    count_sql = f"""
+        SELECT COUNT(*) FROM {Result.__tablename__}
+        WHERE site_id = ? AND date_time BETWEEN ? AND ?
+    """
+    verb, upsert_clause = _CONFLICT_CLAUSES[on_conflict]
+    sql = f"""
+        {verb} INTO {Result.__tablename__}
+        ({", ".join(_COLUMNS)})
+        VALUES ({", ".join("?" for _ in _COLUMNS)})
+        {upsert_clause}
+    """
+    with transaction(database) as conn:
+        # Every batch row falls in [first, last], so the change in that
+        # range's row count is the number of new rows.
+        before = conn.execute(count_sql, (site_id, first, last)).fetchone()[0]
+        conn.executemany(sql, rows)
+        after = conn.execute(count_sql, (site_id, first, last)).fetchone()[0]
+
+    inserted = after - before
+    logger.info(
+        "Loaded %d result rows for site %s (%s to %s): %d new, %d %s",
+        len(rows), site_id, first, last, inserted, len(rows) - inserted,
+        "replaced" if on_conflict == "replace" else "skipped",
+    )
+    return InsertCounts(inserted, len(rows) - inserted)
+
+
+def load_dataset_results(
+    database: DatabaseLike,
+    site_id: int,
+    dataset,
+    qualifiers: Optional[pd.DataFrame] = None,
+    on_conflict: str = "replace",
+) -> InsertCounts:
+    """Load every sample in a Dataset into the results table.
+
+    Args:
+        database: Path to the database file, or a Session.
+        site_id: Site the Dataset belongs to.
+        dataset: A Dataset; its data and rt frames are loaded.
+        qualifiers: Optional qualifier code frame, as for load_results.
+        on_conflict: "replace" or "skip", as for load_results.
+
+    Returns:
+        InsertCounts with rows inserted and duplicates.
+    """
+    return load_results(
+        database, site_id, dataset.data, dataset.rt,
+        qualifiers=qualifiers, on_conflict=on_conflict,
+    )
+
+
+def get_results(
+    database: DatabaseLike,
+    site_id: int,
+    start_date: str,
+    end_date: str,
+    aqs_codes: Optional[Iterable[int]] = None,
+    sample_types: Optional[Iterable[str]] = None,
+) -> pd.DataFrame:
+    """Query stored results for a site and date range as a long DataFrame.
+
+    Args:
+        database: Path to the database file, or a Session.
+        site_id: Site identifier.
+        start_date: Start of range (YYYY-MM-DD, YYYY-MM-DD HH:MM or
+            YYYY-MM-DD HH:MM:SS).
+        end_date: End of range (inclusive); a date alone includes that
+            whole day.
+        aqs_codes: Restrict to these compounds; all if None.
+        sample_types: Restrict to these sample type codes; all if None.
+
+    Returns:
+        DataFrame with columns date_time (datetime64), aqs_code, value, rt,
+        sample_type, filename, qualifiers, ordered by date_time and aqs_code.
+    """
+    conditions = ["site_id = ?", "date_time >= ?", "date_time <= ?"]
+    params: list = [site_id, _normalize_date(start_date), _normalize_date(end_date, end=True)]
+    if aqs_codes is not None:
+        codes = [int(c) for c in aqs_codes]
+        conditions.append(f"aqs_code IN ({', '.join('?' for _ in codes)})")
+        params.extend(codes)
+    if sample_types is not None:
+        types = [str(t) for t in sample_types]
+        conditions.append(f"sample_type IN ({', '.join('?' for _ in types)})")
+        params.extend(types)
+
+    sql = f"""
+        SELECT date_time, aqs_code, value, rt, sample_type, filename, qualifiers
+        FROM {Result.__tablename__}
+        WHERE {" AND ".join(conditions)}
+        ORDER BY date_time, aqs_code
+    """
+    with connection(database) as conn:
+        cursor = conn.execute(sql, params)
+        columns = [desc[0] for desc in cursor.description]
+        df = pd.DataFrame(cursor.fetchall(), columns=columns)
+
+    df["date_time"] = pd.to_datetime(df["date_time"], format=_DATE_FORMAT)
+    df["value"] = df["value"].astype(float)
+    df["rt"] = df["rt"].astype(float)
+    return df
+
+
+def get_results_wide(
+    database: DatabaseLike,
+    site_id: int,
+    start_date: str,
+    end_date: str,
+    field: str = "value",
+    aqs_codes: Optional[Iterable[int]] = None,
+    sample_types: Optional[Iterable[str]] = None,
+) -> pd.DataFrame:
+    """Query stored results pivoted back into a Dataset-shaped frame.
+
+    Args:
+        database: Path to the database file, or a Session.
+        site_id: Site identifier.
+        start_date: Start of range (YYYY-MM-DD, YYYY-MM-DD HH:MM or
+            YYYY-MM-DD HH:MM:SS).
+        end_date: End of range (inclusive); a date alone includes that
+            whole day.
+        field: "value" for a Dataset.data-like frame, "rt" for Dataset.rt.
+        aqs_codes: Restrict to these compounds; all if None.
+        sample_types: Restrict to these sample type codes; all if None.
+
+    Returns:
+        DataFrame indexed by date_time with 'sample_type', 'filename' and
+        one column per AQS code, so it can be passed to the QC checks.
+
+    Raises:
+        ValueError: If field is not "value" or "rt".
+    """
+    if field not in ("value", "rt"):
+        raise ValueError(f"field must be 'value' or 'rt', got {field!r}")
+
+    long = get_results(database, site_id, start_date, end_date, aqs_codes, sample_types)
+    meta = long.groupby("date_time")[["sample_type", "filename"]].first()
+    wide = long.pivot(index="date_time", columns="aqs_code", values=field)
+    wide.columns = [int(c) for c in wide.columns]
+    result = meta.join(wide)
+    result.index.name = "date_time"
+    return result
+
+
+def _normalize_date(date: str, end: bool = False) -> str:
+    """Pad a date to seconds so string comparison matches stored dates.
+
+    A date-only end covers the whole day (23:59:59); a start begins at
+    00:00:00.
+    """
+    if len(date) == len("YYYY-MM-DD"):
+        return date + (" 23:59:59" if end else " 00:00:00")
+    if len(date) == len("YYYY-MM-DD HH:MM"):
+        return date + (":59" if end else ":00")
+    return date
@@ -4,19 +4,19 @@ Created on Thu Feb 13 2026
 
 @author: aengstrom
 """
-from autogc_validation.database.conn import transaction, connection
+from autogc_validation.database.conn import DatabaseLike, transaction, connection
 from autogc_validation.database.models.base import BaseModel
 import logging
 
 logger = logging.getLogger(__name__)
 
 
-def retire_site_canister(database: str, site_canister_id: str, date_off: str) -> bool:
+def retire_site_canister(database: DatabaseLike, site_canister_id: str, date_off: str) -> bool:
     """
     Set date_off and mark a site canister as no longer in use.
 
     Args:
-        database: Path to the database file.
+        database: Path to the database file, or a Session.
         site_canister_id: The canister to retire.
         date_off: Date the canister was removed (YYYY-MM-DD HH:MM:SS).
 
@@ -56,12 +56,12 @@ def retire_site_canister(database: str, site_canister_id: str, date_off: str) ->
     return True
 
 
-def retire_mdl(database: str, site_id: int, aqs_code: int, date_on: str, date_off: str) -> bool:
+def retire_mdl(database: DatabaseLike, site_id: int, aqs_code: int, date_on: str, date_off: str) -> bool:
     """
     Set date_off on an MDL record.
 
     Args:
-        database: Path to the database file.
+        database: Path to the database file, or a Session.
         site_id: Site identifier.
         aqs_code: Compound AQS code.
         date_on: The date_on of the MDL to update (part of the primary key).
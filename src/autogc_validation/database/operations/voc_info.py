@@ -10,13 +10,14 @@ from typing import List, Optional
 import pandas as pd
 
 
-from autogc_validation.database.conn import connection
+from autogc_validation.database.conn import DatabaseLike, connection, reference_cache
 from autogc_validation.database.models import VOCInfo
 
 logger = logging.getLogger(__name__)
 
 
-def get_by_aqs_code(database: str, aqs_code: int) -> Optional[VOCInfo]:
+@reference_cache
+def get_by_aqs_code(database: DatabaseLike, aqs_code: int) -> Optional[VOCInfo]:
     """Get a VOC by its AQS code."""
     sql = "SELECT * FROM voc_info WHERE aqs_code = ?"
 
@@ -29,7 +30,8 @@ def get_by_aqs_code(database: str, aqs_code: int) -> Optional[VOCInfo]:
         return None
 
 
-def get_all_voc_data(database: str) -> List[VOCInfo]:
+@reference_cache
+def get_all_voc_data(database: DatabaseLike) -> List[VOCInfo]:
     """Get all VOC information as list of VOCInfo objects."""
     sql = "SELECT * FROM voc_info ORDER BY column DESC, elution_order"
 
@@ -38,7 +40,8 @@ def get_all_voc_data(database: str) -> List[VOCInfo]:
         return [VOCInfo.from_dict(dict(row)) for row in cursor.fetchall()]
 
 
-def get_all_voc_data_as_dataframe(database: str) -> pd.DataFrame:
+@reference_cache
+def get_all_voc_data_as_dataframe(database: DatabaseLike) -> pd.DataFrame:
     """Get all VOC information as a DataFrame."""
     sql = "SELECT * FROM voc_info ORDER BY elution_order"
 
@@ -19,7 +19,7 @@ from autogc_validation.database.enums import (
     aqs_to_name,
     get_codes_by_column,
 )
-from autogc_validation.qc.utils import align_period_index, get_compound_cols
+from autogc_validation.qc.utils import aligned_periods, get_compound_cols
 
 _TNMHC_CODE = CompoundAQSCode.C_TNMHC
 _COLORS = plotly.colors.qualitative.Light24
@@ -110,19 +110,12 @@ def plot_qc_recovery(
         print(f"No compounds in common between {qc_type} data and canister standard.")
         return
 
-    period_indices = align_period_index(qc_df, canister_periods)
     timestamps = list(qc_df.index)
-
-    recoveries: dict[int, list[float]] = {c: [] for c in plot_codes}
-    for i, (_, row) in enumerate(qc_df.iterrows()):
-        expected = canister_periods.iloc[period_indices[i]]
-        for code in plot_codes:
-            obs = row.get(code)
-            exp = expected.get(code)
-            if pd.isna(obs) or pd.isna(exp) or float(exp) == 0:
-                recoveries[code].append(None)
-            else:
-                recoveries[code].append(round(float(obs) / float(exp) * 100.0, 2))
+    observed = qc_df[plot_codes].to_numpy(dtype=float, na_value=np.nan)
+    expected = aligned_periods(qc_df, canister_periods).matrix(plot_codes)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        ratio = np.where(expected != 0, observed / expected * 100.0, np.nan).round(2)
+    recoveries = {code: ratio[:, j] for j, code in enumerate(plot_codes)}
 
     plot_grp, bp_grp = _split_by_column(plot_codes)
     panels = [(grp, lbl) for grp, lbl in [(plot_grp, "PLOT"), (bp_grp, "BP")] if grp]
@@ -2,7 +2,10 @@
 """
 Visualization functions for station room temperature QC.
 """
+from typing import Optional
+
 import matplotlib.pyplot as plt
+import pandas as pd
 
 from autogc_validation.qc.room_temp import StationTempResult, check_station_temp
 
@@ -13,6 +16,7 @@ def plot_station_temp(
     year: int,
     upper_threshold: float = 25,
     lower_threshold: float = 16,
+    temperatures: Optional[pd.Series] = None,
 ) -> StationTempResult:
     result = check_station_temp(
         station_name=station_name,
@@ -20,6 +24,7 @@ def plot_station_temp(
         year=year,
         upper_threshold=upper_threshold,
         lower_threshold=lower_threshold,
+        temperatures=temperatures,
     )
     ax = result.temperatures.plot(color="green", label="Acceptable")
     if not result.flagged.empty:
@@ -1,4 +1,4 @@
 # -*- coding: utf-8 -*-
 """QC analysis module for AutoGC validation."""
 
-__all__ = ["blanks", "precision", "recovery", "screening", "rt_outliers"]
+__all__ = ["blanks", "precision", "recovery", "screening", "rt_outliers", "rt_drift"]
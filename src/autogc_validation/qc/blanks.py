@@ -8,10 +8,11 @@ or a fixed concentration threshold.
 
 import logging
 
+import numpy as np
 import pandas as pd
 
 from autogc_validation.database.enums import SampleType
-from autogc_validation.qc.utils import get_compound_cols, align_period_index
+from autogc_validation.qc.utils import get_compound_cols, aligned_periods
 
 logger = logging.getLogger(__name__)
 
@@ -59,35 +60,18 @@ def compounds_above_mdl(
         return empty, empty
 
     compound_cols = get_compound_cols(blanks)
-    period_indices = align_period_index(blanks, mdl_periods)
-
-    mdl_rows = []
-    threshold_rows = []
-
-    for i, (timestamp, row) in enumerate(blanks.iterrows()):
-        effective_mdls = mdl_periods.iloc[period_indices[i]]
-
-        mdl_flags = {"filename": row["filename"]}
-        threshold_flags = {"filename": row["filename"]}
-
-        for code in compound_cols:
-            value = row[code]
-            if pd.isna(value):
-                mdl_flags[code] = 0
-                threshold_flags[code] = 0
-                continue
-
-            mdl_val = effective_mdls.get(code)
-            mdl_flags[code] = int(
-                mdl_val is not None and not pd.isna(mdl_val) and value > mdl_val
-            )
-            threshold_flags[code] = int(value > threshold_ppbc)
-
-        mdl_rows.append(mdl_flags)
-        threshold_rows.append(threshold_flags)
-
-    mdl_failures = pd.DataFrame(mdl_rows, index=blanks.index)
-    threshold_failures = pd.DataFrame(threshold_rows, index=blanks.index)
+    values = blanks[compound_cols].to_numpy(dtype=float, na_value=np.nan)
+    effective_mdls = aligned_periods(blanks, mdl_periods).matrix(compound_cols)
+
+    # NaN observations or missing MDLs compare False, i.e. not flagged.
+    with np.errstate(invalid="ignore"):
+        mdl_flags = (values > effective_mdls).astype(int)
+        threshold_flags = (values > threshold_ppbc).astype(int)
+
+    mdl_failures = pd.DataFrame(mdl_flags, index=blanks.index, columns=compound_cols)
+    threshold_failures = pd.DataFrame(threshold_flags, index=blanks.index, columns=compound_cols)
+    mdl_failures.insert(0, "filename", blanks["filename"].to_numpy())
+    threshold_failures.insert(0, "filename", blanks["filename"].to_numpy())
     mdl_failures.index.name = "date_time"
     threshold_failures.index.name = "date_time"
 
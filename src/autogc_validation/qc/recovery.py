@@ -9,10 +9,11 @@ outside the acceptable recovery window (70%–130%).
 
 import logging
 
+import numpy as np
 import pandas as pd
 
 from autogc_validation.database.enums import SampleType
-from autogc_validation.qc.utils import get_compound_cols, align_period_index
+from autogc_validation.qc.utils import get_compound_cols, aligned_periods
 
 _QC_SAMPLE_TYPES = {SampleType.CVS, SampleType.LCS, SampleType.RTS}
 
@@ -22,6 +23,22 @@ RECOVERY_LOWER_BOUND = 0.70
 RECOVERY_UPPER_BOUND = 1.30
 
 
+def _recovery_ratio(
+    qc_samples: pd.DataFrame,
+    canister_periods: pd.DataFrame,
+    compound_cols: list[int],
+) -> np.ndarray:
+    """Return observed / expected as a (samples x compounds) float array.
+
+    NaN where the observation or expected concentration is missing or the
+    expected concentration is zero.
+    """
+    observed = qc_samples[compound_cols].to_numpy(dtype=float, na_value=np.nan)
+    expected = aligned_periods(qc_samples, canister_periods).matrix(compound_cols)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(expected != 0, observed / expected, np.nan)
+
+
 def compute_recovery(
     qc_samples: pd.DataFrame,
     canister_periods: pd.DataFrame,
@@ -45,22 +62,10 @@ def compute_recovery(
         return pd.DataFrame(columns=["filename"])
 
     compound_cols = get_compound_cols(qc_samples)
-    period_indices = align_period_index(qc_samples, canister_periods)
-
-    rows = []
-    for i, (_, row) in enumerate(qc_samples.iterrows()):
-        effective_conc = canister_periods.iloc[period_indices[i]]
-        result: dict = {"filename": row["filename"]}
-        for code in compound_cols:
-            obs = row[code]
-            exp = effective_conc.get(code)
-            if pd.isna(obs) or exp is None or pd.isna(exp) or float(exp) == 0:
-                result[code] = float("nan")
-            else:
-                result[code] = float(obs) / float(exp) * 100.0
-        rows.append(result)
-
-    df = pd.DataFrame(rows, index=qc_samples.index)
+    recovery = _recovery_ratio(qc_samples, canister_periods, compound_cols) * 100.0
+
+    df = pd.DataFrame(recovery, index=qc_samples.index, columns=compound_cols)
+    df.insert(0, "filename", qc_samples["filename"].to_numpy())
     df.index.name = "date_time"
     return df
 
@@ -112,37 +117,16 @@ def check_qc_recovery(
         return pd.DataFrame(columns=["filename"])
 
     compound_cols = get_compound_cols(qc_samples)
-    period_indices = align_period_index(qc_samples, canister_periods)
-
-    result_rows = []
-
-    for i, (timestamp, row) in enumerate(qc_samples.iterrows()):
-        effective_conc = canister_periods.iloc[period_indices[i]]
-
-        flags = {"filename": row["filename"]}
-
-        for code in compound_cols:
-            observed = row[code]
-            expected = effective_conc.get(code)
-
-            if (pd.isna(observed)
-                    or expected is None
-                    or pd.isna(expected)
-                    or float(expected) == 0):
-                flags[code] = 0
-                continue
-
-            recovery = float(observed) / float(expected)
-            if recovery < RECOVERY_LOWER_BOUND:
-                flags[code] = -1
-            elif recovery > RECOVERY_UPPER_BOUND:
-                flags[code] = 1
-            else:
-                flags[code] = 0
+    recovery = _recovery_ratio(qc_samples, canister_periods, compound_cols)
 
-        result_rows.append(flags)
+    # Invalid recoveries are NaN and compare False, so they stay 0.
+    flags = np.zeros(recovery.shape, dtype=int)
+    with np.errstate(invalid="ignore"):
+        flags[recovery < RECOVERY_LOWER_BOUND] = -1
+        flags[recovery > RECOVERY_UPPER_BOUND] = 1
 
-    result = pd.DataFrame(result_rows, index=qc_samples.index)
+    result = pd.DataFrame(flags, index=qc_samples.index, columns=compound_cols)
+    result.insert(0, "filename", qc_samples["filename"].to_numpy())
     result.index.name = "date_time"
 
     n_failures = (result.drop(columns="filename") != 0).any(axis=1).sum()
@@ -5,11 +5,13 @@ Created on Fri Feb 27 11:24:42 2026
 @author: aengstrom
 """
 import calendar
-from typing import NamedTuple
+from pathlib import Path
+from typing import NamedTuple, Optional, Union
 
 import pandas as pd
 
-from autogc_validation.database.airvision.station_temp import query_av_rtemp
+from autogc_validation.database.airvision.cache import get_station_temperatures
+from autogc_validation.database.airvision.station_temp import Connector
 
 
 class StationTempResult(NamedTuple):
@@ -17,16 +19,74 @@ class StationTempResult(NamedTuple):
     flagged: pd.Series        # values outside acceptable thresholds
 
 
+def _month_range(month: int, year: int) -> tuple[pd.Timestamp, pd.Timestamp]:
+    _, num_days = calendar.monthrange(year, month)
+    start_date = pd.Timestamp(year=year, month=month, day=1)
+    end_date = pd.Timestamp(year=year, month=month, day=num_days, hour=23, minute=59, second=59)
+    return start_date, end_date
+
+
 def check_station_temp(
     station_name: str,
     month: int,
     year: int,
     upper_threshold: float = 25,
     lower_threshold: float = 16,
+    temperatures: Optional[pd.Series] = None,
+    connect: Optional[Connector] = None,
+    cache_path: Optional[Union[str, Path]] = None,
 ) -> StationTempResult:
-    _, num_days = calendar.monthrange(year, month)
-    start_date = pd.Timestamp(year=year, month=month, day=1)
-    end_date = pd.Timestamp(year=year, month=month, day=num_days, hour=23, minute=59, second=59)
-    temperatures = query_av_rtemp(start_date=start_date, end_date=end_date, site=station_name)
+    """Flag station room temperatures outside thresholds for one month.
+
+    Args:
+        station_name: AQS 2-letter site code.
+        month: Month number (1-12).
+        year: Year.
+        upper_threshold: Upper acceptable temperature (°C).
+        lower_threshold: Lower acceptable temperature (°C).
+        temperatures: Already-fetched minute temperatures for the month
+            (e.g. from gather_reference_data); read through the local
+            AirVision cache if None.
+        connect: AirVision connection factory, as for query_av_rtemp.
+        cache_path: AirVision cache file; the default cache if None.
+    """
+    if temperatures is None:
+        start_date, end_date = _month_range(month, year)
+        temperatures = get_station_temperatures(
+            start_date, end_date, [station_name], connect=connect, cache_path=cache_path,
+        )[station_name]
     mask = (temperatures > upper_threshold) | (temperatures < lower_threshold)
     return StationTempResult(temperatures=temperatures, flagged=temperatures[mask])
+
+
+def boundary_temp_readings(
+    station_name: str,
+    month: int,
+    year: int,
+    connect: Optional[Connector] = None,
+    cache_path: Optional[Union[str, Path]] = None,
+) -> tuple[Optional[pd.Timestamp], Optional[pd.Timestamp]]:
+    """Last temperature reading before a month and first reading after it.
+
+    These are the prior_temp/next_temp bounds for build_temp_null_lines.
+    The adjacent months are read through the local AirVision cache.
+
+    Returns:
+        (prior_temp, next_temp); either is None if there is no reading.
+    """
+    start_date, end_date = _month_range(month, year)
+    prev_start = start_date - pd.offsets.MonthBegin(1)
+    next_end = _month_range(*_next_month(month, year))[1]
+    temps = get_station_temperatures(
+        prev_start, next_end, [station_name], connect=connect, cache_path=cache_path,
+    )[station_name].dropna()
+    before = temps.index[temps.index < start_date]
+    after = temps.index[temps.index > end_date]
+    return (
+        before.max() if len(before) else None,
+        after.min() if len(after) else None,
+    )
+
+
+def _next_month(month: int, year: int) -> tuple[int, int]:
+    return (1, year + 1) if month == 12 else (month + 1, year)
@@ -0,0 +1,381 @@
+# -*- coding: utf-8 -*-
+"""
+Rolling retention time drift tracking anchored on reference compounds.
+
+Retention times drift slowly over weeks as columns age and carrier flows
+change, so a single monthly median (as used by detect_rt_outliers) either
+misses real misidentifications or flags the whole tail of a drifting month.
+This module tracks rolling medians/MADs per compound, uses the shift of the
+RT_REFERENCE_CODES anchors on each GC column to predict where every other
+compound on that column should elute, and flags samples whose RT breaks
+that locked relationship.
+
+The rolling statistics use an incremental sorted window rather than
+``rolling().apply``, which re-sorts every window: locating a value is a
+binary search, and each insert or removal shifts at most the window's
+length of list entries, so a step costs O(w) for a window of w samples
+instead of O(w log w).
+"""
+
+import bisect
+import logging
+import numbers
+from typing import Iterable, Union
+
+import numpy as np
+import pandas as pd
+
+from autogc_validation.database.enums import (
+    RT_REFERENCE_CODES,
+    ColumnType,
+    aqs_to_name,
+    get_column_type,
+)
+
+logger = logging.getLogger(__name__)
+
+_FLAG_COLUMNS = [
+    "date_time", "sample_type", "filename", "compound", "compound_name",
+    "rt", "expected_rt", "delta", "mad", "threshold",
+]
+
+
+class _SortedWindow:
+    """Sorted multiset supporting incremental insert/remove, median and MAD."""
+
+    def __init__(self):
+        self._values: list[float] = []
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def add(self, value: float) -> None:
+        bisect.insort(self._values, value)
+
+    def remove(self, value: float) -> None:
+        del self._values[bisect.bisect_left(self._values, value)]
+
+    def median(self) -> float:
+        s = self._values
+        n = len(s)
+        mid = n // 2
+        if n % 2:
+            return s[mid]
+        return (s[mid - 1] + s[mid]) / 2.0
+
+    def mad(self, median: float) -> float:
+        """Median absolute deviation from *median* without materializing deviations.
+
+        The deviations left of the median (read right-to-left) and right of
+        the median (read left-to-right) are two ascending sequences, so the
+        k-th smallest deviation is found by a binary search over the split.
+        """
+        n = len(self._values)
+        mid = n // 2
+        if n % 2:
+            return self._kth_deviation(median, mid)
+        return (self._kth_deviation(median, mid - 1) + self._kth_deviation(median, mid)) / 2.0
+
+    def _kth_deviation(self, median: float, k: int) -> float:
+        s = self._values
+        p = bisect.bisect_left(s, median)
+        n_left, n_right = p, len(s) - p
+
+        def left(i):
+            return median - s[p - 1 - i]
+
+        def right(j):
+            return s[p + j] - median
+
+        # Take i deviations from the left sequence and k + 1 - i from the right.
+        lo, hi = max(0, k + 1 - n_right), min(k + 1, n_left)
+        while lo <= hi:
+            i = (lo + hi) // 2
+            j = k + 1 - i
+            if i > 0 and j < n_right and left(i - 1) > right(j):
+                hi = i - 1
+            elif j > 0 and i < n_left and right(j - 1) > left(i):
+                lo = i + 1
+            else:
+                candidates = []
+                if i > 0:
+                    candidates.append(left(i - 1))
+                if j > 0:
+                    candidates.append(right(j - 1))
+                return max(candidates)
+        raise RuntimeError("Sorted window is inconsistent")  # pragma: no cover
+
+
+def rolling_median_mad(
+    values: Union[np.ndarray, pd.Series],
+    index: pd.DatetimeIndex | None = None,
+    window: Union[int, str, pd.Timedelta] = "7D",
+    min_periods: int = 5,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Compute trailing rolling median and MAD with an incremental sorted window.
+
+    Window semantics match ``pd.Series.rolling``: an integer window covers
+    the last *window* rows (including the current one), and a time window
+    covers rows in ``(t - window, t]``. NaN values occupy rows but are not
+    counted toward *min_periods*.
+
+    Args:
+        values: 1-D array of retention times.
+        index: Sorted DatetimeIndex aligned with *values*. Required for
+            time-based windows; ignored for integer windows.
+        window: Number of rows, or a Timedelta / offset string (e.g. '7D').
+        min_periods: Minimum number of non-NaN values in the window before
+            statistics are reported. Default 5.
+
+    Returns:
+        Tuple of (median, mad) float arrays the same length as *values*,
+        NaN where fewer than *min_periods* values are in the window.
+
+    Raises:
+        ValueError: If a time window is given without an index, the
+            index is not sorted ascending, or window is a bool.
+    """
+    arr = np.asarray(values, dtype=float)
+    n = len(arr)
+    medians = np.full(n, np.nan)
+    mads = np.full(n, np.nan)
+
+    if isinstance(window, bool):
+        raise ValueError(f"window must be a row count or a time offset, got {window!r}")
+    if isinstance(window, numbers.Integral):
+        # Row-count window: the row leaving is always i - window.
+        starts = np.maximum(np.arange(n) - window + 1, 0)
+    else:
+        if index is None:
+            raise ValueError("A DatetimeIndex is required for time-based windows")
+        if not index.is_monotonic_increasing:
+            raise ValueError("index must be sorted ascending")
+        starts = index.searchsorted(index - pd.Timedelta(window), side="right")
+
+    win = _SortedWindow()
+    left = 0
+    for i in range(n):
+        value = arr[i]
+        if value == value:  # not NaN
+            win.add(value)
+        while left < starts[i]:
+            leaving = arr[left]
+            if leaving == leaving:
+                win.remove(leaving)
+            left += 1
+        if len(win) >= min_periods:
+            med = win.median()
+            medians[i] = med
+            mads[i] = win.mad(med)
+
+    return medians, mads
+
+
+def _anchor_codes_by_column(
+    reference_codes: Iterable[int],
+) -> dict[ColumnType, list[int]]:
+    """Group reference codes by GC column."""
+    anchors: dict[ColumnType, list[int]] = {ColumnType.PLOT: [], ColumnType.BP: []}
+    for code in reference_codes:
+        anchors[get_column_type(code)].append(int(code))
+    return anchors
+
+
+def _predicted_shift(
+    compound_median: np.ndarray,
+    anchor_medians: list[np.ndarray],
+    anchor_shifts: list[np.ndarray],
+) -> np.ndarray:
+    """Interpolate the expected RT shift of a compound from its column anchors.
+
+    With two anchors the shift is linearly interpolated on median RT and
+    held at the nearest anchor's shift outside the bracket. With one anchor
+    (or when the other is missing for a sample) the shift is copied from the
+    available anchor. Samples with no usable anchor get a zero shift.
+    """
+    shift = np.zeros_like(compound_median)
+    if not anchor_medians:
+        return shift
+
+    if len(anchor_medians) == 1:
+        return np.nan_to_num(anchor_shifts[0], nan=0.0)
+
+    # Order anchors by their typical elution so m1 < m2 in the interpolation.
+    order = np.argsort([np.nanmedian(m) if np.isfinite(m).any() else np.inf for m in anchor_medians])
+    m1, m2 = (anchor_medians[i] for i in order[:2])
+    s1, s2 = (anchor_shifts[i] for i in order[:2])
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        weight = np.clip((compound_median - m1) / (m2 - m1), 0.0, 1.0)
+    both = np.isfinite(s1) & np.isfinite(s2) & np.isfinite(weight)
+    shift[both] = s1[both] + weight[both] * (s2[both] - s1[both])
+
+    only_1 = np.isfinite(s1) & ~both
+    only_2 = np.isfinite(s2) & ~both & ~only_1
+    shift[only_1] = s1[only_1]
+    shift[only_2] = s2[only_2]
+    return shift
+
+
+def predict_expected_rt(
+    df: pd.DataFrame,
+    compound_cols: list[int],
+    window: Union[int, str, pd.Timedelta] = "7D",
+    min_periods: int = 5,
+    reference_codes: Iterable[int] = RT_REFERENCE_CODES,
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Predict each compound's RT from its rolling median and the anchor shifts.
+
+    For every sample, each reference compound's shift is its observed RT
+    minus its rolling median. A compound's expected RT is its own rolling
+    median plus the shift interpolated from the anchors on the same GC
+    column. A reference compound is predicted from the *other* anchors on
+    its column only, so a single misidentified anchor is still caught.
+
+    The input should contain a single sample type — RT behaviour differs
+    between ambient and standard runs. Use :func:`detect_rt_drift` to
+    handle grouping.
+
+    Args:
+        df: Retention time DataFrame (Dataset.rt shape) for one sample type.
+        compound_cols: Integer AQS codes to predict.
+        window: Rolling window passed to :func:`rolling_median_mad`.
+        min_periods: Minimum non-NaN values before statistics are reported.
+        reference_codes: Anchor compounds. Default RT_REFERENCE_CODES.
+
+    Returns:
+        Tuple of (expected, mad) DataFrames indexed like *df* with one
+        column per compound in *compound_cols*.
+    """
+    df = df.sort_index()
+    index = df.index
+    anchors = _anchor_codes_by_column(c for c in reference_codes if c in df.columns)
+
+    stats: dict[int, tuple[np.ndarray, np.ndarray]] = {}
+    needed = set(compound_cols) | {c for codes in anchors.values() for c in codes}
+    for code in needed:
+        if code not in df.columns:
+            continue
+        stats[code] = rolling_median_mad(
+            df[code].to_numpy(dtype=float), index, window=window, min_periods=min_periods,
+        )
+
+    shifts = {
+        code: df[code].to_numpy(dtype=float) - stats[code][0]
+        for codes in anchors.values() for code in codes
+    }
+
+    expected = {}
+    mads = {}
+    for code in compound_cols:
+        if code not in stats:
+            continue
+        median, mad = stats[code]
+        try:
+            column_anchors = [a for a in anchors[get_column_type(code)] if a != code]
+        except ValueError:
+            column_anchors = []
+        shift = _predicted_shift(
+            median,
+            [stats[a][0] for a in column_anchors],
+            [shifts[a] for a in column_anchors],
+        )
+        expected[code] = median + shift
+        mads[code] = mad
+
+    return (
+        pd.DataFrame(expected, index=index),
+        pd.DataFrame(mads, index=index),
+    )
+
+
+def detect_rt_drift(
+    df: pd.DataFrame,
+    compound_cols: list[int],
+    window: Union[int, str, pd.Timedelta] = "7D",
+    sample_type_col: str = "sample_type",
+    filename_col: str = "filename",
+    k: float = 10.0,
+    min_abs_shift: float | None = None,
+    min_periods: int = 5,
+    reference_codes: Iterable[int] = RT_REFERENCE_CODES,
+) -> pd.DataFrame:
+    """Flag samples whose RT departs from the anchor-predicted RT.
+
+    Drift-aware counterpart to :func:`detect_rt_outliers`: instead of a
+    single median per sample type, each sample is compared with the RT
+    predicted by :func:`predict_expected_rt` over a trailing window. A
+    sample is flagged when ``|rt - expected_rt|`` exceeds ``k * MAD``
+    (and *min_abs_shift*, when given).
+
+    Args:
+        df: Dataset.rt DataFrame — DatetimeIndex, integer AQS code columns,
+            sample_type and filename columns.
+        compound_cols: Integer AQS codes to check. Use get_compound_cols(ds.rt)
+            for all compounds.
+        window: Rolling window (rows or Timedelta / offset string).
+            Default '7D'.
+        sample_type_col: Column name for sample type grouping.
+        filename_col: Column name for sample filenames.
+        k: MAD sensitivity multiplier. Default 10.0.
+        min_abs_shift: Optional minimum absolute RT shift required to flag.
+        min_periods: Minimum non-NaN values in the window before a sample
+            can be evaluated. Default 5.
+        reference_codes: Anchor compounds. Default RT_REFERENCE_CODES.
+
+    Returns:
+        DataFrame of flagged samples indexed by date_time with columns:
+            sample_type, filename, compound, compound_name, rt,
+            expected_rt, delta, mad, threshold.
+        Empty DataFrame (same columns) if nothing is flagged.
+    """
+    frames = []
+
+    for sample_type, group in df.groupby(sample_type_col):
+        group = group.sort_index()
+        expected, mads = predict_expected_rt(
+            group, compound_cols, window=window,
+            min_periods=min_periods, reference_codes=reference_codes,
+        )
+        filenames = (
+            group[filename_col].to_numpy() if filename_col in group.columns
+            else np.full(len(group), None)
+        )
+
+        for code in expected.columns:
+            rt = group[code].to_numpy(dtype=float)
+            exp = expected[code].to_numpy()
+            mad = mads[code].to_numpy()
+            delta = rt - exp
+            threshold = k * mad
+            if min_abs_shift is not None:
+                threshold = np.maximum(threshold, min_abs_shift)
+
+            with np.errstate(invalid="ignore"):
+                mask = (mad > 0) & (np.abs(delta) > threshold)
+            if not mask.any():
+                continue
+
+            frames.append(pd.DataFrame({
+                "date_time": group.index[mask],
+                "sample_type": sample_type,
+                "filename": filenames[mask],
+                "compound": code,
+                "compound_name": aqs_to_name(code),
+                "rt": rt[mask],
+                "expected_rt": exp[mask],
+                "delta": delta[mask],
+                "mad": mad[mask],
+                "threshold": threshold[mask],
+            }))
+
+    if not frames:
+        logger.info("RT drift check: no samples flagged")
+        return pd.DataFrame(columns=_FLAG_COLUMNS)
+
+    flagged = pd.concat(frames, ignore_index=True).sort_values("date_time")
+    logger.info(
+        "RT drift check: %d compound-sample(s) flagged across %d sample(s)",
+        len(flagged), flagged["date_time"].nunique(),
+    )
+    return flagged.set_index("date_time")
@@ -3,6 +3,8 @@
 Shared utilities for QC analysis modules.
 """
 
+import weakref
+from collections import OrderedDict
 from typing import Dict, Union
 
 import numpy as np
@@ -62,28 +64,119 @@ def get_compound_cols(df: pd.DataFrame) -> list[int]:
     ]
 
 
-def align_period_index(samples: pd.DataFrame, periods: pd.DataFrame) -> np.ndarray:
-    """Return integer array mapping each sample row to its applicable period row.
+class AlignedPeriods:
+    """Period rows (MDLs or canister concentrations) gathered onto sample rows.
 
-    For each sample timestamp, finds the most recent period row whose index
-    is <= the sample timestamp (backward fill).
+    Computes, once per (samples index, periods) pair, the period row that
+    applies to each sample and exposes the gathered values as NumPy arrays
+    aligned to the sample rows. Checks and plots use :meth:`matrix` instead
+    of looking up ``periods.iloc[...]`` row by row.
 
     Handles the case where the sample index is timezone-aware (MST, UTC-7,
     no DST) and the period index is timezone-naive (as stored in SQLite).
     The timezone is stripped from the sample index before comparison; both
     sides represent wall-clock MST time so the comparison is correct.
 
+    Instances returned by :func:`aligned_periods` are cached, so the
+    periods DataFrame should be treated as read-only once aligned.
+
+    Attributes:
+        positions: Integer array of length len(samples) giving the row
+            position in *periods* that applies to each sample.
+    """
+
+    def __init__(self, sample_index: pd.DatetimeIndex, periods: pd.DataFrame):
+        self._sample_ref = weakref.ref(sample_index)
+        self._periods_ref = weakref.ref(periods)
+        numeric = periods.select_dtypes(include="number")
+        self._column_pos = {col: i for i, col in enumerate(numeric.columns)}
+        self._values = numeric.to_numpy(dtype=float, na_value=np.nan)
+        self._matrices: Dict[tuple, np.ndarray] = {}
+
+        if len(periods) == 0:
+            self.positions = np.zeros(len(sample_index), dtype=np.intp)
+        else:
+            order = np.argsort(periods.index.to_numpy(), kind="stable")
+            period_dates = periods.index[order]
+            sample_dates = sample_index
+            if sample_dates.tz is not None and period_dates.tz is None:
+                sample_dates = sample_dates.tz_localize(None)
+            sorted_pos = period_dates.searchsorted(sample_dates, side="right") - 1
+            self.positions = order[np.clip(sorted_pos, 0, len(periods) - 1)]
+        self.positions.flags.writeable = False
+
+    def matches(self, sample_index: pd.Index, periods: pd.DataFrame) -> bool:
+        """True if this alignment was built from these exact objects."""
+        return self._sample_ref() is sample_index and self._periods_ref() is periods
+
+    def matrix(self, codes: list) -> np.ndarray:
+        """Return period values for *codes* gathered onto the sample rows.
+
+        Args:
+            codes: Period column labels (AQS codes) in the desired order.
+
+        Returns:
+            Read-only float array of shape (len(samples), len(codes)). Columns
+            for codes missing from the periods frame are all NaN.
+        """
+        key = tuple(codes)
+        if key not in self._matrices:
+            n = len(self.positions)
+            out = np.full((n, len(codes)), np.nan)
+            if len(self._values):
+                rows = self._values[self.positions]
+                for j, code in enumerate(codes):
+                    col = self._column_pos.get(code)
+                    if col is not None:
+                        out[:, j] = rows[:, col]
+            out.flags.writeable = False
+            self._matrices[key] = out
+        return self._matrices[key]
+
+
+_ALIGN_CACHE: "OrderedDict[tuple[int, int], AlignedPeriods]" = OrderedDict()
+_ALIGN_CACHE_SIZE = 32
+
+
+def aligned_periods(samples: pd.DataFrame, periods: pd.DataFrame) -> AlignedPeriods:
+    """Return the (cached) :class:`AlignedPeriods` for a samples/periods pair.
+
+    The cache is keyed on the identity of ``samples.index`` and *periods*,
+    so blanks, recovery and plotting calls on the same Dataset frame and
+    period query share one alignment.
+
+    Args:
+        samples: DataFrame with DatetimeIndex (tz-aware or tz-naive).
+        periods: Date-indexed wide concentrations DataFrame (tz-naive).
+
+    Returns:
+        AlignedPeriods for the pair.
+    """
+    key = (id(samples.index), id(periods))
+    cached = _ALIGN_CACHE.get(key)
+    if cached is not None and cached.matches(samples.index, periods):
+        _ALIGN_CACHE.move_to_end(key)
+        return cached
+
+    aligned = AlignedPeriods(samples.index, periods)
+    _ALIGN_CACHE[key] = aligned
+    if len(_ALIGN_CACHE) > _ALIGN_CACHE_SIZE:
+        _ALIGN_CACHE.popitem(last=False)
+    return aligned
+
+
+def align_period_index(samples: pd.DataFrame, periods: pd.DataFrame) -> np.ndarray:
+    """Return integer array mapping each sample row to its applicable period row.
+
+    For each sample timestamp, finds the most recent period row whose index
+    is <= the sample timestamp (backward fill). See :class:`AlignedPeriods`
+    for timezone handling.
+
     Args:
         samples: DataFrame with DatetimeIndex (tz-aware or tz-naive).
-        periods: Date-indexed wide concentrations DataFrame (sorted ascending,
-            tz-naive).
+        periods: Date-indexed wide concentrations DataFrame (tz-naive).
 
     Returns:
         Integer array of length len(samples), values in [0, len(periods)-1].
     """
-    period_dates = periods.index.sort_values()
-    sample_dates = samples.index
-    if sample_dates.tz is not None and period_dates.tz is None:
-        sample_dates = sample_dates.tz_localize(None)
-    positions = period_dates.searchsorted(sample_dates, side="right") - 1
-    return np.clip(positions, 0, len(periods) - 1)
+    return aligned_periods(samples, periods).positions
@@ -44,7 +44,7 @@ import pandas as pd
 from pathlib import Path
 
 from autogc_validation.dataset import Dataset
-from autogc_validation.database.operations import get_mdl_periods, get_canister_periods
+from autogc_validation.database.aio import load_reference_data
 from autogc_validation.database.enums import ConcentrationUnit
 from autogc_validation.qc.blanks import compounds_above_mdl
 from autogc_validation.qc.recovery import check_qc_recovery
@@ -71,10 +71,13 @@ end_date      = "{end_date}"
 ds = Dataset(data_dir)
 
 # ── MDL / canister periods ─────────────────────────────────────────────────────
-mdl_periods  = get_mdl_periods(database, site_id, start_date, end_date, ConcentrationUnit.PPBC)
-cvs_periods  = get_canister_periods(database, site_id, "CVS", start_date, end_date, ConcentrationUnit.PPBC)
-lcs_periods  = get_canister_periods(database, site_id, "LCS", start_date, end_date, ConcentrationUnit.PPBC)
-rts_periods  = get_canister_periods(database, site_id, "RTS", start_date, end_date, ConcentrationUnit.PPBC)
+# Queried concurrently in worker threads
+reference    = load_reference_data(database, site_id, start_date, end_date, ConcentrationUnit.PPBC)
+mdl_periods  = reference.mdl_periods
+canister_periods = reference.canister_periods
+cvs_periods  = canister_periods["CVS"]
+lcs_periods  = canister_periods["LCS"]
+rts_periods  = canister_periods["RTS"]
 
 # ── QC checks ─────────────────────────────────────────────────────────────────
 mdl_failures, threshold_failures = compounds_above_mdl(ds.blanks, mdl_periods)
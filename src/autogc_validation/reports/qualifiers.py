@@ -21,6 +21,7 @@ from autogc_validation.database.enums import (
     COLUMN_CALIBRANTS,
     aqs_to_name,
 )
+from autogc_validation.qc.room_temp import boundary_temp_readings
 
 logger = logging.getLogger(__name__)
 
@@ -421,6 +422,9 @@ def build_temp_null_lines(
     threshold: float = 30.0,
     prior_temp: pd.Timestamp | None = None,
     next_temp: pd.Timestamp | None = None,
+    station: str | None = None,
+    connect=None,
+    cache_path: str | Path | None = None,
 ) -> pd.DataFrame:
     """Build MDVR null lines for hours where station temperature exceeds the threshold.
 
@@ -439,6 +443,11 @@ def build_temp_null_lines(
         next_temp: Timestamp of the first temperature reading from the
             following month. Used as the right bound when the last hour of
             the month exceeds the threshold. Optional.
+        station: AQS 2-letter site code. If given, a missing prior_temp or
+            next_temp that is needed (first or last hour over threshold) is
+            looked up from the adjacent months in the local AirVision cache.
+        connect: AirVision connection factory for that lookup.
+        cache_path: AirVision cache file for that lookup; default if None.
 
     Returns:
         DataFrame with MDVR qualifier columns (code AE) ready for Excel export.
@@ -451,6 +460,17 @@ def build_temp_null_lines(
         logger.info("Temperature check: no hours exceeded %.1f°C", threshold)
         return pd.DataFrame(columns=_MDVR_COLUMNS)
 
+    needs_prior = prior_temp is None and fail.iloc[0] == 1
+    needs_next = next_temp is None and fail.iloc[-1] == 1
+    if station is not None and (needs_prior or needs_next):
+        month_start = hourly.index[0]
+        prior, following = boundary_temp_readings(
+            station, month_start.month, month_start.year,
+            connect=connect, cache_path=cache_path,
+        )
+        prior_temp = prior if needs_prior else prior_temp
+        next_temp = following if needs_next else next_temp
+
     proxy = pd.DataFrame(index=hourly.index)
     intervals = compute_failure_intervals(proxy, fail, prior_temp, next_temp)
 
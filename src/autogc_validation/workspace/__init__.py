@@ -8,26 +8,40 @@ extracting and organizing data files, and a two-phase orchestrator:
   1. ``create_workspace`` — creates the folder structure so the user
      can manually copy zipped files into ``temp/``.
   2. ``process_workspace`` — unzips, moves, and sorts the files
-     placed in ``temp/``.
+     placed in ``temp/``; re-running it processes only new or changed
+     files.
+
+:func:`run_month` runs either phase for several sites at once, one
+process per site. :mod:`~autogc_validation.workspace.watch` runs the
+unzip, move and sort steps on files as they arrive in ``temp/``.
 """
 
 import calendar
 import json
 import logging
+import os
 import re
 import shutil
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Union
+from typing import Iterable, Optional, Union
 
 import nbformat
+import pandas as pd
 from autogc_validation.database.enums import Sites
-from autogc_validation.workspace.folders import generate_monthly_folder_structure
+from autogc_validation.workspace.folders import generate_monthly_folder_structure, latest_workspace
+from autogc_validation.workspace.content_index import INDEX_FILENAME, ContentIndex
+from autogc_validation.workspace.manifest import Manifest
 from autogc_validation.workspace.files import (
+    ExtensionRoutes,
     unzip_files,
     move_dat_files,
     move_tx1_files,
+    move_cdf_files,
     move_files_by_week,
     rename_dattxt_files_to_txt,
     convert_folder_contents_to_pdf,
@@ -37,6 +51,21 @@ logger = logging.getLogger(__name__)
 
 _STATE_FILENAME = ".workspace_state.json"
 
+# Folders under Original/ for raw files (as created by move_dat_files etc.)
+_DAT_FOLDER = "original_dat_files"
+_TX1_FOLDER = "original_tx1_files"
+_CDF_FOLDER = "original_cdf_files"
+
+#: Steps of :func:`process_workspace`, in the order they run.
+PROCESS_STEPS = (
+    "unzip_files",
+    "move_dat_files",
+    "move_tx1_files",
+    "move_cdf_files",
+    "sort_by_week",
+    "convert_documents",
+)
+
 # Resolve database path relative to the project root (3 levels up from this file:
 # workspace/ -> autogc_validation/ -> src/ -> project root)
 _DBPATH = str(Path(__file__).parents[3] / "data" / "autogc.db")
@@ -52,6 +81,20 @@ def _serialize_summary(summary: Optional[dict]) -> Optional[dict]:
     }
 
 
+def _merge_summaries(first: Optional[dict], second: Optional[dict]) -> Optional[dict]:
+    """Combine two file-move summaries key by key."""
+    if first is None or second is None:
+        return first if second is None else second
+    empty = (0, [])
+    return {
+        key: (
+            first.get(key, empty)[0] + second.get(key, empty)[0],
+            first.get(key, empty)[1] + second.get(key, empty)[1],
+        )
+        for key in {**first, **second}
+    }
+
+
 def _deserialize_summary(data: Optional[dict]) -> Optional[dict]:
     """Convert a stored summary back to the (count, list) tuple format."""
     if data is None:
@@ -76,10 +119,13 @@ class WorkspaceResult:
     documents: Optional[list[Path]] = None
     dat_summary: Optional[dict] = None
     tx1_summary: Optional[dict] = None
+    cdf_summary: Optional[dict] = None
     week_counts: Optional[dict[str, int]] = None
     steps_completed: list[str] = field(default_factory=list)
     errors: list[str] = field(default_factory=list)
     step_timestamps: dict[str, str] = field(default_factory=dict)
+    step_durations: dict[str, float] = field(default_factory=dict)
+    step_bytes: dict[str, int] = field(default_factory=dict)
 
     def save(self) -> Path:
         """Save the workspace state to .workspace_state.json in base_dir.
@@ -100,10 +146,13 @@ class WorkspaceResult:
             "documents": [str(p) for p in self.documents] if self.documents else None,
             "dat_summary": _serialize_summary(self.dat_summary),
             "tx1_summary": _serialize_summary(self.tx1_summary),
+            "cdf_summary": _serialize_summary(self.cdf_summary),
             "week_counts": self.week_counts,
             "steps_completed": self.steps_completed,
             "errors": self.errors,
             "step_timestamps": self.step_timestamps,
+            "step_durations": self.step_durations,
+            "step_bytes": self.step_bytes,
             "saved_at": datetime.now().isoformat(),
         }
 
@@ -139,10 +188,13 @@ class WorkspaceResult:
             documents=[Path(p) for p in data["documents"]] if data.get("documents") else None,
             dat_summary=_deserialize_summary(data.get("dat_summary")),
             tx1_summary=_deserialize_summary(data.get("tx1_summary")),
+            cdf_summary=_deserialize_summary(data.get("cdf_summary")),
             week_counts=data.get("week_counts"),
             steps_completed=data.get("steps_completed", []),
             errors=data.get("errors", []),
             step_timestamps=data.get("step_timestamps", {}),
+            step_durations=data.get("step_durations", {}),
+            step_bytes=data.get("step_bytes", {}),
         )
         logger.info("Workspace state loaded from %s", state_path)
         return result
@@ -190,147 +242,248 @@ def create_workspace(
 
 
 def process_workspace(
-    workspace_dir: Union[str, Path], force = False
+    workspace_dir: Union[str, Path], force = False, placement: str = "copy",
+    steps: Optional[Iterable[str]] = None,
+    only: Optional[Iterable[Union[str, Path]]] = None,
 ) -> WorkspaceResult:
     """Phase 2: Unzip, move, and sort data files placed in ``temp/``.
 
-    Loads saved state from *workspace_dir* and runs any steps not yet
-    completed:
-
-      - ``unzip_files`` — unzip all .zip files found in temp/
-      - ``move_dat_files`` — move .dat files from temp/ to Original/
-      - ``move_tx1_files`` — move .tx1 files from temp/ to Original/
-      - ``sort_by_week`` — sort .dat files into FINAL/week N/ folders
+    Loads saved state from *workspace_dir* and runs each step on the
+    inputs that are new or changed since the last run, as recorded in the
+    workspace manifest (:mod:`~autogc_validation.workspace.manifest`).
+    Calling it again after more zips or loose files are dropped into
+    temp/ processes just those files:
+
+      - ``unzip_files`` — unzip new or changed .zip files in temp/,
+        writing .dat, .tx1 and .cdf members straight to Original/ and
+        office documents to temp/documents/; any other members are
+        extracted to temp/<zip name>/ as before
+      - ``move_dat_files`` — copy new loose .dat files from temp/ to Original/
+      - ``move_tx1_files`` — copy new loose .tx1 files from temp/ to Original/
+      - ``move_cdf_files`` — copy new loose .cdf files from temp/ to Original/
+      - ``sort_by_week`` — copy new Original/ .dat files into FINAL/week N/
+      - ``convert_documents`` — convert documents not yet in MDVR/ to PDF
+
+    Summaries and week counts accumulate across runs. The state file
+    records each step's duration and bytes processed for the last run.
+    Files already in FINAL/week N/ are never replaced unless *force* is
+    set, since analysts edit them during validation. A workspace that was
+    processed before but has no manifest has its files on disk recorded
+    as processed first.
 
     Args:
         workspace_dir: Path to the monthly validation folder created
             by :func:`create_workspace` (e.g. ``RB202601v1/``).
+        force: Forget the manifest and previous summaries and process
+            every input again, replacing the week files in FINAL/.
+        placement: How loose files and week folders are populated:
+            "copy", "hardlink", "reflink" or "symlink", falling back to a
+            copy where unsupported. Hard and symbolic links in FINAL/
+            share bytes with Original/, so prefer "reflink" there.
+        steps: Names of the steps to run (see :data:`PROCESS_STEPS`);
+            all of them if None.
+        only: Files in temp/ to consider for the unzip and loose-file
+            steps; every file in temp/ if None. Used by
+            :mod:`~autogc_validation.workspace.watch` to ingest just the
+            files that arrived.
 
     Returns:
         Updated WorkspaceResult with processing steps recorded.
+
+    Raises:
+        ValueError: If steps names an unknown step.
     """
-    result = WorkspaceResult.load(workspace_dir)
+    run_steps = PROCESS_STEPS if steps is None else tuple(steps)
+    unknown = set(run_steps) - set(PROCESS_STEPS)
+    if unknown:
+        raise ValueError(f"steps must be drawn from {PROCESS_STEPS}, got {sorted(unknown)}")
+    only = None if only is None else {Path(f).resolve() for f in only}
 
-    def _record_step(step_name: str) -> None:
-        result.steps_completed.append(step_name)
-        result.step_timestamps[step_name] = datetime.now().isoformat()
-        result.save()
+    def _selected(files: Iterable[Path]) -> list[Path]:
+        return [f for f in files if only is None or f.resolve() in only]
+
+    result = WorkspaceResult.load(workspace_dir)
 
     base_dir = result.base_dir
     temp_dir = base_dir / "temp"
     original_dir = base_dir / "Original"
     final_dir = base_dir / "FINAL"
+    # Content hashes persist in the workspace, so identical files delivered
+    # again (e.g. the same zip twice) are skipped without re-hashing.
+    content_index = ContentIndex(base_dir / INDEX_FILENAME)
+    manifest = Manifest(base_dir)
+    if force:
+        manifest.clear()
+        result.unzipped = result.week_counts = None
+        result.dat_summary = result.tx1_summary = result.cdf_summary = None
+    elif not manifest.loaded and set(result.steps_completed) & set(PROCESS_STEPS):
+        # Processed before, but the manifest is missing (an older workspace,
+        # or the file was lost): take what is already on disk as done
+        # rather than as new, so FINAL/ is not rebuilt over edited files.
+        seeded = manifest.seed(
+            f for f in (*temp_dir.rglob("*"), *original_dir.rglob("*"))
+            if f.is_file() and f.suffix.lower() in (".zip", ".dat", ".tx1", ".cdf")
+        )
+        manifest.save()
+        logger.warning(
+            "No workspace manifest; recorded %d file(s) already on disk as processed. "
+            "Use force=True to process everything again.", seeded,
+        )
+    succeeded: list[str] = []
 
-    # Step 2: Unzip files in temp/
-    if "unzip_files" not in result.steps_completed or force:
-        logger.info("Step 2: Unzipping files in temp/")
+    def _record_step(step_name: str, started: float, n_bytes: int) -> None:
+        if step_name not in result.steps_completed:
+            result.steps_completed.append(step_name)
+        result.step_timestamps[step_name] = datetime.now().isoformat()
+        result.step_durations[step_name] = round(time.perf_counter() - started, 3)
+        result.step_bytes[step_name] = n_bytes
+        succeeded.append(step_name)
+        manifest.save()
+        result.save()
+
+    def _record_loose(source: Path, key: str, target: Optional[Path]) -> None:
+        if target is not None:
+            manifest.record_file(source, [target], hash=content_index.hash(source).blake2b)
+
+    # Step 2: Unzip files in temp/, routing members to their final folders
+    if "unzip_files" in run_steps:
+        logger.info("Step 2: Unzipping new or changed archives in temp/")
+        started = time.perf_counter()
         try:
-            extracted = unzip_files(temp_dir, temp_dir, create_subfolders=True)
-            result.unzipped = extracted
-            _record_step("unzip_files")
-            logger.info("Step 2 complete: %d zip(s) extracted", len(extracted))
+            archives = manifest.changed(_selected(sorted(temp_dir.glob("*.zip"))))
+            members: dict[Path, list[Path]] = {archive: [] for archive in archives}
+            failed: set[Path] = set()
+
+            def _record_member(archive: Path, info, key: str, target: Optional[Path]) -> None:
+                if target is None:
+                    failed.add(archive)
+                    return
+                manifest.record_member(archive, info, [target])
+                members[archive].append(target)
+
+            documents_dir = temp_dir / "documents"
+            routes = ExtensionRoutes({
+                ".dat": original_dir / _DAT_FOLDER,
+                ".tx1": original_dir / _TX1_FOLDER,
+                ".cdf": original_dir / _CDF_FOLDER,
+                ".docx": documents_dir,
+                ".xlsx": documents_dir,
+                ".xlsm": documents_dir,
+            }, content_index=content_index, placed=_record_member)
+            extracted = unzip_files(
+                temp_dir, temp_dir, create_subfolders=True, skip_existing=True,
+                routes=routes, extract_unrouted=True, archives=archives,
+            ) if archives else []
+            # An archive with a failed member is not recorded, so it is retried
+            for archive in extracted:
+                if archive not in failed:
+                    manifest.record_file(archive, members[archive])
+
+            result.unzipped = sorted(set(result.unzipped or []) | set(extracted))
+            result.dat_summary = _merge_summaries(result.dat_summary, routes.summaries[".dat"])
+            result.tx1_summary = _merge_summaries(result.tx1_summary, routes.summaries[".tx1"])
+            result.cdf_summary = _merge_summaries(result.cdf_summary, routes.summaries[".cdf"])
+            _record_step("unzip_files", started, sum(a.stat().st_size for a in extracted))
+            logger.info("Step 2 complete: %d new or changed zip(s) extracted", len(extracted))
         except Exception as e:
             result.errors.append(f"unzip_files: {e}")
             logger.exception("Step 2 failed")
-    else:
-        logger.info("Step 2: Skipped (already completed)")
 
-    # Step 3: Move .dat files
-    dat_folder = None
-    if "move_dat_files" not in result.steps_completed or force:
-        logger.info("Step 3: Moving .dat files to Original/")
+    # Steps 3 and 4: Copy loose .dat, .tx1 and .cdf files
+    for step, number, ext, move in (
+        ("move_dat_files", "3", ".dat", move_dat_files),
+        ("move_tx1_files", "4", ".tx1", move_tx1_files),
+        ("move_cdf_files", "4b", ".cdf", move_cdf_files),
+    ):
+        if step not in run_steps:
+            continue
+        logger.info("Step %s: Copying new loose %s files to Original/", number, ext)
+        started = time.perf_counter()
         try:
-            dat_folder, dat_summary = move_dat_files(temp_dir, original_dir)
-            result.dat_summary = dat_summary
-            _record_step("move_dat_files")
-            logger.info(
-                "Step 3 complete: %d found, %d copied, %d duplicates",
-                dat_summary["found"][0],
-                dat_summary["copied"][0],
-                dat_summary["duplicates"][0],
+            loose = manifest.changed(_selected(
+                p for p in temp_dir.rglob("*") if p.suffix.lower() == ext and p.is_file()
+            ))
+            _, summary = move(
+                temp_dir, original_dir, content_index, placement,
+                paths=loose, placed=_record_loose,
             )
-        except Exception as e:
-            result.errors.append(f"move_dat_files: {e}")
-            logger.exception("Step 3 failed")
-    else:
-        logger.info("Step 3: Skipped (already completed)")
-        # Reconstruct dat_folder so step 5 can proceed
-        dat_folder = original_dir / "dat"
-        if not dat_folder.exists():
-            dat_folder = None
-
-    # Step 4: Move .tx1 files
-    if "move_tx1_files" not in result.steps_completed or force:
-        logger.info("Step 4: Moving .tx1 files to Original/")
-        try:
-            _, tx1_summary = move_tx1_files(temp_dir, original_dir)
-            result.tx1_summary = tx1_summary
-            _record_step("move_tx1_files")
+            # Adds the loose files to those routed out of the zips
+            if ext == ".dat":
+                summary = result.dat_summary = _merge_summaries(result.dat_summary, summary)
+            elif ext == ".tx1":
+                summary = result.tx1_summary = _merge_summaries(result.tx1_summary, summary)
+            else:
+                summary = result.cdf_summary = _merge_summaries(result.cdf_summary, summary)
+            _record_step(step, started, sum(p.stat().st_size for p in loose))
             logger.info(
-                "Step 4 complete: %d found, %d copied, %d duplicates",
-                tx1_summary["found"][0],
-                tx1_summary["copied"][0],
-                tx1_summary["duplicates"][0],
+                "Step %s complete: %d new, %d found, %d copied, %d duplicates in total",
+                number, len(loose),
+                summary["found"][0],
+                summary["copied"][0],
+                summary["duplicates"][0],
             )
         except Exception as e:
-            result.errors.append(f"move_tx1_files: {e}")
-            logger.exception("Step 4 failed")
-    else:
-        logger.info("Step 4: Skipped (already completed)")
+            result.errors.append(f"{step}: {e}")
+            logger.exception("Step %s failed", number)
 
-    # Step 5: Sort .dat files by week
-    if "sort_by_week" not in result.steps_completed or force:
-        if dat_folder:
-            logger.info("Step 5: Sorting .dat files into weekly folders")
-            try:
-                # Extract month/year from the base_dir name (e.g. RB202601v1)
-                dirname = base_dir.name
-                match = re.match(r".*(\d{4})(\d{2})v\d+$", dirname)
-                if not match:
-                    raise ValueError(
-                        f"Cannot parse year/month from folder name: {dirname}"
-                    )
-                year = int(match.group(1))
-                month = int(match.group(2))
+    content_index.save()
 
-                week_counts = move_files_by_week(
-                    dat_folder, final_dir, month, year,
+    # Step 5: Sort .dat files by week
+    dat_folder = original_dir / _DAT_FOLDER
+    if "sort_by_week" in run_steps and dat_folder.exists():
+        logger.info("Step 5: Sorting new .dat files into weekly folders")
+        started = time.perf_counter()
+        try:
+            # Extract month/year from the base_dir name (e.g. RB202601v1)
+            dirname = base_dir.name
+            match = re.match(r".*(\d{4})(\d{2})v\d+$", dirname)
+            if not match:
+                raise ValueError(
+                    f"Cannot parse year/month from folder name: {dirname}"
                 )
-                result.week_counts = week_counts
-                _record_step("sort_by_week")
-                logger.info("Step 5 complete: %s", week_counts)
-            except Exception as e:
-                result.errors.append(f"sort_by_week: {e}")
-                logger.exception("Step 5 failed")
-        else:
-            logger.warning("Step 5: Skipped (no dat folder available)")
-    else:
-        logger.info("Step 5: Skipped (already completed)")
+            year = int(match.group(1))
+            month = int(match.group(2))
+
+            new_dat = manifest.changed(f for f in dat_folder.iterdir() if f.is_file())
+            # Week files are edited during validation; only force replaces them
+            week_counts = move_files_by_week(
+                dat_folder, final_dir, month, year, placement=placement,
+                paths=new_dat, placed=_record_loose, overwrite=force,
+            )
+            previous = result.week_counts or {}
+            result.week_counts = {
+                week: previous.get(week, 0) + count for week, count in week_counts.items()
+            }
+            _record_step("sort_by_week", started, sum(f.stat().st_size for f in new_dat))
+            logger.info("Step 5 complete: %s", result.week_counts)
+        except Exception as e:
+            result.errors.append(f"sort_by_week: {e}")
+            logger.exception("Step 5 failed")
+    elif "sort_by_week" in run_steps:
+        logger.warning("Step 5: Skipped (no dat folder available)")
 
-    # Step 6: Convert documents in temp/ to PDF
-    if "convert_documents" not in result.steps_completed or force:
+    content_index.save()
+
+    # Step 6: Convert documents in temp/ to PDF (already converted ones
+    # are found by name and skipped)
+    if "convert_documents" in run_steps:
         logger.info("Step 6: Converting documents in temp/ to PDF")
+        started = time.perf_counter()
         try:
             documents_dir = base_dir / "MDVR"
             converted = convert_folder_contents_to_pdf(temp_dir, documents_dir)
             result.documents = converted
-            _record_step("convert_documents")
+            _record_step("convert_documents", started, sum(p.stat().st_size for p in converted))
             logger.info("Step 6 complete: %d document(s) converted", len(converted))
         except Exception as e:
             result.errors.append(f"convert_documents: {e}")
             logger.exception("Step 6 failed")
-    else:
-        logger.info("Step 6: Skipped (already completed)")
 
     # Final summary
-    total_steps = 5  # steps 2, 3, 4, 5, 6
-    completed_processing = len([
-        s for s in result.steps_completed if s != "create_folders"
-    ])
     logger.info(
         "Workspace processing complete: %d/%d steps succeeded",
-        completed_processing,
-        total_steps,
+        len(succeeded),
+        len(run_steps),
     )
     if result.errors:
         logger.warning("Errors: %s", result.errors)
@@ -545,15 +698,23 @@ def _generate_notebook(
         # --- Query MDL and canister periods ---
         nbformat.v4.new_markdown_cell("## 6. Query MDL and canister concentration periods"),
         nbformat.v4.new_code_cell(
-            "from autogc_validation.database.operations import (\n"
-            "    get_mdl_periods, get_canister_periods\n"
-            ")\n"
+            "from autogc_validation.database.aio import load_reference_data\n"
+            "from autogc_validation.database.conn import Session\n"
             "from autogc_validation.database.enums import ConcentrationUnit\n\n"
-            "mdl_periods = get_mdl_periods(database, site_id, start_date, end_date, ConcentrationUnit.PPBC)\n"
-            'print(f"MDL periods: {len(mdl_periods)} (changes on: {list(mdl_periods.index.date)})")\n\n'
-            'cvs_periods = get_canister_periods(database, site_id, "CVS", start_date, end_date, ConcentrationUnit.PPBC)\n'
-            'lcs_periods = get_canister_periods(database, site_id, "LCS", start_date, end_date, ConcentrationUnit.PPBC)\n'
-            'rts_periods = get_canister_periods(database, site_id, "RTS", start_date, end_date, ConcentrationUnit.PPBC)\n'
+            "# Read-only: never takes a write lock on the shared database.\n"
+            "# MDL, canister and AirVision temperature queries run concurrently;\n"
+            "# reference.temperatures is None if AirVision is unreachable.\n"
+            "with Session(database, read_only=True) as db:\n"
+            "    reference = load_reference_data(\n"
+            "        db, site_id, start_date, end_date, ConcentrationUnit.PPBC,\n"
+            f"        station='{site}',\n"
+            "    )\n"
+            "mdl_periods = reference.mdl_periods\n"
+            "canister_periods = reference.canister_periods\n\n"
+            'print(f"MDL periods: {len(mdl_periods)} (changes on: {list(mdl_periods.index.date)})")\n'
+            'cvs_periods = canister_periods["CVS"]\n'
+            'lcs_periods = canister_periods["LCS"]\n'
+            'rts_periods = canister_periods["RTS"]\n'
             'print(f"Canister periods — CVS: {len(cvs_periods)}, LCS: {len(lcs_periods)}, RTS: {len(rts_periods)}")'
         ),
 
@@ -652,10 +813,12 @@ def _generate_notebook(
             "# Temperature threshold for AE null qualification (°C).\n"
             "temp_null_threshold = 30.0\n\n"
             "# Optional: timestamps of the nearest temperature reading from adjacent months.\n"
-            "# Set if the first or last hour of the month exceeds the threshold.\n"
+            "# Left as None, they are looked up from the AirVision cache when needed.\n"
             "prior_temp = None\n"
             "next_temp  = None\n\n"
-            f"temp_result = plot_station_temp('{site}', {month}, {year}, upper_threshold=temp_null_threshold)\n"
+            "# Reuses the temperatures fetched in section 6 when available.\n"
+            f"temp_result = plot_station_temp('{site}', {month}, {year}, upper_threshold=temp_null_threshold,\n"
+            "                                temperatures=reference.temperatures)\n"
             "hourly_max = temp_result.temperatures.resample('h').max()\n"
             "n_over = int((hourly_max > temp_null_threshold).sum())\n"
             'print(f"Hours exceeding {temp_null_threshold}°C: {n_over}")'
@@ -666,6 +829,7 @@ def _generate_notebook(
             "    threshold=temp_null_threshold,\n"
             "    prior_temp=prior_temp,\n"
             "    next_temp=next_temp,\n"
+            f"    station='{site}',\n"
             ")\n"
             'print(f"Temperature null lines: {len(temp_null_lines)}")\n'
             "temp_null_lines"
@@ -868,6 +1032,40 @@ def _copy_mdvr_template(
     logger.info("Copied MDVR template to %s", dest)
 
 
+def _start_site(
+    site: str,
+    project_dir: Path,
+    year: int,
+    month: int,
+) -> WorkspaceResult:
+    """Set up one site's folders, workspace, notebook, checklist and MDVR."""
+    yyyymm = f"{year}{month:02d}"
+    logger.info("Starting month setup for site %s (%s)", site, yyyymm)
+
+    # Create site validation directory
+    validation_dir = project_dir / "validation" / site
+    validation_dir.mkdir(parents=True, exist_ok=True)
+
+    # Create site data directory
+    data_dir = project_dir / "data" / site / yyyymm
+    data_dir.mkdir(parents=True, exist_ok=True)
+
+    # Create workspace folder structure
+    result = create_workspace(validation_dir, site, year, month)
+    result.data_dir = data_dir
+    if result.base_dir is not None:
+        result.save()
+
+    # Generate notebook, checklist, and copy MDVR template
+    if result.base_dir is not None:
+        _generate_notebook(result, site, year, month)
+        _generate_checklist(result, site, year, month)
+        _copy_mdvr_template(result, site, year, month, project_dir)
+
+    logger.info("Site %s setup complete", site)
+    return result
+
+
 def start_month(
     sites: list[str],
     project_dir: Union[str, Path],
@@ -883,6 +1081,9 @@ def start_month(
       - Generates a pre-filled Jupyter notebook in the workspace
       - Copies ``templates/mdvr/{site}_MDVR_template.xlsx`` to the workspace
 
+    Sites are set up one after another; :func:`run_month` sets them up
+    in parallel.
+
     Args:
         sites: List of site name codes (e.g. ``["RB", "HW", "LP"]``).
         project_dir: Path to the autogc_validation project root.
@@ -893,33 +1094,231 @@ def start_month(
         Dict mapping site name to its WorkspaceResult.
     """
     project_dir = Path(project_dir)
-    yyyymm = f"{year}{month:02d}"
-    results: dict[str, WorkspaceResult] = {}
+    return {site: _start_site(site, project_dir, year, month) for site in sites}
+
 
-    for site in sites:
-        logger.info("Starting month setup for site %s (%s)", site, yyyymm)
+# ---------------------------------------------------------------------------
+# Multi-site orchestration
+# ---------------------------------------------------------------------------
 
-        # Create site validation directory
-        validation_dir = project_dir / "validation" / site
-        validation_dir.mkdir(parents=True, exist_ok=True)
+_RUN_PHASES = ("start", "process")
+_LOG_FORMAT = "%(asctime)s %(levelname)s %(name)s: %(message)s"
 
-        # Create site data directory
-        data_dir = project_dir / "data" / site / yyyymm
-        data_dir.mkdir(parents=True, exist_ok=True)
 
-        # Create workspace folder structure
-        result = create_workspace(validation_dir, site, year, month)
-        result.data_dir = data_dir
-        if result.base_dir is not None:
-            result.save()
+@dataclass
+class SiteRun:
+    """Outcome of :func:`run_month` for one site.
+
+    Attributes:
+        site: Site name code.
+        result: The site's WorkspaceResult, or None if it failed before
+            a workspace was available.
+        error: Exception message if the site's run raised, else None.
+        errors: Step errors recorded during this run. Errors kept in the
+            workspace state from earlier runs are left out.
+        seconds: Wall-clock time the site took.
+        log_path: File holding the site's log records.
+    """
+    site: str
+    result: Optional[WorkspaceResult] = None
+    error: Optional[str] = None
+    errors: list[str] = field(default_factory=list)
+    seconds: float = 0.0
+    log_path: Optional[Path] = None
 
-        # Generate notebook, checklist, and copy MDVR template
-        if result.base_dir is not None:
-            _generate_notebook(result, site, year, month)
-            _generate_checklist(result, site, year, month)
-            _copy_mdvr_template(result, site, year, month, project_dir)
+    @property
+    def ok(self) -> bool:
+        """True if the run raised nothing and recorded no step errors."""
+        return self.error is None and self.result is not None and not self.errors
 
-        results[site] = result
-        logger.info("Site %s setup complete", site)
 
-    return results
+@dataclass
+class MonthReport:
+    """Aggregated outcome of :func:`run_month` across sites."""
+    year: int
+    month: int
+    runs: dict[str, SiteRun] = field(default_factory=dict)
+    seconds: float = 0.0
+
+    @property
+    def failed(self) -> list[str]:
+        """Sites whose run raised or recorded step errors."""
+        return [site for site, run in self.runs.items() if not run.ok]
+
+    def summary(self) -> pd.DataFrame:
+        """One row per site: status, workspace, steps, files and timing."""
+        rows = []
+        for site, run in self.runs.items():
+            result = run.result
+            dat = (result.dat_summary or {}) if result else {}
+            rows.append({
+                "site": site,
+                "ok": run.ok,
+                "workspace": result.base_dir if result else None,
+                "steps_completed": len(result.steps_completed) if result else 0,
+                "dat_copied": dat.get("copied", (0, []))[0],
+                "dat_duplicates": dat.get("duplicates", (0, []))[0],
+                "errors": run.error or "; ".join(run.errors),
+                "seconds": round(run.seconds, 1),
+                "log": run.log_path,
+            })
+        return pd.DataFrame(rows).set_index("site") if rows else pd.DataFrame()
+
+
+@contextmanager
+def _site_log(path: Path):
+    """Send every log record to *path* only, restoring handlers afterwards.
+
+    Keeps concurrently running sites' records out of each other's logs.
+    """
+    root = logging.getLogger()
+    saved_handlers, saved_level = root.handlers[:], root.level
+    handler = logging.FileHandler(path, encoding="utf-8")
+    handler.setFormatter(logging.Formatter(_LOG_FORMAT))
+    root.handlers = [handler]
+    root.setLevel(logging.INFO)
+    try:
+        yield
+    finally:
+        root.handlers = saved_handlers
+        root.setLevel(saved_level)
+        handler.close()
+
+
+def _run_site(
+    site: str,
+    project_dir: Path,
+    year: int,
+    month: int,
+    phases: tuple[str, ...],
+    force: bool,
+    placement: str,
+) -> SiteRun:
+    """Run the requested phases for one site; module-level so it can be pickled."""
+    started = time.perf_counter()
+    validation_dir = project_dir / "validation" / site
+    validation_dir.mkdir(parents=True, exist_ok=True)
+    log_path = validation_dir / f"{site}{year}{month:02d}_run_month.log"
+    run = SiteRun(site=site, log_path=log_path)
+
+    with _site_log(log_path):
+        try:
+            if "start" in phases:
+                run.result = _start_site(site, project_dir, year, month)
+                run.errors.extend(run.result.errors)
+            if "process" in phases:
+                workspace = (
+                    run.result.base_dir if run.result is not None
+                    else latest_workspace(validation_dir, site, year, month)
+                )
+                if workspace is None:
+                    raise FileNotFoundError(
+                        f"No {site} workspace for {year}-{month:02d} under {validation_dir}"
+                    )
+                # The saved state keeps errors from earlier runs; only the
+                # ones added now count against this run.
+                try:
+                    known = len(WorkspaceResult.load(workspace).errors)
+                except FileNotFoundError:
+                    known = 0
+                run.result = process_workspace(workspace, force=force, placement=placement)
+                run.errors.extend(run.result.errors[known:])
+        except Exception as e:
+            logger.exception("Site %s failed", site)
+            run.error = f"{type(e).__name__}: {e}"
+
+    run.seconds = time.perf_counter() - started
+    return run
+
+
+def run_month(
+    sites: Optional[Iterable[str]],
+    project_dir: Union[str, Path],
+    year: int,
+    month: int,
+    phases: Iterable[str] = ("start",),
+    max_workers: Optional[int] = None,
+    force: bool = False,
+    placement: str = "copy",
+) -> MonthReport:
+    """Run workspace phases for many sites at once, one process per site.
+
+    Each site runs in its own worker process, so month-end setup takes
+    about as long as the slowest site. A site's log records go only to
+    ``validation/{site}/{site}{YYYYMM}_run_month.log``, and one site's
+    failure does not stop the others.
+
+    Phases:
+      - ``"start"`` — as :func:`start_month`: create the folders, a new
+        workspace version, the notebook, checklist and MDVR copy
+      - ``"process"`` — :func:`process_workspace` on the workspace just
+        created, or on the site's latest existing workspace for the month
+
+    Args:
+        sites: Site name codes (e.g. ``["RB", "HW"]``); None for every
+            site in :class:`~autogc_validation.database.enums.Sites`.
+        project_dir: Path to the autogc_validation project root.
+        year: Year.
+        month: Month number (1-12).
+        phases: Phases to run for each site, in the order above.
+        max_workers: Worker processes; defaults to one per site, capped
+            at the CPU count. 1 runs the sites one after another in this
+            process.
+        force: Passed to process_workspace.
+        placement: Passed to process_workspace.
+
+    Returns:
+        MonthReport with one SiteRun per site, in the order given.
+
+    Raises:
+        ValueError: If a site or phase is unknown, or phases is empty.
+    """
+    sites = [s.name for s in Sites] if sites is None else list(sites)
+    unknown = [s for s in sites if s not in Sites.__members__]
+    if unknown:
+        raise ValueError(f"Unknown site(s): {unknown}")
+    phases = list(phases)
+    unknown = [p for p in phases if p not in _RUN_PHASES]
+    if unknown:
+        raise ValueError(f"Unknown phase(s): {unknown}; expected {_RUN_PHASES}")
+    phases = tuple(p for p in _RUN_PHASES if p in phases)
+    if not phases:
+        raise ValueError(f"phases must name at least one of {_RUN_PHASES}")
+    project_dir = Path(project_dir)
+    report = MonthReport(year=year, month=month)
+    started = time.perf_counter()
+
+    args = [(site, project_dir, year, month, phases, force, placement) for site in sites]
+    workers = max(1, min(max_workers or os.cpu_count() or 1, len(sites)))
+    logger.info(
+        "Running %s for %d site(s) (%d-%02d) with %d worker(s)",
+        "/".join(phases), len(sites), year, month, workers,
+    )
+    if workers == 1:
+        runs = [_run_site(*a) for a in args]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(_run_site, *a) for a in args]
+            runs = []
+            for site, future in zip(sites, futures):
+                try:
+                    runs.append(future.result())
+                except Exception as e:
+                    # The worker process itself died
+                    runs.append(SiteRun(site=site, error=f"{type(e).__name__}: {e}"))
+
+    report.runs = {run.site: run for run in runs}
+    report.seconds = time.perf_counter() - started
+    for run in runs:
+        if run.ok:
+            logger.info("%s: done in %.1fs", run.site, run.seconds)
+        else:
+            logger.warning(
+                "%s: failed after %.1fs (%s); see %s",
+                run.site, run.seconds, run.error or run.errors, run.log_path,
+            )
+    logger.info(
+        "run_month finished in %.1fs: %d ok, %d failed",
+        report.seconds, len(runs) - len(report.failed), len(report.failed),
+    )
+    return report
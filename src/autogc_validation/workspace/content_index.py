@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+"""
+Content-hash index for duplicate detection.
+
+Files are identified by a BLAKE2b digest of their bytes (plus the CRC-32
+zip archives store for each member). Digests are cached by path, size and
+modification time, so a file is read again only after it changes, and the
+cache can be saved to the workspace so re-runs do not re-hash anything.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import zlib
+from pathlib import Path
+from typing import BinaryIO, NamedTuple, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+#: File name of the persisted index inside a workspace.
+INDEX_FILENAME = ".content_index.json"
+
+_DIGEST_SIZE = 16
+_CHUNK = 1024 * 1024
+
+
+class ContentHash(NamedTuple):
+    """Size, BLAKE2b hex digest and CRC-32 of some bytes."""
+    size: int
+    blake2b: str
+    crc32: int
+
+
+def hash_stream(stream: BinaryIO) -> ContentHash:
+    """Hash a binary stream to its end in one pass."""
+    digest = hashlib.blake2b(digest_size=_DIGEST_SIZE)
+    crc, size = 0, 0
+    while chunk := stream.read(_CHUNK):
+        digest.update(chunk)
+        crc = zlib.crc32(chunk, crc)
+        size += len(chunk)
+    return ContentHash(size, digest.hexdigest(), crc)
+
+
+class ContentIndex:
+    """Cache of file content hashes keyed by path, size and mtime.
+
+    Thread-safe; hashing happens outside the lock.
+
+    Args:
+        path: JSON file to load from and save to. None keeps the index
+            in memory only.
+    """
+
+    def __init__(self, path: Optional[Union[str, Path]] = None):
+        self.path = Path(path) if path is not None else None
+        self._lock = threading.Lock()
+        self._entries: dict[str, tuple[int, int, str, int]] = {}
+        self._dirty = False
+        if self.path is not None and self.path.exists():
+            try:
+                data = json.loads(self.path.read_text())
+                self._entries = {k: tuple(v) for k, v in data.get("files", {}).items()}
+                logger.debug("Loaded %d content hashes from %s", len(self._entries), self.path)
+            except (ValueError, TypeError):
+                logger.warning("Ignoring unreadable content index %s", self.path)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _key(self, file: Path) -> str:
+        file = Path(file).resolve()
+        if self.path is not None:
+            try:
+                return file.relative_to(self.path.parent.resolve()).as_posix()
+            except ValueError:
+                pass
+        return file.as_posix()
+
+    def hash(self, file: Union[str, Path]) -> ContentHash:
+        """Content hash of *file*, from the cache if it has not changed.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+        """
+        st = os.stat(file)
+        key = self._key(file)
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is not None and entry[0] == st.st_size and entry[1] == st.st_mtime_ns:
+            return ContentHash(entry[0], entry[2], entry[3])
+
+        with open(file, "rb") as f:
+            content = hash_stream(f)
+        with self._lock:
+            self._entries[key] = (st.st_size, st.st_mtime_ns, content.blake2b, content.crc32)
+            self._dirty = True
+        return content
+
+    def same_content(self, a: Union[str, Path], b: Union[str, Path]) -> bool:
+        """True if two files have identical bytes (by size and digest)."""
+        if os.stat(a).st_size != os.stat(b).st_size:
+            return False
+        return self.hash(a).blake2b == self.hash(b).blake2b
+
+    def save(self) -> Optional[Path]:
+        """Write the index to its JSON file if it changed.
+
+        Returns:
+            The index path, or None for an in-memory index.
+        """
+        if self.path is None:
+            return None
+        with self._lock:
+            if not self._dirty:
+                return self.path
+            # Drop entries for files that no longer exist
+            base = self.path.parent
+            files = {
+                key: list(entry) for key, entry in self._entries.items()
+                if (base / key).exists()
+            }
+            self._dirty = False
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        tmp.write_text(json.dumps({"version": 1, "files": files}))
+        os.replace(tmp, self.path)
+        logger.info("Content index saved: %d file(s) -> %s", len(files), self.path)
+        return self.path
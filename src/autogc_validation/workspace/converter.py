@@ -0,0 +1,388 @@
+# -*- coding: utf-8 -*-
+"""
+Document-to-PDF converters backed by LibreOffice.
+
+A converter has a ``workers`` attribute (how many documents it can convert
+at once), ``convert(src, dest)`` which writes *dest* as a PDF, and
+``close()``. Two implementations are provided:
+
+* :class:`LibreOfficePool` keeps long-lived headless ``soffice``
+  listeners and drives them over UNO, so LibreOffice's startup cost is
+  paid once per pool instead of once per document. It needs LibreOffice's
+  ``uno`` Python module.
+* :class:`SubprocessConverter` runs ``soffice --convert-to pdf`` per
+  document, as before.
+
+:func:`open_converter` returns a pool when it can start one and falls
+back to subprocesses otherwise. Every LibreOffice instance gets its own
+user profile, since instances sharing a profile block each other.
+"""
+
+import itertools
+import logging
+import os
+import queue
+import shutil
+import subprocess
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Optional, Union
+
+logger = logging.getLogger(__name__)
+
+#: Default number of documents converted at once.
+DEFAULT_CONVERT_WORKERS = 2
+
+#: LibreOffice export filter for each convertible extension.
+PDF_FILTERS = {
+    ".docx": "writer_pdf_Export",
+    ".xlsx": "calc_pdf_Export",
+    ".xlsm": "calc_pdf_Export",
+}
+
+_pipe_names = itertools.count()
+
+
+def _profile_arg(profile: Path) -> str:
+    return f"-env:UserInstallation={profile.resolve().as_uri()}"
+
+
+class _Profiles:
+    """A private temporary directory holding one user profile per worker.
+
+    Profiles are checked out and back in, so concurrent conversions never
+    share one, and each is reused once LibreOffice has initialised it.
+    """
+
+    def __init__(self, count: int):
+        self.root = Path(tempfile.mkdtemp(prefix="autogc-soffice-"))
+        self._free: "queue.Queue[Path]" = queue.Queue()
+        for i in range(count):
+            self._free.put(self.root / f"profile{i}")
+
+    def get(self) -> Path:
+        return self._free.get()
+
+    def put(self, profile: Path) -> None:
+        self._free.put(profile)
+
+    def cleanup(self) -> None:
+        shutil.rmtree(self.root, ignore_errors=True)
+
+
+class SubprocessConverter:
+    """Converts each document with its own ``soffice --headless`` process.
+
+    Args:
+        soffice_path: Path to the LibreOffice soffice executable.
+        workers: Number of conversions allowed to run at once.
+        timeout: Seconds to wait for one conversion.
+
+    Raises:
+        FileNotFoundError: If soffice_path does not exist.
+    """
+
+    def __init__(
+        self,
+        soffice_path: Union[str, Path],
+        workers: int = 1,
+        timeout: float = 300.0,
+    ):
+        self.soffice = Path(soffice_path)
+        if not self.soffice.exists():
+            raise FileNotFoundError(f"LibreOffice not found: {self.soffice}")
+        self.workers = max(1, workers)
+        self.timeout = timeout
+        self._profiles = _Profiles(self.workers)
+
+    def __enter__(self) -> "SubprocessConverter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def convert(self, src: Path, dest: Path) -> None:
+        """Convert *src* to the PDF *dest*.
+
+        Raises:
+            RuntimeError: If soffice fails or produces no PDF.
+        """
+        profile = self._profiles.get()
+        try:
+            with tempfile.TemporaryDirectory(dir=self._profiles.root) as outdir:
+                try:
+                    subprocess.run(
+                        [str(self.soffice), _profile_arg(profile), "--headless",
+                         "--convert-to", "pdf", "--outdir", outdir, str(src)],
+                        check=True, capture_output=True, text=True, timeout=self.timeout,
+                    )
+                except subprocess.CalledProcessError as e:
+                    raise RuntimeError(f"Failed to convert {src} to PDF: {e.stderr}")
+                except subprocess.TimeoutExpired:
+                    raise RuntimeError(f"Timed out converting {src} to PDF")
+
+                produced = Path(outdir) / f"{src.stem}.pdf"
+                if not produced.exists():
+                    raise RuntimeError(f"Converted PDF not found: {produced}")
+                shutil.move(str(produced), str(dest))
+        finally:
+            self._profiles.put(profile)
+
+    def close(self) -> None:
+        """Remove the temporary user profiles."""
+        self._profiles.cleanup()
+
+
+class _Instance:
+    """One headless soffice listener and its UNO desktop."""
+
+    def __init__(self, soffice: Path, profile: Path, start_timeout: float):
+        import uno
+        from com.sun.star.connection import NoConnectException
+
+        self.profile = profile
+        self.pipe = f"autogc_{os.getpid()}_{next(_pipe_names)}"
+        self.process = subprocess.Popen(
+            [str(soffice), _profile_arg(profile), "--headless", "--invisible",
+             "--nologo", "--nodefault", "--norestore", "--nolockcheck",
+             f"--accept=pipe,name={self.pipe};urp;StarOffice.ComponentContext"],
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        )
+        local = uno.getComponentContext()
+        resolver = local.ServiceManager.createInstanceWithContext(
+            "com.sun.star.bridge.UnoUrlResolver", local
+        )
+        deadline = time.monotonic() + start_timeout
+        while True:
+            try:
+                context = resolver.resolve(
+                    f"uno:pipe,name={self.pipe};urp;StarOffice.ComponentContext"
+                )
+                break
+            except NoConnectException:
+                if self.process.poll() is not None or time.monotonic() > deadline:
+                    self.terminate()
+                    raise RuntimeError("LibreOffice listener did not start")
+                time.sleep(0.25)
+        self.desktop = context.ServiceManager.createInstanceWithContext(
+            "com.sun.star.frame.Desktop", context
+        )
+        logger.debug("Started LibreOffice listener %s (pid %d)", self.pipe, self.process.pid)
+
+    @property
+    def alive(self) -> bool:
+        return self.process.poll() is None
+
+    def convert(self, src: Path, dest: Path) -> None:
+        import uno
+
+        def props(**values):
+            out = []
+            for name, value in values.items():
+                prop = uno.createUnoStruct("com.sun.star.beans.PropertyValue")
+                prop.Name, prop.Value = name, value
+                out.append(prop)
+            return tuple(out)
+
+        document = self.desktop.loadComponentFromURL(
+            src.resolve().as_uri(), "_blank", 0, props(Hidden=True, ReadOnly=True)
+        )
+        if document is None:
+            raise RuntimeError(f"LibreOffice could not open {src}")
+        try:
+            document.storeToURL(
+                dest.resolve().as_uri(), props(FilterName=PDF_FILTERS[src.suffix.lower()])
+            )
+        finally:
+            document.close(True)
+
+    def terminate(self) -> None:
+        if getattr(self, "desktop", None) is None:
+            self.process.kill()
+        try:
+            if self.alive:
+                self.desktop.terminate()
+        except Exception:
+            pass
+        try:
+            self.process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            self.process.kill()
+            self.process.wait()
+
+
+class LibreOfficePool:
+    """Long-lived headless LibreOffice instances converting over UNO.
+
+    Each conversion borrows an idle instance, so up to ``workers``
+    documents convert at once. An instance that crashes, or is killed
+    because a conversion took longer than ``timeout``, is restarted for
+    the next document; if every instance has died and none can be
+    restarted, the pool converts with a :class:`SubprocessConverter`.
+
+    Args:
+        soffice_path: Path to the LibreOffice soffice executable.
+        workers: Number of LibreOffice instances to start.
+        start_timeout: Seconds to wait for each instance to accept
+            connections.
+        timeout: Seconds to wait for one conversion before the instance
+            is killed.
+
+    Raises:
+        FileNotFoundError: If soffice_path does not exist.
+        ImportError: If LibreOffice's ``uno`` module cannot be imported.
+        RuntimeError: If an instance fails to start.
+    """
+
+    def __init__(
+        self,
+        soffice_path: Union[str, Path],
+        workers: int = DEFAULT_CONVERT_WORKERS,
+        start_timeout: float = 60.0,
+        timeout: float = 300.0,
+    ):
+        self.soffice = Path(soffice_path)
+        if not self.soffice.exists():
+            raise FileNotFoundError(f"LibreOffice not found: {self.soffice}")
+        import uno  # noqa: F401  (fail fast, before starting processes)
+
+        self.workers = max(1, workers)
+        self.start_timeout = start_timeout
+        self.timeout = timeout
+        self._profiles = _Profiles(self.workers)
+        self._idle: "queue.Queue[_Instance]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._instances: list[_Instance] = []
+        self._fallback: Optional[SubprocessConverter] = None
+        try:
+            for _ in range(self.workers):
+                self._start(self._profiles.get())
+        except BaseException:
+            self.close()
+            raise
+        logger.info("Started %d LibreOffice instance(s)", self.workers)
+
+    def __enter__(self) -> "LibreOfficePool":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _start(self, profile: Path) -> _Instance:
+        instance = _Instance(self.soffice, profile, self.start_timeout)
+        with self._lock:
+            self._instances.append(instance)
+        self._idle.put(instance)
+        return instance
+
+    def _restart(self, instance: _Instance) -> None:
+        logger.warning("LibreOffice instance %s died; restarting", instance.pipe)
+        with self._lock:
+            self._instances.remove(instance)
+        instance.terminate()
+        try:
+            self._start(instance.profile)
+        except Exception:
+            with self._lock:
+                left = len(self._instances)
+            logger.exception("Could not restart LibreOffice; %d instance(s) left", left)
+
+    def _checkout(self) -> Optional[_Instance]:
+        """Wait for an idle instance; None once no instances are left."""
+        while True:
+            with self._lock:
+                if not self._instances:
+                    return None
+            try:
+                # Re-check periodically, since the last instance may die
+                # while this thread waits.
+                return self._idle.get(timeout=1.0)
+            except queue.Empty:
+                continue
+
+    def _subprocess_converter(self) -> SubprocessConverter:
+        with self._lock:
+            if self._fallback is None:
+                logger.warning("No LibreOffice instances left; converting with subprocesses")
+                self._fallback = SubprocessConverter(self.soffice, self.workers, self.timeout)
+            return self._fallback
+
+    def convert(self, src: Path, dest: Path) -> None:
+        """Convert *src* to the PDF *dest* on the next idle instance.
+
+        Raises:
+            RuntimeError: If LibreOffice cannot open or export the file, or
+                does not finish within the timeout.
+        """
+        instance = self._checkout()
+        if instance is None:
+            self._subprocess_converter().convert(src, dest)
+            return
+
+        # UNO calls have no timeout of their own, so a hung instance is
+        # killed, which makes the pending call fail.
+        timed_out = threading.Event()
+
+        def kill() -> None:
+            timed_out.set()
+            instance.process.kill()
+
+        watchdog = threading.Timer(self.timeout, kill)
+        watchdog.daemon = True
+        watchdog.start()
+        error = None
+        try:
+            instance.convert(src, dest)
+        except Exception as e:
+            error = e
+        finally:
+            watchdog.cancel()
+
+        if timed_out.is_set() or not instance.alive:
+            self._restart(instance)
+        else:
+            self._idle.put(instance)
+        if error is not None:
+            if timed_out.is_set():
+                raise RuntimeError(f"Timed out converting {src} to PDF") from error
+            raise RuntimeError(f"Failed to convert {src} to PDF: {error}") from error
+
+    def close(self) -> None:
+        """Shut down every instance and remove their profiles."""
+        with self._lock:
+            instances, self._instances = self._instances, []
+            fallback, self._fallback = self._fallback, None
+        for instance in instances:
+            instance.terminate()
+        if fallback is not None:
+            fallback.close()
+        self._profiles.cleanup()
+
+
+def open_converter(
+    soffice_path: Union[str, Path],
+    workers: int = DEFAULT_CONVERT_WORKERS,
+    timeout: float = 300.0,
+):
+    """Start a :class:`LibreOfficePool`, or a SubprocessConverter if that fails.
+
+    Args:
+        soffice_path: Path to the LibreOffice soffice executable.
+        workers: Number of documents to convert at once.
+        timeout: Seconds to wait for one conversion.
+
+    Returns:
+        A converter; close it (or use it as a context manager) when done.
+
+    Raises:
+        FileNotFoundError: If soffice_path does not exist.
+    """
+    try:
+        return LibreOfficePool(soffice_path, workers, timeout=timeout)
+    except FileNotFoundError:
+        raise
+    except Exception as e:
+        logger.info("LibreOffice pool unavailable (%s); converting with subprocesses", e)
+    return SubprocessConverter(soffice_path, workers, timeout)
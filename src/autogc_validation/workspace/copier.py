@@ -0,0 +1,193 @@
+# -*- coding: utf-8 -*-
+"""
+Parallel file copy engine for the workspace steps.
+
+Copying a month of data to or from a network share is latency-bound, so
+:func:`copy_files` runs copies on a thread pool. The bytes being copied
+at once are capped, so a few large files cannot fill memory or saturate
+the link. Transient OS errors are retried, and an optional callback
+reports progress as bytes complete.
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Iterable, NamedTuple, Optional
+
+from autogc_validation.workspace.placement import place_file
+
+logger = logging.getLogger(__name__)
+
+#: Default number of files copied at once.
+DEFAULT_COPY_WORKERS = 8
+
+#: Default cap on the total size of files being copied at once.
+DEFAULT_IN_FLIGHT_BYTES = 256 * 1024 * 1024
+
+#: Called as progress(bytes_copied, total_bytes) after each file.
+ProgressCallback = Callable[[int, int], None]
+
+
+class CopyJob(NamedTuple):
+    """One file to place at a target path."""
+    src: Path
+    dst: Path
+
+
+class CopyOutcome(NamedTuple):
+    """Result of one CopyJob.
+
+    Attributes:
+        job: The job.
+        placement: Strategy actually used, or None if the copy failed.
+        error: The last exception raised, or None on success.
+        attempts: Number of attempts made.
+    """
+    job: CopyJob
+    placement: Optional[str]
+    error: Optional[BaseException]
+    attempts: int
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class _ByteBudget:
+    """Blocks acquire() until the requested bytes fit under the limit.
+
+    A request larger than the limit is admitted once nothing else is in
+    flight, so oversized files still get copied, one at a time.
+    """
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self._in_flight = 0
+        self._cond = threading.Condition()
+
+    def acquire(self, size: int) -> None:
+        with self._cond:
+            self._cond.wait_for(
+                lambda: self._in_flight == 0 or self._in_flight + size <= self.limit
+            )
+            self._in_flight += size
+
+    def release(self, size: int) -> None:
+        with self._cond:
+            self._in_flight -= size
+            self._cond.notify_all()
+
+
+def _file_size(path: Path) -> int:
+    try:
+        return path.stat().st_size
+    except OSError:
+        return 0
+
+
+def copy_files(
+    jobs: Iterable[CopyJob],
+    placement: str = "copy",
+    max_workers: int = DEFAULT_COPY_WORKERS,
+    max_in_flight_bytes: int = DEFAULT_IN_FLIGHT_BYTES,
+    retries: int = 2,
+    retry_delay: float = 0.5,
+    progress: Optional[ProgressCallback] = None,
+) -> list[CopyOutcome]:
+    """Place every job's source file at its target, in parallel.
+
+    Failures are returned, not raised, so one bad file does not stop the
+    batch.
+
+    Args:
+        jobs: Files to copy; each target's parent folder must exist.
+        placement: "copy", "hardlink", "reflink" or "symlink", as for
+            :func:`~autogc_validation.workspace.placement.place_file`.
+        max_workers: Files copied at once; 1 copies sequentially.
+        max_in_flight_bytes: Cap on the combined size of files being
+            copied at once.
+        retries: Extra attempts after an OSError other than
+            FileNotFoundError.
+        retry_delay: Seconds before the first retry, doubling each time.
+        progress: Optional callback called as progress(bytes_copied,
+            total_bytes) as each file finishes, failed files included.
+
+    Returns:
+        One CopyOutcome per job, in job order.
+    """
+    jobs = [CopyJob(Path(src), Path(dst)) for src, dst in jobs]
+    sizes = [_file_size(job.src) for job in jobs]
+    total = sum(sizes)
+    budget = _ByteBudget(max_in_flight_bytes)
+    done_lock = threading.Lock()
+    done = 0
+    # Jobs writing the same target run one after another in one worker, in
+    # job order, so the last one wins as in a sequential copy.
+    groups: dict[Path, list[int]] = {}
+    for i, job in enumerate(jobs):
+        groups.setdefault(job.dst, []).append(i)
+
+    def run(job: CopyJob, size: int) -> CopyOutcome:
+        nonlocal done
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                used = place_file(job.src, job.dst, placement)
+                outcome = CopyOutcome(job, used, None, attempt)
+                break
+            except FileNotFoundError as e:
+                outcome = CopyOutcome(job, None, e, attempt)
+                break
+            except OSError as e:
+                if attempt > retries:
+                    outcome = CopyOutcome(job, None, e, attempt)
+                    break
+                logger.warning(
+                    "Copy of %s failed (%s); retrying in %.1fs",
+                    job.src.name, e, retry_delay * 2 ** (attempt - 1),
+                )
+                time.sleep(retry_delay * 2 ** (attempt - 1))
+            except Exception as e:
+                outcome = CopyOutcome(job, None, e, attempt)
+                break
+        with done_lock:
+            done += size
+            if progress is not None:
+                progress(done, total)
+        return outcome
+
+    def run_group(indices: list[int], size: int) -> list[CopyOutcome]:
+        try:
+            return [run(jobs[i], sizes[i]) for i in indices]
+        finally:
+            budget.release(size)
+
+    outcomes: list[Optional[CopyOutcome]] = [None] * len(jobs)
+    if max_workers <= 1 or len(groups) <= 1:
+        for indices in groups.values():
+            size = sum(sizes[i] for i in indices)
+            budget.acquire(size)
+            for i, outcome in zip(indices, run_group(indices, size)):
+                outcomes[i] = outcome
+    else:
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = []
+            for indices in groups.values():
+                size = sum(sizes[i] for i in indices)
+                # Blocks submission until the files fit in the byte budget.
+                budget.acquire(size)
+                futures.append((indices, pool.submit(run_group, indices, size)))
+            for indices, future in futures:
+                for i, outcome in zip(indices, future.result()):
+                    outcomes[i] = outcome
+
+    failed = [o for o in outcomes if not o.ok]
+    logger.debug(
+        "Copied %d file(s), %d bytes, %d failed", len(outcomes) - len(failed), total, len(failed)
+    )
+    for outcome in failed:
+        logger.error("Error copying %s: %s", outcome.job.src.name, outcome.error)
+    return outcomes
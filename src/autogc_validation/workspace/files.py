@@ -10,13 +10,28 @@ import calendar
 import logging
 import os
 import shutil
-import subprocess
+import threading
 import zipfile
+import zlib
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Tuple, Union
-
-from autogc_validation.workspace.parsing import assert_local_drive, parse_dat_file, letter_to_number
+from typing import Callable, Iterable, Mapping, Optional, Tuple, Union
+
+from autogc_validation.workspace.content_index import ContentHash, ContentIndex, hash_stream
+from autogc_validation.workspace.converter import (
+    DEFAULT_CONVERT_WORKERS,
+    SubprocessConverter,
+    open_converter,
+)
+from autogc_validation.workspace.copier import (
+    DEFAULT_COPY_WORKERS,
+    CopyJob,
+    ProgressCallback,
+    copy_files,
+)
+from autogc_validation.workspace.placement import PLACEMENT_STRATEGIES
+from autogc_validation.workspace.parsing import assert_local_drive, scan_dat_files
 
 logger = logging.getLogger(__name__)
 
@@ -25,35 +40,322 @@ logger = logging.getLogger(__name__)
 # Unzip
 # ---------------------------------------------------------------------------
 
-def unzip_files(source_directory: os.PathLike, 
-                destination_directory: os.PathLike, 
-                delete_zip_after_extract: bool =False, 
-                create_subfolders: bool=True, 
-                allow_network_drive: bool = False)->list[Path]:
+#: Buffer size for streaming zip members to disk.
+_COPY_BUFFER = 1024 * 1024
+
+#: Keys of the file-move summaries, each mapping to (count, list_of_filenames).
+_SUMMARY_KEYS = ("found", "copied", "duplicates", "identical", "errors")
+
+#: Default number of archives extracted at once.
+DEFAULT_UNZIP_WORKERS = 4
+
+#: Called as placed(source, key, target) for each file handled by a move
+#: step: key is the summary key (or week name) and target the file now
+#: holding the source's bytes, or None if it failed.
+PlacedCallback = Callable[[Path, str, Optional[Path]], None]
+
+#: Called as placed(archive, info, key, target) for each routed zip member.
+MemberPlacedCallback = Callable[[Path, zipfile.ZipInfo, str, Optional[Path]], None]
+
+
+def _member_target(extract_path: Path, filename: str) -> Optional[Path]:
+    """Safe destination for a zip member, or None if it would escape extract_path.
+
+    Mirrors zipfile's sanitizing: absolute paths, drive letters and '..'
+    components are dropped.
     """
-    Unzips all zip files in a source directory to a destination directory,
-    preserving the original modification dates.
-    
-    Parameters:
-    source_directory (str): Path to the directory containing zip files
-    destination_directory (str): Path where extracted files should be saved
-    delete_zip_after_extract (bool): Whether to delete the zip file after extraction
-    create_subfolders (bool): Whether to create subfolders for each zip file
-    
+    parts = [
+        part for part in filename.replace("\\", "/").split("/")
+        if part not in ("", ".", "..") and not part.endswith(":")
+    ]
+    if not parts:
+        return None
+    return extract_path.joinpath(*parts)
+
+
+def _crc32(path: Path) -> int:
+    crc = 0
+    with open(path, "rb") as f:
+        while chunk := f.read(_COPY_BUFFER):
+            crc = zlib.crc32(chunk, crc)
+    return crc
+
+
+def _is_same_file(target: Path, info: zipfile.ZipInfo) -> bool:
+    """True if *target* already holds this member (same size and CRC-32)."""
+    try:
+        if target.stat().st_size != info.file_size:
+            return False
+    except FileNotFoundError:
+        return False
+    return _crc32(target) == info.CRC
+
+
+def _files_by_stem(folders: list[Path]) -> dict[str, list[Path]]:
+    """Map lowercase stem -> files with that stem in the given folders."""
+    by_stem: dict[str, list[Path]] = {}
+    for folder in folders:
+        if folder.is_dir():
+            for f in folder.iterdir():
+                if f.is_file():
+                    by_stem.setdefault(f.stem.lower().strip(), []).append(f)
+    return by_stem
+
+
+def _identical_file(candidates: list[Path], content: ContentHash, index: ContentIndex) -> Optional[Path]:
+    """First candidate whose bytes match *content*, or None."""
+    for candidate in candidates:
+        try:
+            if candidate.stat().st_size == content.size and index.hash(candidate).blake2b == content.blake2b:
+                return candidate
+        except FileNotFoundError:
+            continue
+    return None
+
+
+class ExtensionRoutes:
+    """Extension-to-folder routing table for :func:`unzip_files`.
+
+    Zip members with a routed extension are written straight into that
+    extension's folder (flattened to the file name) instead of the
+    extraction folder. As in :func:`move_files_by_extension`, a member
+    whose stem is already present in the folder goes into its ``copies``
+    subfolder — unless a content index is given and a file with that stem
+    already holds identical bytes, in which case the member is skipped.
+    Safe to share between extraction threads.
+
+    After extraction, :attr:`summaries` holds one summary per extension
+    in the move_files_by_extension format.
+
+    Args:
+        routes: Mapping of extension (e.g. ".dat") to destination folder.
+            Several extensions may share a folder.
+        content_index: Optional ContentIndex for identical-file detection.
+        placed: Optional callback called as placed(archive, info, key,
+            target) for every routed member, where target is the file
+            holding its bytes (None on error). Called from extraction
+            threads.
+    """
+
+    def __init__(
+        self,
+        routes: Mapping[str, Union[str, Path]],
+        content_index: Optional[ContentIndex] = None,
+        placed: Optional[MemberPlacedCallback] = None,
+    ):
+        self.destinations = {ext.lower(): Path(dest) for ext, dest in routes.items()}
+        self.content_index = content_index
+        self.placed = placed
+        self._lock = threading.Lock()
+        self._stem_locks: dict[tuple[Path, str], threading.Lock] = {}
+        self._files: dict[Path, dict[str, list[Path]]] = {}
+        self._written: set[Path] = set()
+        self._records = {
+            ext: {key: [] for key in _SUMMARY_KEYS}
+            for ext in self.destinations
+        }
+        for dest in set(self.destinations.values()):
+            (dest / "copies").mkdir(parents=True, exist_ok=True)
+            self._files[dest] = _files_by_stem([dest, dest / "copies"])
+
+    def extension(self, filename: str) -> Optional[str]:
+        """The routed extension of *filename*, or None if it is not routed."""
+        ext = Path(filename).suffix.lower()
+        return ext if ext in self.destinations else None
+
+    def _stem_lock(self, dest: Path, stem: str) -> threading.Lock:
+        with self._lock:
+            return self._stem_locks.setdefault((dest, stem), threading.Lock())
+
+    def _record(
+        self, ext: str, key: str, name: str,
+        zip_ref: zipfile.ZipFile, info: zipfile.ZipInfo, target: Optional[Path],
+    ) -> None:
+        with self._lock:
+            self._records[ext]["found"].append(name)
+            self._records[ext][key].append(name)
+        if self.placed is not None:
+            self.placed(Path(zip_ref.filename), info, key, target)
+
+    def extract(
+        self,
+        zip_ref: zipfile.ZipFile,
+        info: zipfile.ZipInfo,
+        ext: str,
+        name: str,
+        skip_existing: bool = False,
+    ) -> Optional[Path]:
+        """Write one routed member to its folder and record it in the summary.
+
+        Members sharing a stem are handled one at a time, so parallel
+        archives never race for the same destination.
+
+        Returns:
+            Path written, or None if the member was skipped or failed.
+        """
+        dest = self.destinations[ext]
+        stem = Path(name).stem.lower().strip()
+        primary = dest / name
+
+        with self._stem_lock(dest, stem):
+            existing = self._files[dest].get(stem, [])
+            if skip_existing and _is_same_file(primary, info):
+                # Written earlier in this run by another archive: a resent
+                # duplicate. Otherwise it is left over from a previous run.
+                key = "identical" if primary in self._written else "copied"
+                self._record(ext, key, name, zip_ref, info, primary)
+                logger.debug("%s - unchanged, skipped", info.filename)
+                return None
+
+            if existing and self.content_index is not None:
+                with zip_ref.open(info) as src:
+                    content = hash_stream(src)
+                match = _identical_file(existing, content, self.content_index)
+                if match is not None:
+                    self._record(ext, "identical", name, zip_ref, info, match)
+                    logger.debug("%s - identical to %s, skipped", info.filename, match.name)
+                    return None
+
+            target = primary if not existing else dest / "copies" / name
+            try:
+                target.parent.mkdir(parents=True, exist_ok=True)
+                with zip_ref.open(info) as src, open(target, "wb") as dst:
+                    shutil.copyfileobj(src, dst, _COPY_BUFFER)
+            except Exception:
+                logger.exception("Error extracting %s", info.filename)
+                self._record(ext, "errors", name, zip_ref, info, None)
+                return None
+
+            self._files[dest].setdefault(stem, []).append(target)
+            self._written.add(target)
+            if existing:
+                self._record(ext, "duplicates", name, zip_ref, info, target)
+                logger.info("Duplicate: %s -> copies/", name)
+            else:
+                self._record(ext, "copied", name, zip_ref, info, target)
+            return target
+
+    @property
+    def summaries(self) -> dict[str, dict]:
+        """Per-extension summary: found, copied, duplicates, identical, errors -> (count, names)."""
+        with self._lock:
+            return {
+                ext: {key: (len(names), list(names)) for key, names in records.items()}
+                for ext, records in self._records.items()
+            }
+
+
+def _extract_archive(
+    zip_file: Path,
+    extract_path: Path,
+    skip_existing: bool,
+    routes: Optional[ExtensionRoutes] = None,
+    extract_unrouted: bool = True,
+) -> tuple[int, int]:
+    """Stream every member of one archive to disk.
+
+    Members with a routed extension go to their route folder; the rest go
+    under *extract_path* (or are ignored if extract_unrouted is False).
+    Modification dates are restored in one pass after all members are
+    written.
+
     Returns:
-    list: List of successfully extracted zip files
+        (extracted, skipped) member counts.
     """
-    
+    extracted, skipped = 0, 0
+    timestamps: list[tuple[Path, float]] = []
+
+    with zipfile.ZipFile(zip_file, 'r') as zip_ref:
+        for info in zip_ref.infolist():
+            target = _member_target(extract_path, info.filename)
+            if target is None:
+                logger.warning("Skipping unsafe member %s in %s", info.filename, zip_file.name)
+                continue
+            ext = routes.extension(target.name) if routes is not None and not info.is_dir() else None
+
+            if ext is not None:
+                target = routes.extract(zip_ref, info, ext, target.name, skip_existing)
+                if target is None:
+                    skipped += 1
+                    continue
+            elif not extract_unrouted:
+                continue
+            elif info.is_dir():
+                target.mkdir(parents=True, exist_ok=True)
+                continue
+            elif skip_existing and _is_same_file(target, info):
+                skipped += 1
+                logger.debug("%s - unchanged, skipped", info.filename)
+                continue
+            else:
+                target.parent.mkdir(parents=True, exist_ok=True)
+                with zip_ref.open(info) as src, open(target, "wb") as dst:
+                    shutil.copyfileobj(src, dst, _COPY_BUFFER)
+                logger.debug("%s - extracted", info.filename)
+
+            timestamps.append((target, datetime(*info.date_time).timestamp()))
+            extracted += 1
+
+    # Preserve the original modification dates
+    for target, timestamp in timestamps:
+        os.utime(target, (timestamp, timestamp))
+
+    return extracted, skipped
+
+
+def unzip_files(source_directory: os.PathLike,
+                destination_directory: os.PathLike,
+                delete_zip_after_extract: bool = False,
+                create_subfolders: bool = True,
+                allow_network_drive: bool = False,
+                max_workers: Optional[int] = None,
+                skip_existing: bool = False,
+                routes: Optional[Union[ExtensionRoutes, Mapping[str, Union[str, Path]]]] = None,
+                extract_unrouted: bool = True,
+                archives: Optional[Iterable[Union[str, Path]]] = None) -> list[Path]:
+    """Unzip all zip files in a directory, preserving modification dates.
+
+    Archives are extracted in parallel, one worker per archive, except
+    that archives sharing an extraction folder (create_subfolders=False)
+    are extracted one after another. Members are streamed to disk in
+    large buffered chunks.
+
+    With *routes*, members are sorted by extension into their final folders
+    during extraction, replacing a separate move_files_by_extension pass::
+
+        routes = ExtensionRoutes({".dat": dat_dir, ".tx1": tx1_dir})
+        unzip_files(temp_dir, temp_dir, routes=routes, extract_unrouted=False)
+        dat_summary = routes.summaries[".dat"]
+
+    Args:
+        source_directory: Directory containing zip files.
+        destination_directory: Where extracted files are saved.
+        delete_zip_after_extract: Delete each zip file after extraction.
+        create_subfolders: Extract each zip into a subfolder named after it.
+        allow_network_drive: Allow operation on network drives.
+        max_workers: Archives extracted at once; defaults to
+            DEFAULT_UNZIP_WORKERS. 1 extracts serially.
+        skip_existing: Leave members whose target file already exists
+            with the same size and CRC-32 untouched.
+        routes: ExtensionRoutes (or a plain extension -> folder mapping)
+            sending members with those extensions straight to their folder.
+            Pass an ExtensionRoutes to read its summaries afterwards.
+        extract_unrouted: Also extract members that are not routed.
+        archives: Extract only these zip files instead of every zip in
+            source_directory.
+
+    Returns:
+        List of successfully extracted zip files, in directory order.
+    """
+
     # Convert to Path objects for easier handling
     source_directory_path = Path(source_directory)
     destination_directory_path = Path(destination_directory)
-    
+
     #Check if paths are on a network location
     for path in [source_directory_path, destination_directory_path]:
         assert_local_drive(path, allow_network_drive)
-                
-    
-    # Check if source directory exists
+
     # --- Validate source directory ---
     if not source_directory_path.exists():
         logger.error(f"Source directory does not exist: {source_directory}")
@@ -71,73 +373,78 @@ def unzip_files(source_directory: os.PathLike,
     # Create destination directory if it doesn't exist
     destination_directory_path.mkdir(parents=True, exist_ok=True)
     logger.info(f"Destination directory: {destination_directory_path}")
-    
+
+    if routes is not None and not isinstance(routes, ExtensionRoutes):
+        routes = ExtensionRoutes(routes)
+
     # Find all zip files in source directory
-    zip_files = list(source_directory_path.glob("*.zip"))    
+    if archives is None:
+        zip_files = sorted(source_directory_path.glob("*.zip"))
+    else:
+        zip_files = sorted(Path(a) for a in archives)
     if not zip_files:
         logger.info(f"No zip files found in {source_directory_path}")
         return []
     logger.info(f"Found {len(zip_files)} zip file(s) in source directory")
-    
-    successfully_extracted: list[Path] = []
-    
-    for zip_file in zip_files:
+
+    def extract_path_for(zip_file: Path) -> Path:
+        if create_subfolders:
+            return destination_directory_path / zip_file.stem
+        return destination_directory_path
+
+    def process(zip_file: Path) -> bool:
         try:
-            logger.info("\nProcessing: %s",zip_file.name)
-            
-            # Determine extraction path
-            if create_subfolders:
-                extract_folder_name = zip_file.stem
-                extract_path = destination_directory_path / extract_folder_name
-            else:
-                extract_path = destination_directory_path
-            
-            # Create extraction directory if it doesn't exist
-            extract_path.mkdir(parents=True, exist_ok = True)
-            logger.info("Extracting to: %s", extract_path)
-            
-            # Extract the zip file with date preservation
-            with zipfile.ZipFile(zip_file, 'r') as zip_ref:
-                file_list = zip_ref.namelist()
-                logger.info("Found %s file(s) in zip",len(file_list))
-                
-                # Extract each file individually to preserve modification dates
-                for file_info in zip_ref.infolist():
-                    # Extract the file
-                    zip_ref.extract(file_info, extract_path)
-                    
-                    # Get the full path to the extracted file
-                    extracted_file_path = extract_path / file_info.filename
-                    
-                    # Preserve the original modification date
-                    if not file_info.is_dir():
-                        date_time = file_info.date_time
-                        timestamp = datetime(*date_time).timestamp()
-                        os.utime(extracted_file_path, (timestamp, timestamp))
-                        
-                    logger.info("%s -(mod date preserved)",file_info.filename)
-                
-                logger.info("Successfully extracted %s file(s)",len(file_list))
-            
-            successfully_extracted.append(zip_file)
-            
+            extract_path = extract_path_for(zip_file)
+            extracted, skipped = _extract_archive(
+                zip_file, extract_path, skip_existing, routes, extract_unrouted,
+            )
+            logger.info(
+                "%s: extracted %d file(s), skipped %d unchanged -> %s",
+                zip_file.name, extracted, skipped, extract_path,
+            )
+
             # Delete zip file if requested
             if delete_zip_after_extract:
                 zip_file.unlink()
-                logger.info("Deleted original zip file: %s",zip_file.name)
-                
+                logger.info("Deleted original zip file: %s", zip_file.name)
+            return True
+
         except zipfile.BadZipFile:
             logger.exception("Error: %s is not a valid zip file", zip_file.name)
         except PermissionError:
             logger.exception("Error: Permission denied when processing %s", zip_file.name)
         except Exception as e:
             logger.exception("Error processing %s: %s", zip_file.name, e)
-    
-    logger.info("""\n=== Summary ===
-                Total zip files processed: %s
-                Successfully extracted: %s
-                """, len(zip_files), len(successfully_extracted))
-    
+        return False
+
+    # Archives extracting unrouted members into the same folder run one
+    # after another in sorted order, so same-named members never race and
+    # the last archive wins, as in a serial run. Routed members are
+    # serialised by ExtensionRoutes.
+    groups: dict[Path, list[Path]] = {}
+    for zip_file in zip_files:
+        key = extract_path_for(zip_file) if extract_unrouted else zip_file
+        groups.setdefault(key, []).append(zip_file)
+
+    def process_group(group: list[Path]) -> list[bool]:
+        return [process(zip_file) for zip_file in group]
+
+    workers = max(1, min(max_workers or DEFAULT_UNZIP_WORKERS, len(groups)))
+    if workers == 1:
+        outcomes = dict(zip(zip_files, process_group(zip_files)))
+    else:
+        outcomes = {}
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="unzip") as pool:
+            for group, results in zip(groups.values(), pool.map(process_group, groups.values())):
+                outcomes.update(zip(group, results))
+
+    successfully_extracted = [z for z in zip_files if outcomes[z]]
+
+    logger.info(
+        "Unzip summary: %d zip file(s) processed, %d extracted successfully",
+        len(zip_files), len(successfully_extracted),
+    )
+
     return successfully_extracted
 
 
@@ -151,10 +458,19 @@ def move_files_by_extension(
     ext: str,
     dump_folder_name: str,
     allow_network_drive: bool = False,
+    content_index: Optional[ContentIndex] = None,
+    placement: str = "copy",
+    max_workers: int = DEFAULT_COPY_WORKERS,
+    progress: Optional[ProgressCallback] = None,
+    paths: Optional[Iterable[Union[str, Path]]] = None,
+    placed: Optional[PlacedCallback] = None,
 ) -> Tuple[Path, dict]:
     """Copy files of a given extension from source to destination.
 
-    Duplicates (by stem) are placed in a 'copies' subfolder.
+    Duplicates (by stem) are placed in a 'copies' subfolder. With a
+    content index, a duplicate whose bytes match a file already in the
+    output or copies folder is skipped instead. Where each file goes is
+    decided first, in a single pass; the copies then run in parallel.
 
     Args:
         source_directory: Directory to search recursively.
@@ -162,12 +478,25 @@ def move_files_by_extension(
         ext: File extension to match (e.g. ".dat", ".tx1").
         dump_folder_name: Name of the subfolder to create in destination.
         allow_network_drive: Allow operation on network drives.
+        content_index: Optional ContentIndex for identical-file detection;
+            pass a persisted one so re-runs do not re-hash files.
+        placement: How files are placed: "copy", "hardlink", "reflink" or
+            "symlink" (see :func:`~autogc_validation.workspace.placement.place_file`).
+        max_workers: Files copied at once.
+        progress: Optional callback called as progress(bytes_copied,
+            total_bytes) as files finish.
+        paths: Copy only these files instead of every matching file
+            under source_directory.
+        placed: Optional callback called as placed(source, key, target)
+            for every file, where key is its summary key.
 
     Returns:
         Tuple of (output_folder_path, summary_dict).
-        Summary dict has keys: found, copied, duplicates, errors —
-        each mapping to (count, list_of_filenames).
+        Summary dict has keys: found, copied, duplicates, identical,
+        errors — each mapping to (count, list_of_filenames).
     """
+    if placement not in PLACEMENT_STRATEGIES:
+        raise ValueError(f"placement must be one of {PLACEMENT_STRATEGIES}, got {placement!r}")
     src = Path(source_directory).resolve()
     dest = Path(destination_directory).resolve()
 
@@ -182,16 +511,18 @@ def move_files_by_extension(
     output_folder.mkdir(mode=0o755, exist_ok=True)
     copies_folder.mkdir(mode=0o755, exist_ok=True)
 
-    file_paths = [p for p in src.rglob("*") if p.suffix.lower() == ext.lower()]
+    candidates = src.rglob("*") if paths is None else (Path(p) for p in paths)
+    file_paths = [p for p in candidates if p.suffix.lower() == ext.lower()]
     logger.info("Found %d %s files under %s", len(file_paths), ext, src)
 
+    existing = _files_by_stem([output_folder, copies_folder])
     existing_stems = {
         f.stem.lower().strip() for f in output_folder.iterdir() if f.is_file()
     }
 
-    copied, duplicates, errors = 0, 0, 0
-    copied_lst, duplicates_lst, errors_lst = [], [], []
+    records = {key: [] for key in _SUMMARY_KEYS if key != "found"}
 
+    jobs, job_keys = [], []
     for path in file_paths:
         try:
             dest_path = output_folder / path.name
@@ -200,46 +531,87 @@ def move_files_by_extension(
 
             stem = path.stem.lower().strip()
             if stem not in existing_stems:
-                shutil.copy2(path, output_folder)
+                target_folder, key = output_folder, "copied"
                 existing_stems.add(stem)
-                copied += 1
-                copied_lst.append(path.name)
             else:
-                shutil.copy2(path, copies_folder)
-                duplicates += 1
-                duplicates_lst.append(path.name)
+                if content_index is not None:
+                    match = _identical_file(existing.get(stem, []), content_index.hash(path), content_index)
+                    if match is not None:
+                        records["identical"].append(path.name)
+                        logger.debug("Identical: %s matches %s, skipped", path.name, match.name)
+                        if placed is not None:
+                            placed(path, "identical", match)
+                        continue
+                target_folder, key = copies_folder, "duplicates"
                 logger.info("Duplicate: %s -> copies/", path.name)
+
+            jobs.append(CopyJob(path, target_folder / path.name))
+            job_keys.append(key)
+            # Not copied yet, so later files are compared with the source
+            existing.setdefault(stem, []).append(path)
         except Exception:
             logger.exception("Error copying %s", path.name)
-            errors += 1
-            errors_lst.append(path.name)
-
-    summary = {
-        "found": (len(file_paths), [p.name for p in file_paths]),
-        "copied": (copied, copied_lst),
-        "duplicates": (duplicates, duplicates_lst),
-        "errors": (errors, errors_lst),
-    }
+            records["errors"].append(path.name)
+            if placed is not None:
+                placed(path, "errors", None)
+
+    outcomes = copy_files(jobs, placement, max_workers=max_workers, progress=progress)
+    for outcome, key in zip(outcomes, job_keys):
+        key = key if outcome.ok else "errors"
+        records[key].append(outcome.job.src.name)
+        if placed is not None:
+            placed(outcome.job.src, key, outcome.job.dst if outcome.ok else None)
+
+    summary = {"found": (len(file_paths), [p.name for p in file_paths])}
+    summary.update({key: (len(names), names) for key, names in records.items()})
 
     logger.info(
-        "%s copy complete: %d found, %d copied, %d duplicates, %d errors",
-        ext, len(file_paths), copied, duplicates, errors,
+        "%s copy complete: %d found, %d copied, %d duplicates, %d identical, %d errors",
+        ext, len(file_paths), *(len(names) for names in records.values()),
     )
     return output_folder, summary
 
 
 def move_dat_files(
     src: Union[str, Path], dest: Union[str, Path],
+    content_index: Optional[ContentIndex] = None,
+    placement: str = "copy",
+    paths: Optional[Iterable[Union[str, Path]]] = None,
+    placed: Optional[PlacedCallback] = None,
 ) -> Tuple[Path, dict]:
     """Copy .dat files from source to destination."""
-    return move_files_by_extension(src, dest, ".dat", "original_dat_files")
+    return move_files_by_extension(
+        src, dest, ".dat", "original_dat_files",
+        content_index=content_index, placement=placement, paths=paths, placed=placed,
+    )
 
 
 def move_tx1_files(
     src: Union[str, Path], dest: Union[str, Path],
+    content_index: Optional[ContentIndex] = None,
+    placement: str = "copy",
+    paths: Optional[Iterable[Union[str, Path]]] = None,
+    placed: Optional[PlacedCallback] = None,
 ) -> Tuple[Path, dict]:
     """Copy .tx1 files from source to destination."""
-    return move_files_by_extension(src, dest, ".tx1", "original_tx1_files")
+    return move_files_by_extension(
+        src, dest, ".tx1", "original_tx1_files",
+        content_index=content_index, placement=placement, paths=paths, placed=placed,
+    )
+
+
+def move_cdf_files(
+    src: Union[str, Path], dest: Union[str, Path],
+    content_index: Optional[ContentIndex] = None,
+    placement: str = "copy",
+    paths: Optional[Iterable[Union[str, Path]]] = None,
+    placed: Optional[PlacedCallback] = None,
+) -> Tuple[Path, dict]:
+    """Copy .cdf files from source to destination."""
+    return move_files_by_extension(
+        src, dest, ".cdf", "original_cdf_files",
+        content_index=content_index, placement=placement, paths=paths, placed=placed,
+    )
 
 
 def move_files_by_week(
@@ -247,6 +619,12 @@ def move_files_by_week(
     destination_directory: Union[str, Path],
     month: int,
     year: int,
+    placement: str = "copy",
+    max_workers: int = DEFAULT_COPY_WORKERS,
+    progress: Optional[ProgressCallback] = None,
+    paths: Optional[Iterable[Union[str, Path]]] = None,
+    placed: Optional[PlacedCallback] = None,
+    overwrite: bool = True,
 ) -> dict[str, int]:
     """Sort .dat files into week folders based on the day in the filename.
 
@@ -257,10 +635,29 @@ def move_files_by_week(
         destination_directory: Parent directory for week folders.
         month: Month number (1-12).
         year: Year (for determining days in month).
+        placement: How files are placed: "copy", "hardlink", "reflink" or
+            "symlink". Week files are edited during validation, so only
+            "copy" and "reflink" keep dat_folder's files untouched.
+        max_workers: Files copied at once.
+        progress: Optional callback called as progress(bytes_copied,
+            total_bytes) as files finish.
+        paths: Sort only these files instead of every file in dat_folder.
+        placed: Optional callback called as placed(source, week_name,
+            target) for every file copied into a week folder, or left in
+            place there because overwrite is False.
+        overwrite: Replace files already in the week folders. With False
+            they are left untouched (and not counted), so edits made
+            during validation survive.
 
     Returns:
         Dict mapping week name to number of files placed.
+
+    Raises:
+        OSError: If any file could not be copied, after the others have
+            been placed.
     """
+    if placement not in PLACEMENT_STRATEGIES:
+        raise ValueError(f"placement must be one of {PLACEMENT_STRATEGIES}, got {placement!r}")
     _, days_in_month = calendar.monthrange(year, month)
     week_ranges = {
         "week 1": range(1, 8),
@@ -279,42 +676,54 @@ def move_files_by_week(
         path.mkdir(parents=True, exist_ok=True)
         week_paths[week_name] = path
 
-    for file in dat_folder.iterdir():
-        if not file.is_file():
-            continue
-
-        result = parse_dat_file(file)
-        if not result:
-            continue
-
-        parsed, _ = result
-        month_num = letter_to_number(parsed["month"])
-        if month_num is None:
-            logger.warning("Invalid month letter '%s' in file %s", parsed["month"], file.name)
-            continue
-        if month_num + 1 != month:
-            logger.warning('file %s is not from month %s', file, month)
-            continue
-
-
-        try:
-            file_day = int(parsed['day'])
-        except ValueError:
-            logger.warning("Invalid day '%s' in file %s", parsed['day'], file.name)
-            continue
-
-        placed = False
-        for week_name, day_range in week_ranges.items():
-            if file_day in day_range:
-                shutil.copy2(str(file), str(week_paths[week_name] / file.name))
-                week_counts[week_name] += 1
-                placed = True
-                break
-
-        if not placed:
-            logger.warning("Day %d from %s is out of range", file_day, file.name)
+    scan = scan_dat_files(dat_folder)
+    if paths is not None:
+        wanted = {Path(p).name for p in paths}
+        scan = scan[scan["path"].map(lambda p: p.name).isin(wanted)]
+
+    for path in scan.loc[scan["month"].isna(), "path"]:
+        logger.warning("Invalid month letter in file %s", path.name)
+    other_month = scan["month"].notna() & (scan["month"] != month)
+    for path in scan.loc[other_month, "path"]:
+        logger.warning('file %s is not from month %s', path, month)
+    scan = scan[(scan["month"] == month).fillna(False)]
+
+    # Each day's week, by the day ranges above
+    day_week = {day: name for name, days in week_ranges.items() for day in days}
+    weeks = scan["day"].map(day_week)
+    for path, day in zip(scan.loc[weeks.isna(), "path"], scan.loc[weeks.isna(), "day"]):
+        logger.warning("Day %d from %s is out of range", day, path.name)
+    placed_rows = weeks.notna()
+
+    jobs = [
+        CopyJob(path, week_paths[week_name] / path.name)
+        for path, week_name in zip(scan.loc[placed_rows, "path"], weeks[placed_rows])
+    ]
+    job_weeks = list(weeks[placed_rows])
+    if not overwrite:
+        kept = [job.dst.exists() or job.dst.is_symlink() for job in jobs]
+        for job, week_name, exists in zip(jobs, job_weeks, kept):
+            if exists and placed is not None:
+                placed(job.src, week_name, job.dst)
+        if any(kept):
+            logger.info("%d file(s) already in week folders left unchanged", sum(kept))
+        jobs = [job for job, exists in zip(jobs, kept) if not exists]
+        job_weeks = [week for week, exists in zip(job_weeks, kept) if not exists]
+
+    outcomes = copy_files(jobs, placement, max_workers=max_workers, progress=progress)
+    for outcome, week_name in zip(outcomes, job_weeks):
+        if outcome.ok:
+            week_counts[week_name] += 1
+            if placed is not None:
+                placed(outcome.job.src, week_name, outcome.job.dst)
 
     logger.info("Files sorted by week: %s", week_counts)
+    failed = [outcome for outcome in outcomes if not outcome.ok]
+    if failed:
+        raise OSError(
+            f"Failed to copy {len(failed)} file(s) into week folders: "
+            + ", ".join(outcome.job.src.name for outcome in failed)
+        ) from failed[0].error
     return week_counts
 
 
@@ -385,6 +794,7 @@ def convert_file_to_pdf(
     destination_path: Union[str, Path],
     soffice_path: Union[str, Path] = _DEFAULT_SOFFICE,
     allow_network_drive: bool = False,
+    converter=None,
 ) -> Path:
     """Convert a DOCX, XLSX, or XLSM file to PDF using LibreOffice.
 
@@ -395,21 +805,21 @@ def convert_file_to_pdf(
         destination_path: Desired path for the output PDF.
         soffice_path: Path to the LibreOffice soffice executable.
         allow_network_drive: Allow operation on network drives.
+        converter: Converter to use (see
+            :mod:`autogc_validation.workspace.converter`); a one-off
+            soffice subprocess if None.
 
     Returns:
         Path to the output PDF.
     """
     src = Path(source_path).resolve()
     dest = Path(destination_path).resolve()
-    soffice = Path(soffice_path)
 
     for path in [src, dest]:
         assert_local_drive(path, allow_network_drive)
 
     if not src.exists():
         raise FileNotFoundError(f"Source file does not exist: {src}")
-    if not soffice.exists():
-        raise FileNotFoundError(f"LibreOffice not found: {soffice}")
 
     dest.parent.mkdir(parents=True, exist_ok=True)
 
@@ -417,23 +827,11 @@ def convert_file_to_pdf(
         logger.info("PDF already exists, skipping: %s", dest.name)
         return dest
 
-    try:
-        subprocess.run(
-            [str(soffice), "--headless", "--convert-to", "pdf",
-             "--outdir", str(dest.parent), str(src)],
-            check=True, capture_output=True, text=True,
-        )
-    except subprocess.CalledProcessError as e:
-        raise RuntimeError(f"Failed to convert {src} to PDF: {e.stderr}")
-
-    temp_pdf = dest.parent / f"{src.stem}.pdf"
-    if not temp_pdf.exists():
-        raise RuntimeError(f"Converted PDF not found: {temp_pdf}")
-
-    if not dest.exists():
-        temp_pdf.rename(dest)
+    if converter is None:
+        with SubprocessConverter(soffice_path) as one_off:
+            one_off.convert(src, dest)
     else:
-        temp_pdf.unlink()
+        converter.convert(src, dest)
 
     logger.info("Converted %s -> %s", src.name, dest.name)
     return dest
@@ -445,11 +843,15 @@ def convert_folder_contents_to_pdf(
     copy_original: bool = True,
     soffice_path: Union[str, Path] = _DEFAULT_SOFFICE,
     allow_network_drive: bool = False,
+    converter=None,
+    workers: int = DEFAULT_CONVERT_WORKERS,
 ) -> list[Path]:
     """Batch-convert DOCX/XLSX/XLSM files to PDF.
 
     Output filenames include the source file's modification timestamp
-    to distinguish versions.
+    to distinguish versions. Documents are converted concurrently on a
+    pool of long-lived LibreOffice instances, or on one soffice process
+    per document if the pool cannot be started.
 
     Args:
         source_directory: Directory to search recursively.
@@ -457,6 +859,9 @@ def convert_folder_contents_to_pdf(
         copy_original: Also copy the original file alongside the PDF.
         soffice_path: Path to LibreOffice soffice executable.
         allow_network_drive: Allow operation on network drives.
+        converter: Converter to use instead of starting one; it is not
+            closed afterwards.
+        workers: Documents converted at once when starting a converter.
 
     Returns:
         List of converted PDF paths.
@@ -476,28 +881,51 @@ def convert_folder_contents_to_pdf(
     for ext in ("*.docx", "*.xlsx", "*.xlsm"):
         convertible.extend(src.rglob(ext))
 
-    converted = []
+    targets = []
     for file in convertible:
         try:
             ts = datetime.fromtimestamp(file.stat().st_mtime).strftime(
                 "%Y-%m-%d-%H-%M-%S"
             )
-            pdf_path = dest / f"{file.stem} modified {ts}.pdf"
+            name = f"{file.stem} modified {ts}"
+            targets.append((file, dest / f"{name}.pdf", dest / f"{name}{file.suffix}"))
+        except Exception:
+            logger.exception("Failed processing file: %s", file)
+
+    owned = None
+    if converter is None and any(not pdf.exists() for _, pdf, _ in targets):
+        try:
+            converter = owned = open_converter(soffice_path, workers)
+        except FileNotFoundError:
+            logger.exception("Cannot convert %d file(s) to PDF", len(targets))
+            return []
 
-            result = convert_file_to_pdf(
+    def convert(target: tuple[Path, Path, Path]) -> Optional[Path]:
+        file, pdf_path, _ = target
+        try:
+            return convert_file_to_pdf(
                 file, pdf_path, soffice_path=soffice_path,
-                allow_network_drive=allow_network_drive,
+                allow_network_drive=allow_network_drive, converter=converter,
             )
-            if result:
-                converted.append(result)
-
-            if copy_original:
-                original_copy = dest / f"{file.stem} modified {ts}{file.suffix}"
-                if not original_copy.exists():
-                    shutil.copy2(file, original_copy)
-
         except Exception:
             logger.exception("Failed processing file: %s", file)
+            return None
+
+    try:
+        n_workers = getattr(converter, "workers", 1)
+        with ThreadPoolExecutor(max_workers=max(1, n_workers)) as pool:
+            results = list(pool.map(convert, targets))
+    finally:
+        if owned is not None:
+            owned.close()
+
+    converted = [pdf for pdf in results if pdf is not None]
+    if copy_original:
+        copy_files(
+            CopyJob(file, original_copy)
+            for (file, _, original_copy), pdf in zip(targets, results)
+            if pdf is not None and not original_copy.exists()
+        )
 
     logger.info("Converted %d/%d files to PDF", len(converted), len(convertible))
     return converted
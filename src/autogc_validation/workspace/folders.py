@@ -5,7 +5,7 @@ Monthly validation folder structure creation.
 
 import logging
 from pathlib import Path
-from typing import Union
+from typing import Optional, Union
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +29,30 @@ def _next_version(root_dir: Path, prefix: str) -> int:
     return version
 
 
+def latest_workspace(
+    root_dir: Union[str, Path],
+    sitename: str,
+    year: Union[int, str],
+    month: Union[int, str],
+) -> Optional[Path]:
+    """Return the highest existing version of a monthly workspace folder.
+
+    Args:
+        root_dir: Parent directory holding the monthly folders.
+        sitename: Site name code (e.g. "RB").
+        year: Year (int or string).
+        month: Month number (1-12).
+
+    Returns:
+        Path to ``{sitename}{year}{month:02d}v{N}`` with the largest N,
+        or None if no version exists.
+    """
+    root_dir = Path(root_dir)
+    prefix = f"{sitename}{year}{int(month):02d}"
+    version = _next_version(root_dir, prefix) - 1
+    return root_dir / f"{prefix}v{version}" if version else None
+
+
 def generate_monthly_folder_structure(
     root_dir: Union[str, Path],
     sitename: str,
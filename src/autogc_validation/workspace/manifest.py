@@ -0,0 +1,210 @@
+# -*- coding: utf-8 -*-
+"""
+Per-file manifest of workspace inputs.
+
+Every archive, zip member and loose file that :func:`process_workspace`
+handles is recorded with its size, modification time, content hash and
+the files it produced. On the next run, inputs whose size and mtime
+match their entry are skipped, so only new or changed files are
+processed.
+
+Entries are keyed by path relative to the workspace; zip members are
+keyed as ``<archive>::<member>``. The manifest is saved as
+``.workspace_manifest.json`` next to the workspace state file.
+"""
+
+import json
+import logging
+import os
+import threading
+import zipfile
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Iterable, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_FILENAME = ".workspace_manifest.json"
+
+
+@dataclass
+class ManifestEntry:
+    """One input file and where its bytes ended up.
+
+    Attributes:
+        path: Path relative to the workspace, or the member name for a
+            file inside an archive.
+        size: Size in bytes.
+        mtime_ns: Modification time in nanoseconds (the stored date for
+            zip members).
+        hash: BLAKE2b hex digest for files, CRC-32 as 8 hex digits for
+            zip members; None if not hashed.
+        source: Archive the file came from (relative to the workspace),
+            or None for a file on disk.
+        destinations: Files holding this input's bytes, relative to the
+            workspace.
+    """
+    path: str
+    size: int
+    mtime_ns: int
+    hash: Optional[str] = None
+    source: Optional[str] = None
+    destinations: list[str] = field(default_factory=list)
+
+
+class Manifest:
+    """Per-file record of the inputs processed in one workspace.
+
+    Thread-safe, so extraction threads can record members as they go.
+
+    Args:
+        base_dir: Workspace folder; the manifest file lives here.
+
+    Attributes:
+        loaded: True if entries were read from an existing manifest file.
+    """
+
+    def __init__(self, base_dir: Union[str, Path]):
+        self.base_dir = Path(base_dir)
+        self.path = self.base_dir / MANIFEST_FILENAME
+        self._lock = threading.Lock()
+        self._entries: dict[str, ManifestEntry] = {}
+        self.loaded = False
+        if self.path.exists():
+            try:
+                data = json.loads(self.path.read_text())
+                self._entries = {
+                    key: ManifestEntry(**entry) for key, entry in data.get("files", {}).items()
+                }
+                self.loaded = True
+                logger.debug("Loaded %d manifest entries from %s", len(self._entries), self.path)
+            except (ValueError, TypeError):
+                logger.warning("Ignoring unreadable workspace manifest %s", self.path)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, file: Union[str, Path]) -> bool:
+        return self._relative(file) in self._entries
+
+    def _relative(self, file: Union[str, Path]) -> str:
+        file = Path(file)
+        try:
+            return file.resolve().relative_to(self.base_dir.resolve()).as_posix()
+        except ValueError:
+            return file.resolve().as_posix()
+
+    @staticmethod
+    def member_key(archive: str, member: str) -> str:
+        return f"{archive}::{member}"
+
+    def get(self, key: Union[str, Path]) -> Optional[ManifestEntry]:
+        """Entry for a file path or member key, or None."""
+        if isinstance(key, Path):
+            key = self._relative(key)
+        with self._lock:
+            return self._entries.get(key)
+
+    def is_unchanged(self, file: Union[str, Path]) -> bool:
+        """True if *file* has an entry with its current size and mtime."""
+        entry = self.get(Path(file))
+        if entry is None:
+            return False
+        try:
+            st = os.stat(file)
+        except FileNotFoundError:
+            return False
+        return entry.size == st.st_size and entry.mtime_ns == st.st_mtime_ns
+
+    def changed(self, files: Iterable[Path]) -> list[Path]:
+        """The files in *files* that are new or changed since recorded."""
+        return [f for f in files if not self.is_unchanged(f)]
+
+    def record_file(
+        self,
+        file: Path,
+        destinations: Iterable[Path] = (),
+        hash: Optional[str] = None,
+        source: Optional[str] = None,
+    ) -> ManifestEntry:
+        """Record *file* as processed, with the files it produced."""
+        st = os.stat(file)
+        entry = ManifestEntry(
+            path=self._relative(file),
+            size=st.st_size,
+            mtime_ns=st.st_mtime_ns,
+            hash=hash,
+            source=source,
+            destinations=[self._relative(d) for d in destinations],
+        )
+        with self._lock:
+            self._entries[entry.path] = entry
+        return entry
+
+    def record_member(
+        self,
+        archive: Path,
+        info: zipfile.ZipInfo,
+        destinations: Iterable[Path] = (),
+    ) -> ManifestEntry:
+        """Record a zip member of *archive*, with the files holding its bytes."""
+        source = self._relative(archive)
+        entry = ManifestEntry(
+            path=info.filename,
+            size=info.file_size,
+            mtime_ns=int(datetime(*info.date_time).timestamp() * 1e9),
+            hash=f"{info.CRC:08x}",
+            source=source,
+            destinations=[self._relative(d) for d in destinations],
+        )
+        with self._lock:
+            self._entries[self.member_key(source, info.filename)] = entry
+        return entry
+
+    def seed(self, files: Iterable[Path]) -> int:
+        """Record every file in *files* as already processed.
+
+        For a workspace processed before it had a manifest (or whose
+        manifest was lost), so the files already on disk are not taken
+        for new ones.
+
+        Returns:
+            Number of files recorded.
+        """
+        count = 0
+        for file in files:
+            self.record_file(file)
+            count += 1
+        return count
+
+    def add_destination(self, file: Path, destination: Path) -> None:
+        """Add *destination* to the entry for *file*, if it has one."""
+        key, dest = self._relative(file), self._relative(destination)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and dest not in entry.destinations:
+                entry.destinations.append(dest)
+
+    def entries(self) -> list[ManifestEntry]:
+        with self._lock:
+            return list(self._entries.values())
+
+    def clear(self) -> None:
+        """Forget every entry, so the next run processes everything."""
+        with self._lock:
+            self._entries.clear()
+
+    def save(self) -> Path:
+        """Write the manifest to its JSON file.
+
+        Returns:
+            Path to the manifest file.
+        """
+        with self._lock:
+            files = {key: asdict(entry) for key, entry in self._entries.items()}
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        tmp.write_text(json.dumps({"version": 1, "files": files}, indent=1))
+        os.replace(tmp, self.path)
+        logger.info("Workspace manifest saved: %d entries -> %s", len(files), self.path)
+        return self.path
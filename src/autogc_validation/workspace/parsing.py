@@ -5,12 +5,18 @@ Filename parsing utilities for AutoGC data files.
 Provides functions for parsing AutoGC .dat filenames, converting
 between the letter-based encoding used in filenames and numeric
 values, and checking file modification dates.
+
+:func:`scan_dat_files` parses a whole folder at once into a DataFrame
+and caches it, so the week sort and the sample-type listings share one
+directory scan.
 """
 
 import logging
 import os
 import re
 import sys
+import threading
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Optional, Tuple
@@ -163,6 +169,122 @@ def parse_dat_file(
     return from_filename, None
 
 
+#: Columns of the DataFrame returned by scan_dat_files.
+DAT_SCAN_COLUMNS = [
+    "path", "site", "sample_type", "month", "day", "hour", "mtime", "mismatch",
+]
+
+# The .dat files are stamped in station time (UTC-7)
+_STATION_TZ = timezone(timedelta(hours=-7))
+_MAX_SCANS = 32
+
+_scan_lock = threading.Lock()
+_scans: "OrderedDict[str, tuple[tuple, pd.DataFrame]]" = OrderedDict()
+
+
+def _letters_to_numbers(letters: pd.Series) -> pd.Series:
+    """Vectorized letter_to_number: a-x -> 0-23, anything else -> <NA>."""
+    numbers = letters.str.lower().map(ord, na_action="ignore") - ord("a")
+    return numbers.where(numbers.between(0, 23)).astype("Int64")
+
+
+def _directory_stamp(directory: Path) -> tuple:
+    st = os.stat(directory)
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _scan(directory: Path) -> pd.DataFrame:
+    names, paths, mtimes = [], [], []
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_file():
+                names.append(entry.name)
+                paths.append(Path(entry.path))
+                mtimes.append(entry.stat().st_mtime_ns)
+
+    files = pd.DataFrame({
+        "name": pd.Series(names, dtype=object),
+        "path": pd.Series(paths, dtype=object),
+        "mtime_ns": pd.Series(mtimes, dtype="int64"),
+    }).sort_values("name", ignore_index=True)
+    fields = files["name"].str.extract(f"^{_DAT_PATTERN.pattern}$", flags=re.IGNORECASE)
+    parsed = fields["site"].notna()
+    if not parsed.all():
+        logger.debug("%d file(s) in %s are not AutoGC .dat files", int((~parsed).sum()), directory)
+    files, fields = files[parsed].reset_index(drop=True), fields[parsed].reset_index(drop=True)
+
+    df = pd.DataFrame({
+        "path": files["path"],
+        "site": fields["site"].str.upper(),
+        "sample_type": fields["sample_type"].str.lower(),
+        "month": _letters_to_numbers(fields["month"]) + 1,
+        "day": fields["day"].astype("Int64"),
+        "hour": _letters_to_numbers(fields["hour"]),
+        "mtime": pd.to_datetime(files["mtime_ns"], unit="ns", utc=True).dt.tz_convert(_STATION_TZ),
+    })
+
+    # A .dat file is written in the hour after its data was collected
+    collected = df["mtime"] - pd.Timedelta(hours=1)
+    df["mismatch"] = ~(
+        (df["month"] == collected.dt.month)
+        & (df["day"] == collected.dt.day)
+        & (df["hour"] == collected.dt.hour)
+    ).fillna(False).astype(bool)
+
+    for path in df.loc[df["mismatch"], "path"]:
+        logger.warning("Mismatch between filename and modified date: %s", path.stem)
+    return df[DAT_SCAN_COLUMNS]
+
+
+def scan_dat_files(directory: os.PathLike, refresh: bool = False) -> pd.DataFrame:
+    """Parse every AutoGC .dat filename in *directory* in one pass.
+
+    The vectorized equivalent of calling :func:`parse_dat_file` on each
+    file. The result is cached per directory until a file is added,
+    removed or renamed there; a file rewritten in place keeps its cached
+    mtime until ``refresh=True`` or :func:`invalidate_dat_scan`.
+
+    Args:
+        directory: Folder containing .dat files (not searched recursively).
+        refresh: Rescan even if a cached scan is still valid.
+
+    Returns:
+        DataFrame with one row per parseable .dat file, sorted by name,
+        and columns :data:`DAT_SCAN_COLUMNS`: path, site, sample_type
+        (lowercase), month (1-12), day, hour (0-23), mtime (UTC-7) and
+        mismatch (True if the filename's month, day or hour disagree
+        with the modification time). Letters outside a-x give <NA>.
+        Callers receive a copy.
+    """
+    directory = Path(directory)
+    key = str(directory.resolve())
+    stamp = _directory_stamp(directory)
+    with _scan_lock:
+        hit = _scans.get(key)
+        if hit is not None and hit[0] == stamp and not refresh:
+            _scans.move_to_end(key)
+            logger.debug("Using cached .dat scan of %s", directory)
+            return hit[1].copy()
+
+    df = _scan(directory)
+    with _scan_lock:
+        _scans[key] = (stamp, df)
+        _scans.move_to_end(key)
+        while len(_scans) > _MAX_SCANS:
+            _scans.popitem(last=False)
+    logger.info("Scanned %d .dat file(s) in %s", len(df), directory)
+    return df.copy()
+
+
+def invalidate_dat_scan(directory: Optional[os.PathLike] = None) -> None:
+    """Drop the cached scan of *directory*, or of every directory."""
+    with _scan_lock:
+        if directory is None:
+            _scans.clear()
+        else:
+            _scans.pop(str(Path(directory).resolve()), None)
+
+
 def list_by_sample_type(
     input_directory: os.PathLike,
     sample_type: SampleType,
@@ -180,33 +302,26 @@ def list_by_sample_type(
     Returns:
         List of paths with filename/modification date mismatches.
     """
-    rows = []
-    mismatched_list = []
     input_directory = Path(input_directory)
     output_dir = Path(output_dir) if output_dir is not None else input_directory
 
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    for file in input_directory.iterdir():
-        result = parse_dat_file(file)
-        if result is None:
-            continue
-
-        from_filename, mismatched = result
-        if mismatched:
-            mismatched_list.append(mismatched)
-
-        if from_filename['sample_type'].lower() == sample_type.value:
-            month = letter_to_number(from_filename['month']) + 1
-            day = int(from_filename['day'])
-            hour_int = letter_to_number(from_filename['hour'])
-            rows.append({
-                'date': f"{month:02d}/{day:02d}/{year:02d}",
-                'hour': f"{hour_int:02d}:00",
-                'filename': file.stem,
-            })
-
-    df = pd.DataFrame(rows)
+    scan = scan_dat_files(input_directory)
+    mismatched_list = list(scan.loc[scan["mismatch"], "path"])
+
+    selected = scan[
+        (scan["sample_type"] == sample_type.value)
+        & scan["month"].notna() & scan["hour"].notna()
+    ]
+    df = pd.DataFrame({
+        "date": (
+            selected["month"].astype(str).str.zfill(2) + "/"
+            + selected["day"].astype(str).str.zfill(2) + f"/{year:02d}"
+        ),
+        "hour": selected["hour"].astype(str).str.zfill(2) + ":00",
+        "filename": selected["path"].map(lambda p: p.stem),
+    })
     csv_path = output_dir / f"{sample_type.value}.csv"
     df.to_csv(csv_path, header=True, index=False)
     logger.info("Wrote %d rows to %s", len(df), csv_path)
@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+"""
+File placement strategies.
+
+Sorting a month of .dat files into Original/ and FINAL/week N/ writes the
+same bytes several times. :func:`place_file` can instead make the target
+a reflink (a copy-on-write clone), a hard link or a symbolic link, falling
+back to a plain copy when the filesystem or platform does not support the
+requested strategy.
+
+Hard and symbolic links share their bytes with the source, so editing the
+target in place also changes the source. FINAL/ files are re-integrated
+by the GC software, so use "reflink" or "copy" where that matters.
+"""
+
+import errno
+import itertools
+import logging
+import os
+import shutil
+import sys
+import threading
+from pathlib import Path
+from typing import Union
+
+logger = logging.getLogger(__name__)
+
+#: Accepted values for the ``placement`` argument.
+PLACEMENT_STRATEGIES = ("copy", "hardlink", "reflink", "symlink")
+
+# FICLONE from linux/fs.h: clone all of one file's extents into another.
+_FICLONE = 0x40049409
+
+# (strategy, source device, target device) combinations that have failed,
+# so a large batch falls back after one attempt instead of one per file.
+_unsupported: set[tuple[str, int, int]] = set()
+_unsupported_lock = threading.Lock()
+
+# Errors meaning "not possible between these filesystems": cached, so the
+# rest of a batch copies straight away.
+_DEVICE_ERRNOS = {
+    errno.EXDEV, errno.EINVAL, errno.ENOTSUP, errno.EOPNOTSUPP, errno.ENOTTY,
+}
+
+# Errors meaning "not possible for this file" (a read-only source, a file
+# at its hard link limit): that file is copied, the next one is linked.
+_FILE_ERRNOS = {errno.EPERM, errno.EACCES, errno.EMLINK}
+
+_temp_names = itertools.count()
+
+
+def _reflink(src: Path, dst: Path) -> None:
+    """Clone *src* to *dst* with the FICLONE ioctl (Btrfs, XFS, ...)."""
+    if not sys.platform.startswith("linux"):
+        raise OSError(errno.ENOTSUP, "reflink is only supported on Linux", str(dst))
+    import fcntl
+
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        try:
+            fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+        except OSError:
+            fdst.close()
+            dst.unlink(missing_ok=True)
+            raise
+    shutil.copystat(src, dst)
+
+
+def _link(src: Path, dst: Path, strategy: str) -> None:
+    """Make *dst* a link or clone of *src*, replacing *dst* atomically.
+
+    The link is made under a temporary name and moved over *dst*, so a
+    failure leaves any existing *dst* as it was.
+    """
+    tmp = dst.with_name(f".{dst.name}.{os.getpid()}.{next(_temp_names)}.tmp")
+    try:
+        if strategy == "hardlink":
+            os.link(src, tmp)
+        elif strategy == "symlink":
+            os.symlink(src.resolve(), tmp)
+        else:
+            _reflink(src, tmp)
+        os.replace(tmp, dst)
+    except BaseException:
+        if tmp.exists() or tmp.is_symlink():
+            tmp.unlink()
+        raise
+
+
+def place_file(
+    src: Union[str, Path],
+    dst: Union[str, Path],
+    strategy: str = "copy",
+) -> str:
+    """Place *src* at *dst* using *strategy*, replacing any existing *dst*.
+
+    Args:
+        src: File to place.
+        dst: Target file path (not a directory).
+        strategy: One of :data:`PLACEMENT_STRATEGIES`. Anything other than
+            "copy" falls back to a copy (with metadata, like shutil.copy2)
+            if the link or clone cannot be made.
+
+    Returns:
+        The strategy actually used.
+
+    Raises:
+        ValueError: If strategy is not one of PLACEMENT_STRATEGIES.
+    """
+    if strategy not in PLACEMENT_STRATEGIES:
+        raise ValueError(
+            f"strategy must be one of {PLACEMENT_STRATEGIES}, got {strategy!r}"
+        )
+    src, dst = Path(src), Path(dst)
+
+    if strategy != "copy":
+        if dst.exists() and strategy == "hardlink" and os.path.samefile(src, dst):
+            return strategy
+        key = (strategy, src.stat().st_dev, dst.parent.stat().st_dev)
+        if key not in _unsupported:
+            try:
+                _link(src, dst, strategy)
+                return strategy
+            except OSError as e:
+                if e.errno in _DEVICE_ERRNOS:
+                    with _unsupported_lock:
+                        _unsupported.add(key)
+                    logger.info(
+                        "%s not supported for %s -> %s (%s); copying instead",
+                        strategy, src.parent, dst.parent, e.strerror,
+                    )
+                elif e.errno in _FILE_ERRNOS:
+                    logger.info("%s failed for %s (%s); copying it", strategy, src.name, e.strerror)
+                else:
+                    raise
+
+    if dst.is_symlink() or (dst.exists() and dst.stat().st_nlink > 1):
+        # copy2 would write through the link into the file it shares bytes
+        # with (or raise SameFileError if that is src), so replace it.
+        dst.unlink()
+    shutil.copy2(src, dst)
+    return "copy"
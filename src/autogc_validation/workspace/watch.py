@@ -0,0 +1,361 @@
+# -*- coding: utf-8 -*-
+"""
+Watch a workspace's ``temp/`` folder and ingest files as they arrive.
+
+Zips and loose .dat, .tx1 and .cdf files copied into ``temp/`` are picked
+up once they have finished arriving and run through the unzip, move and
+sort steps of :func:`~autogc_validation.workspace.process_workspace`,
+restricted to just those files. Document conversion is left to a normal
+``process_workspace`` run.
+
+A file counts as complete once its size and modification time have not
+changed for ``settle_seconds``; a zip must also have its central
+directory, which is written last. On Linux, inotify wakes the watcher as
+soon as something changes in ``temp/``; elsewhere, or if inotify is
+unavailable, the folder is polled every ``poll_interval`` seconds.
+
+A file counts as done once the workspace manifest records it unchanged.
+Files that are not recorded after an ingest (for example a zip with a
+member that could not be copied) are tried again after ``retry_seconds``::
+
+    with WorkspaceWatcher("validation/RB/RB202601v1") as watcher:
+        watcher.run()  # until Ctrl+C
+"""
+
+import ctypes
+import ctypes.util
+import logging
+import os
+import select
+import sys
+import threading
+import time
+import zipfile
+from pathlib import Path
+from typing import Optional, Union
+
+from autogc_validation.workspace import WorkspaceResult, process_workspace
+from autogc_validation.workspace.manifest import Manifest
+from autogc_validation.workspace.placement import PLACEMENT_STRATEGIES
+
+logger = logging.getLogger(__name__)
+
+#: Extensions of the files picked up from temp/.
+WATCH_SUFFIXES = (".zip", ".dat", ".tx1", ".cdf")
+
+#: process_workspace steps run for each batch of arrivals.
+INGEST_STEPS = (
+    "unzip_files",
+    "move_dat_files",
+    "move_tx1_files",
+    "move_cdf_files",
+    "sort_by_week",
+)
+
+#: Default seconds a file must stay unchanged before it is ingested.
+DEFAULT_SETTLE_SECONDS = 5.0
+
+#: Default seconds between scans of temp/ when nothing wakes the watcher.
+DEFAULT_POLL_INTERVAL = 2.0
+
+#: Default seconds before a file that failed to ingest is tried again.
+DEFAULT_RETRY_SECONDS = 60.0
+
+# From linux/inotify.h
+_IN_MODIFY = 0x002
+_IN_CLOSE_WRITE = 0x008
+_IN_MOVED_TO = 0x080
+_IN_CREATE = 0x100
+
+
+class _Inotify:
+    """Signals changes in one directory through Linux inotify.
+
+    Only used to wake the watcher; which files changed is found by
+    rescanning, so events are drained without being parsed.
+
+    Raises:
+        OSError: If inotify is unavailable or the watch cannot be added.
+    """
+
+    def __init__(self, directory: Path):
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self._fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        mask = _IN_MODIFY | _IN_CLOSE_WRITE | _IN_MOVED_TO | _IN_CREATE
+        if libc.inotify_add_watch(self._fd, os.fsencode(directory), mask) < 0:
+            errno = ctypes.get_errno()
+            os.close(self._fd)
+            raise OSError(errno, f"Cannot watch {directory}")
+
+    def wait(self, timeout: float) -> bool:
+        """Block until something changes or *timeout* seconds pass.
+
+        Returns:
+            True if woken by a change.
+        """
+        ready, _, _ = select.select([self._fd], [], [], max(timeout, 0))
+        if not ready:
+            return False
+        while True:
+            try:
+                if not os.read(self._fd, 64 * 1024):
+                    break
+            except BlockingIOError:
+                break
+        return True
+
+    def close(self) -> None:
+        os.close(self._fd)
+
+
+def _stamp(path: Path) -> Optional[tuple[int, int]]:
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return None
+    return st.st_size, st.st_mtime_ns
+
+
+class WorkspaceWatcher:
+    """Ingests files copied into a workspace's temp/ folder as they arrive.
+
+    Args:
+        workspace_dir: Monthly validation folder created by
+            :func:`~autogc_validation.workspace.create_workspace`.
+        settle_seconds: Seconds a file's size and modification time must
+            stay unchanged before it is treated as complete.
+        poll_interval: Seconds between scans of temp/ when nothing wakes
+            the watcher sooner.
+        placement: Passed to process_workspace.
+        use_inotify: Use inotify on Linux to react to changes at once;
+            False polls only.
+        retry_seconds: Seconds before a file that is still not recorded
+            in the manifest after an ingest is tried again.
+
+    Raises:
+        FileNotFoundError: If the workspace has no temp/ folder.
+        ValueError: If placement is not a known strategy or
+            settle_seconds is negative.
+    """
+
+    def __init__(
+        self,
+        workspace_dir: Union[str, Path],
+        settle_seconds: float = DEFAULT_SETTLE_SECONDS,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        placement: str = "copy",
+        use_inotify: bool = True,
+        retry_seconds: float = DEFAULT_RETRY_SECONDS,
+    ):
+        if placement not in PLACEMENT_STRATEGIES:
+            raise ValueError(
+                f"placement must be one of {PLACEMENT_STRATEGIES}, got {placement!r}"
+            )
+        if settle_seconds < 0:
+            raise ValueError(f"settle_seconds must be >= 0, got {settle_seconds}")
+        self.base_dir = Path(workspace_dir)
+        self.temp_dir = self.base_dir / "temp"
+        if not self.temp_dir.is_dir():
+            raise FileNotFoundError(f"No temp/ folder in {self.base_dir}")
+        self.settle_seconds = settle_seconds
+        self.poll_interval = poll_interval
+        self.placement = placement
+        self.retry_seconds = retry_seconds
+        self.result: Optional[WorkspaceResult] = None
+        # path -> (stamp, monotonic time the stamp was first seen)
+        self._pending: dict[Path, tuple[tuple[int, int], float]] = {}
+        # path -> stamp already ingested (or rejected), not retried unless it changes
+        self._attempted: dict[Path, tuple[int, int]] = {}
+        # path -> (stamp, monotonic time of the next try) after a failed ingest
+        self._failed: dict[Path, tuple[tuple[int, int], float]] = {}
+
+        self._inotify: Optional[_Inotify] = None
+        if use_inotify and sys.platform.startswith("linux"):
+            try:
+                self._inotify = _Inotify(self.temp_dir)
+            except (OSError, AttributeError) as e:
+                logger.info("inotify unavailable (%s); polling %s", e, self.temp_dir)
+
+    def __enter__(self) -> "WorkspaceWatcher":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Stop listening for inotify events."""
+        if self._inotify is not None:
+            self._inotify.close()
+            self._inotify = None
+
+    def _candidates(self) -> list[Path]:
+        documents_dir = self.temp_dir / "documents"
+        return sorted(
+            p for p in self.temp_dir.rglob("*")
+            if p.suffix.lower() in WATCH_SUFFIXES
+            and documents_dir not in p.parents
+            # Like process_workspace, only unzip archives at the top of
+            # temp/, not ones extracted from other archives
+            and (p.suffix.lower() != ".zip" or p.parent == self.temp_dir)
+            and p.is_file()
+        )
+
+    def settled(self) -> list[Path]:
+        """Scan temp/ and return the files that have finished arriving.
+
+        Files already ingested, rejected, recorded unchanged in the
+        workspace manifest, or waiting to be retried are left out.
+        """
+        now = time.monotonic()
+        seen = set()
+        ready = []
+        for path in self._candidates():
+            seen.add(path)
+            stamp = _stamp(path)
+            if stamp is None or self._attempted.get(path) == stamp:
+                continue
+            failed = self._failed.get(path)
+            if failed is not None:
+                if failed[0] == stamp and now < failed[1]:
+                    continue
+                del self._failed[path]
+            previous = self._pending.get(path)
+            if previous is None or previous[0] != stamp:
+                self._pending[path] = (stamp, now)
+                if self.settle_seconds > 0:
+                    continue
+            elif now - previous[1] < self.settle_seconds:
+                continue
+            ready.append(path)
+        for path in set(self._pending) - seen:
+            del self._pending[path]
+        if not ready:
+            return []
+
+        manifest = Manifest(self.base_dir)
+        complete = []
+        for path in ready:
+            stamp = self._pending.pop(path)[0]
+            if manifest.is_unchanged(path):
+                self._attempted[path] = stamp
+                continue
+            if path.suffix.lower() == ".zip" and not zipfile.is_zipfile(path):
+                logger.warning(
+                    "%s stopped changing but is not a complete zip; skipping until it changes",
+                    path.name,
+                )
+                self._attempted[path] = stamp
+                continue
+            complete.append(path)
+        return complete
+
+    def ingest(self, files: list[Path]) -> WorkspaceResult:
+        """Run the ingest steps of process_workspace on *files* only."""
+        logger.info("Ingesting %d new file(s) from temp/", len(files))
+        self.result = process_workspace(
+            self.base_dir, placement=self.placement, steps=INGEST_STEPS, only=files,
+        )
+        return self.result
+
+    def poll_once(self) -> list[Path]:
+        """Scan temp/ once and ingest whatever has finished arriving.
+
+        Errors from process_workspace are logged rather than raised. Files
+        the manifest does not record as processed afterwards are retried
+        after ``retry_seconds``.
+
+        Returns:
+            The files ingested; empty if nothing was ready.
+        """
+        files = self.settled()
+        if not files:
+            return files
+        try:
+            self.ingest(files)
+        except Exception:
+            logger.exception("Ingest of %d file(s) failed", len(files))
+
+        manifest = Manifest(self.base_dir)
+        retry_at = time.monotonic() + self.retry_seconds
+        for path in files:
+            stamp = _stamp(path)
+            if stamp is None:
+                continue
+            if manifest.is_unchanged(path):
+                self._attempted[path] = stamp
+            else:
+                logger.warning(
+                    "%s was not fully ingested; retrying in %.0fs", path.name, self.retry_seconds,
+                )
+                self._failed[path] = (stamp, retry_at)
+        return files
+
+    def _timeout(self) -> float:
+        if not self._pending:
+            return self.poll_interval
+        # Wake when the next pending file is due to have settled
+        now = time.monotonic()
+        due = min(since + self.settle_seconds for _, since in self._pending.values())
+        return max(0.0, min(self.poll_interval, due - now))
+
+    def wait(self) -> None:
+        """Sleep until temp/ changes or the next scan is due."""
+        timeout = self._timeout()
+        if self._inotify is not None:
+            self._inotify.wait(timeout)
+        else:
+            time.sleep(timeout)
+
+    def run(
+        self,
+        stop: Optional[threading.Event] = None,
+        max_batches: Optional[int] = None,
+    ) -> int:
+        """Ingest arrivals until *stop* is set or *max_batches* have run.
+
+        Args:
+            stop: Event checked between scans; runs until interrupted if
+                None.
+            max_batches: Return after this many non-empty batches.
+
+        Returns:
+            Number of batches ingested.
+        """
+        logger.info(
+            "Watching %s (%s)", self.temp_dir, "inotify" if self._inotify else "polling",
+        )
+        batches = 0
+        while stop is None or not stop.is_set():
+            if self.poll_once():
+                batches += 1
+                if max_batches is not None and batches >= max_batches:
+                    break
+            self.wait()
+        return batches
+
+
+def watch_workspace(
+    workspace_dir: Union[str, Path],
+    settle_seconds: float = DEFAULT_SETTLE_SECONDS,
+    poll_interval: float = DEFAULT_POLL_INTERVAL,
+    placement: str = "copy",
+) -> Optional[WorkspaceResult]:
+    """Watch a workspace's temp/ folder until interrupted (Ctrl+C).
+
+    Args:
+        workspace_dir: Monthly validation folder (e.g. ``RB202601v1/``).
+        settle_seconds: Seconds a file must stay unchanged before ingest.
+        poll_interval: Seconds between scans when not woken sooner.
+        placement: Passed to process_workspace.
+
+    Returns:
+        The WorkspaceResult of the last batch, or None if nothing arrived.
+    """
+    with WorkspaceWatcher(workspace_dir, settle_seconds, poll_interval, placement) as watcher:
+        try:
+            watcher.run()
+        except KeyboardInterrupt:
+            logger.info("Stopped watching %s", watcher.temp_dir)
+        return watcher.result
@@ -167,3 +167,95 @@ def canister_periods(sample_canister_conc):
     df = pd.DataFrame(data, index=pd.DatetimeIndex(["2026-01-01"]))
     df.attrs["units"] = ConcentrationUnit.PPBC
     return df
+
+
+@pytest.fixture
+def airvision_standin(tmp_path):
+    """Local SQLite stand-in for the AirVision reporting view.
+
+    Returns a factory ``add(site, start, values)`` that inserts minute RTEMP
+    readings, and a ``connect`` callable for query_av_rtemp(connect=...).
+
+    Usage:
+        add, connect = airvision_standin
+        add("UT", "2026-01-01 00:00", [20.0, 21.0])
+        query_av_rtemp(start, end, "EQ", connect=connect)
+    """
+    import sqlite3
+
+    path = tmp_path / "airvision.db"
+
+    def connect():
+        conn = sqlite3.connect(":memory:")
+        conn.execute("ATTACH DATABASE ? AS Reporting", (str(path),))
+        return conn
+
+    with connect() as conn:
+        conn.execute(
+            "CREATE TABLE Reporting.ReadingAverageDataFull ("
+            "SiteAbbreviation TEXT, Date TEXT, FinalValue REAL, IntervalName TEXT, "
+            "ParameterName TEXT, ParameterEnabled INTEGER)"
+        )
+
+    def add(site, start, values, parameter="RTEMP", interval="001m"):
+        dates = pd.date_range(start, periods=len(values), freq="min")
+        rows = [
+            (site, d.strftime("%Y-%m-%d %H:%M:%S"), v, interval, parameter, 1)
+            for d, v in zip(dates, values)
+        ]
+        with connect() as conn:
+            conn.executemany(
+                "INSERT INTO Reporting.ReadingAverageDataFull VALUES (?, ?, ?, ?, ?, ?)", rows
+            )
+
+    return add, connect
+
+
+@pytest.fixture
+def fake_converter():
+    """In-process stand-in for a LibreOffice converter.
+
+    Writes a small placeholder PDF for each document and records the
+    (src, dest) pairs it was asked to convert. Sources whose name contains
+    "broken" raise RuntimeError, like a document LibreOffice cannot open.
+    """
+    import threading
+
+    class FakeConverter:
+        workers = 2
+
+        def __init__(self):
+            self.calls = []
+            self.closed = False
+            self._lock = threading.Lock()
+
+        def convert(self, src, dest):
+            with self._lock:
+                self.calls.append((Path(src), Path(dest)))
+            if "broken" in Path(src).name:
+                raise RuntimeError(f"Failed to convert {src} to PDF")
+            Path(dest).write_bytes(b"%PDF-1.4\n% converted from " + Path(src).name.encode() + b"\n")
+
+        def close(self):
+            self.closed = True
+
+    return FakeConverter()
+
+
+@pytest.fixture
+def fake_soffice(tmp_path):
+    """Executable that mimics ``soffice --convert-to pdf --outdir DIR FILE``."""
+    import stat
+    import sys
+
+    script = tmp_path / "soffice"
+    script.write_text(
+        f"#!{sys.executable}\n"
+        "import sys, pathlib\n"
+        "args = sys.argv[1:]\n"
+        "outdir = pathlib.Path(args[args.index('--outdir') + 1])\n"
+        "src = pathlib.Path(args[-1])\n"
+        "(outdir / (src.stem + '.pdf')).write_bytes(b'%PDF-1.4\\n')\n"
+    )
+    script.chmod(script.stat().st_mode | stat.S_IEXEC)
+    return script
@@ -0,0 +1,201 @@
+# -*- coding: utf-8 -*-
+"""Tests for AirVision queries and the async reference-data layer."""
+
+import asyncio
+
+import pandas as pd
+import pytest
+
+from autogc_validation.database.aio import (
+    ReferenceData,
+    gather_reference_data,
+    load_reference_data,
+)
+from autogc_validation.database.airvision import (
+    get_station_temperatures,
+    query_av_rtemp,
+    query_av_rtemp_many,
+)
+from autogc_validation.database.conn import Session
+from autogc_validation.database.enums import CompoundAQSCode, ConcentrationUnit
+from autogc_validation.database.models import MDL, Site
+from autogc_validation.database.operations import insert
+from autogc_validation.qc.room_temp import boundary_temp_readings, check_station_temp
+from autogc_validation.reports.qualifiers import build_temp_null_lines
+
+
+class TestQueryAvRtemp:
+    def test_returns_minute_series_in_range(self, airvision_standin):
+        add, connect = airvision_standin
+        add("UT", "2026-01-01 00:00", [20.0, 21.0, 22.0, 23.0])
+        add("UT", "2026-01-01 00:00", [99.0], parameter="WS")
+        add("HW", "2026-01-01 00:00", [50.0])
+
+        temps = query_av_rtemp(
+            pd.Timestamp("2026-01-01 00:01"), pd.Timestamp("2026-01-01 00:02"),
+            "EQ", connect=connect,
+        )
+        assert list(temps) == [21.0, 22.0]
+        assert isinstance(temps.index, pd.DatetimeIndex)
+
+    def test_site_is_a_bound_parameter(self, airvision_standin):
+        add, connect = airvision_standin
+        add("UT", "2026-01-01 00:00", [20.0])
+        temps = query_av_rtemp(
+            pd.Timestamp("2026-01-01"), pd.Timestamp("2026-01-02"),
+            "UT' OR '1'='1", connect=connect,
+        )
+        assert temps.empty
+
+    def test_rejects_reversed_range(self, airvision_standin):
+        _, connect = airvision_standin
+        with pytest.raises(ValueError):
+            query_av_rtemp(pd.Timestamp("2026-01-02"), pd.Timestamp("2026-01-01"), "EQ", connect=connect)
+
+    def test_many_sites_in_one_query(self, airvision_standin):
+        add, connect = airvision_standin
+        add("UT", "2026-01-01 00:00", [20.0])
+        add("HW", "2026-01-01 00:00", [25.0, 26.0])
+        temps = query_av_rtemp_many(
+            pd.Timestamp("2026-01-01"), pd.Timestamp("2026-01-02"),
+            ["EQ", "HW", "XX"], connect=connect,
+        )
+        assert list(temps["EQ"]) == [20.0]
+        assert list(temps["HW"]) == [25.0, 26.0]
+        assert temps["XX"].empty
+
+
+class TestStationTemperatureCache:
+    @pytest.fixture
+    def counting(self, airvision_standin):
+        add, connect = airvision_standin
+        calls = []
+
+        def counting_connect():
+            calls.append(1)
+            return connect()
+
+        return add, counting_connect, calls
+
+    def test_complete_months_fetched_once(self, counting, tmp_path):
+        add, connect, calls = counting
+        add("UT", "2026-01-10 12:00", [20.0, 21.0])
+        add("HW", "2026-02-01 00:00", [22.0])
+        cache = tmp_path / "cache.db"
+        start, end = pd.Timestamp("2026-01-01"), pd.Timestamp("2026-02-28 23:59:59")
+
+        first = get_station_temperatures(start, end, ["EQ", "HW"], connect=connect, cache_path=cache)
+        # AirVision changes after the fetch are not seen: the months are final
+        add("UT", "2026-01-20 00:00", [99.0])
+        second = get_station_temperatures(start, end, ["EQ", "HW"], connect=connect, cache_path=cache)
+
+        assert len(calls) == 1
+        assert list(second["EQ"]) == list(first["EQ"]) == [20.0, 21.0]
+        assert list(second["HW"]) == [22.0]
+
+    def test_only_missing_months_fetched(self, counting, tmp_path):
+        add, connect, calls = counting
+        add("UT", "2026-01-10 12:00", [20.0])
+        add("UT", "2026-02-10 12:00", [21.0])
+        cache = tmp_path / "cache.db"
+        get_station_temperatures(
+            pd.Timestamp("2026-01-01"), pd.Timestamp("2026-01-31"), ["EQ"], connect=connect, cache_path=cache,
+        )
+        temps = get_station_temperatures(
+            pd.Timestamp("2026-01-01"), pd.Timestamp("2026-02-28"), ["EQ"], connect=connect, cache_path=cache,
+        )
+        assert len(calls) == 2
+        assert list(temps["EQ"]) == [20.0, 21.0]
+        # Both months are now cached
+        get_station_temperatures(
+            pd.Timestamp("2026-01-05"), pd.Timestamp("2026-02-05"), ["EQ"], connect=connect, cache_path=cache,
+        )
+        assert len(calls) == 2
+
+    def test_unfinished_month_is_refetched(self, counting, tmp_path):
+        add, connect, calls = counting
+        month_start = pd.Timestamp.now().normalize().replace(day=1)
+        add("UT", month_start.strftime("%Y-%m-%d %H:%M"), [20.0])
+        cache = tmp_path / "cache.db"
+        end = month_start + pd.Timedelta(days=1)
+        get_station_temperatures(month_start, end, ["EQ"], connect=connect, cache_path=cache)
+        add("UT", (month_start + pd.Timedelta(minutes=1)).strftime("%Y-%m-%d %H:%M"), [21.0])
+        temps = get_station_temperatures(month_start, end, ["EQ"], connect=connect, cache_path=cache)
+        assert len(calls) == 2
+        assert list(temps["EQ"]) == [20.0, 21.0]
+
+    def test_check_station_temp_flags_out_of_range(self, airvision_standin, tmp_path):
+        add, connect = airvision_standin
+        add("UT", "2026-01-10 12:00", [20.0, 30.0, 10.0])
+        result = check_station_temp("EQ", 1, 2026, connect=connect, cache_path=tmp_path / "cache.db")
+        assert list(result.flagged) == [30.0, 10.0]
+
+    def test_temp_null_lines_look_up_adjacent_readings(self, airvision_standin, tmp_path):
+        add, connect = airvision_standin
+        add("UT", "2025-12-31 23:50", [20.0])
+        add("UT", "2026-01-01 00:00", [35.0, 35.0])
+        add("UT", "2026-01-01 01:00", [20.0])
+        cache = tmp_path / "cache.db"
+        temps = check_station_temp("EQ", 1, 2026, connect=connect, cache_path=cache).temperatures
+
+        prior, following = boundary_temp_readings("EQ", 1, 2026, connect=connect, cache_path=cache)
+        assert prior == pd.Timestamp("2025-12-31 23:50")
+        assert following is None
+
+        with_station = build_temp_null_lines(temps, station="EQ", connect=connect, cache_path=cache)
+        explicit = build_temp_null_lines(temps, prior_temp=prior)
+        pd.testing.assert_frame_equal(with_station, explicit)
+
+
+class TestGatherReferenceData:
+    def _seed(self, temp_db):
+        insert(temp_db, Site(
+            site_id=1, name_short="HW", name_long="Hawthorne",
+            lat=33.9, long=-118.3, date_started="2020-01-01 00:00:00",
+        ))
+        insert(temp_db, MDL(
+            site_id=1, aqs_code=CompoundAQSCode.C_BENZENE,
+            concentration=0.05, units=ConcentrationUnit.PPBV,
+            date_on="2026-01-01 00:00",
+        ))
+
+    def test_gathers_database_and_airvision(self, temp_db, airvision_standin, tmp_path):
+        self._seed(temp_db)
+        add, connect = airvision_standin
+        add("UT", "2026-01-31 23:58", [20.0, 21.0])
+
+        with Session(temp_db, read_only=True) as db:
+            ref = asyncio.run(gather_reference_data(
+                db, 1, "2026-01-01 00:00", "2026-01-31 23:59", ConcentrationUnit.PPBC,
+                station="EQ", connect=connect, cache_path=tmp_path / "cache.db",
+            ))
+        assert isinstance(ref, ReferenceData)
+        assert ref.mdl_periods.iloc[0][int(CompoundAQSCode.C_BENZENE)] == pytest.approx(0.30)
+        assert set(ref.canister_periods) == {"CVS", "LCS", "RTS"}
+        # The 23:59 end date covers the whole final minute
+        assert list(ref.temperatures) == [20.0, 21.0]
+
+    def test_airvision_failure_leaves_temperatures_none(self, temp_db, tmp_path):
+        self._seed(temp_db)
+
+        def unreachable():
+            raise RuntimeError("No SQL Server ODBC driver found on this machine.")
+
+        ref = load_reference_data(
+            temp_db, 1, "2026-01-01 00:00", "2026-01-31 23:59", ConcentrationUnit.PPBC,
+            station="EQ", connect=unreachable, cache_path=tmp_path / "cache.db",
+        )
+        assert ref.temperatures is None
+        assert not ref.mdl_periods.empty
+
+    def test_load_inside_running_loop(self, temp_db):
+        self._seed(temp_db)
+
+        async def notebook_cell():
+            return load_reference_data(
+                temp_db, 1, "2026-01-01 00:00", "2026-01-31 23:59", ConcentrationUnit.PPBC,
+            )
+
+        ref = asyncio.run(notebook_cell())
+        assert ref.temperatures is None
+        assert not ref.mdl_periods.empty
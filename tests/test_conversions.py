@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 """Tests for concentration unit conversions."""
 
+import numpy as np
 import pytest
 import pandas as pd
 
@@ -19,6 +20,8 @@ from autogc_validation.conversions import (
     ppbc_to_ppmc,
     ppmc_to_ppbc,
     convert,
+    convert_array,
+    convert_frame,
 )
 
 
@@ -124,3 +127,65 @@ class TestConvert:
     def test_unknown_aqs_code_raises(self):
         with pytest.raises(ValueError):
             convert(1.0, 99999, ConcentrationUnit.PPBC, ConcentrationUnit.PPBV)
+
+
+class TestConvertArray:
+    def test_matches_scalar_convert(self):
+        codes = [int(CompoundAQSCode.C_BENZENE), int(CompoundAQSCode.C_ETHANE)]
+        for src in ConcentrationUnit:
+            for dst in ConcentrationUnit:
+                result = convert_array([3.0, 5.0], codes, src, dst)
+                expected = [convert(v, c, src, dst) for v, c in zip([3.0, 5.0], codes)]
+                np.testing.assert_allclose(result, expected)
+
+    def test_per_element_source_units(self):
+        benzene = int(CompoundAQSCode.C_BENZENE)
+        result = convert_array(
+            [6.0, 1.0, 0.006], benzene,
+            ["ppbc", "ppbv", "ppmc"], ConcentrationUnit.PPBV,
+        )
+        np.testing.assert_allclose(result, [1.0, 1.0, 1.0])
+
+    def test_codes_broadcast_over_columns(self):
+        codes = [int(CompoundAQSCode.C_BENZENE), int(CompoundAQSCode.C_ETHANE)]
+        result = convert_array(
+            [[1.0, 1.0], [2.0, 2.0]], codes,
+            ConcentrationUnit.PPBV, ConcentrationUnit.PPBC,
+        )
+        np.testing.assert_allclose(result, [[6.0, 2.0], [12.0, 4.0]])
+
+    def test_nan_passes_through(self):
+        result = convert_array(
+            [np.nan], int(CompoundAQSCode.C_BENZENE),
+            ConcentrationUnit.PPBV, ConcentrationUnit.PPBC,
+        )
+        assert np.isnan(result[0])
+
+    def test_unknown_code_raises(self):
+        with pytest.raises(ValueError, match="99999"):
+            convert_array([1.0], [99999], ConcentrationUnit.PPBC, ConcentrationUnit.PPBV)
+
+    def test_unknown_code_allowed_without_unit_change(self):
+        result = convert_array([1.0], [99999], ConcentrationUnit.PPBC, ConcentrationUnit.PPBC)
+        assert result[0] == 1.0
+
+    def test_invalid_unit_raises(self):
+        with pytest.raises(ValueError, match="Unsupported"):
+            convert_array([1.0], [int(CompoundAQSCode.C_BENZENE)], "ugm3", ConcentrationUnit.PPBV)
+
+
+class TestConvertFrame:
+    def test_converts_code_columns_and_keeps_others(self):
+        benzene = int(CompoundAQSCode.C_BENZENE)
+        df = pd.DataFrame({"filename": ["a", "b"], benzene: [1.0, 2.0]})
+        df.attrs["units"] = ConcentrationUnit.PPBV
+        result = convert_frame(df, ConcentrationUnit.PPBC)
+        assert list(result["filename"]) == ["a", "b"]
+        assert list(result[benzene]) == [6.0, 12.0]
+        assert result.attrs["units"] == ConcentrationUnit.PPBC
+        assert df.attrs["units"] == ConcentrationUnit.PPBV
+
+    def test_missing_units_raises(self):
+        df = pd.DataFrame({int(CompoundAQSCode.C_BENZENE): [1.0]})
+        with pytest.raises(ValueError, match="units"):
+            convert_frame(df, ConcentrationUnit.PPBC)
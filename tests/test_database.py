@@ -1,25 +1,37 @@
 # -*- coding: utf-8 -*-
 """Tests for database operations — init, insert, get_table, transaction."""
 
+import os
 import sqlite3
+from concurrent.futures import ThreadPoolExecutor
 
 import pytest
 import pandas as pd
 
 from autogc_validation.database.management.init_db import initialize_database
+from autogc_validation.database.management.backup import (
+    backup_database, dump_database, restore_backup, restore_database,
+)
+from autogc_validation.database.management.migrate import (
+    MIGRATIONS, get_applied_versions, migrate_database,
+)
 from autogc_validation.database.models import (
     MODEL_REGISTRY, Site, CanisterTypes, PrimaryCanister,
     CanisterConcentration, SiteCanister, MDL,
 )
-from autogc_validation.database.operations import insert, get_table
+from autogc_validation.database.operations import (
+    insert, insert_many, InsertCounts, get_table, retire_mdl,
+    load_results, get_results, get_results_wide,
+)
 from autogc_validation.database.operations.canister_info import (
     get_active_canister_concentrations, get_canister_periods,
+    get_canister_periods_by_type,
 )
 from autogc_validation.database.operations.mdl_info import (
     get_active_mdls, get_mdl_periods,
 )
 from autogc_validation.database.enums import CompoundAQSCode, ConcentrationUnit
-from autogc_validation.database.conn import transaction
+from autogc_validation.database.conn import Session, connection, snapshot, transaction
 
 
 class TestInitializeDatabase:
@@ -78,6 +90,66 @@ class TestInsert:
             insert(temp_db, {"not": "a model"})
 
 
+class TestInsertMany:
+    def _site(self, site_id, name=None):
+        return Site(
+            site_id=site_id, name_short=f"B{site_id}", name_long=name or f"Bulk Site {site_id}",
+            lat=34.0, long=-118.0, date_started="2026-01-01 00:00:00",
+        )
+
+    def test_counts_inserted_and_skipped(self, temp_db):
+        insert(temp_db, self._site(1))
+        counts = insert_many(temp_db, [self._site(1), self._site(2), self._site(3)])
+        assert counts == InsertCounts(inserted=2, duplicates=1)
+        assert sorted(get_table(temp_db, "sites")["site_id"]) == [1, 2, 3]
+
+    def test_replace_overwrites_existing(self, temp_db):
+        insert(temp_db, self._site(1, name="Old"))
+        counts = insert_many(
+            temp_db, [self._site(1, name="New"), self._site(2)], on_conflict="replace",
+        )
+        assert counts == InsertCounts(inserted=1, duplicates=1)
+        sites = get_table(temp_db, "sites").set_index("site_id")
+        assert sites.loc[1, "name_long"] == "New"
+
+    def test_mixed_models_inserted_in_order(self, temp_db):
+        counts = insert_many(temp_db, [
+            self._site(1),
+            MDL(site_id=1, aqs_code=CompoundAQSCode.C_BENZENE,
+                concentration=0.05, units=ConcentrationUnit.PPBV,
+                date_on="2026-01-01 00:00"),
+        ])
+        assert counts.inserted == 2
+        assert len(get_table(temp_db, "mdls")) == 1
+
+    def test_foreign_key_violation_rolls_back_batch(self, temp_db):
+        with pytest.raises(sqlite3.IntegrityError):
+            insert_many(temp_db, [
+                self._site(1),
+                MDL(site_id=42, aqs_code=CompoundAQSCode.C_BENZENE,
+                    concentration=0.05, units=ConcentrationUnit.PPBV,
+                    date_on="2026-01-01 00:00"),
+            ])
+        assert get_table(temp_db, "sites").empty
+
+    def test_not_null_violation_is_not_counted_as_duplicate(self, temp_db):
+        mdl = MDL(site_id=1, aqs_code=CompoundAQSCode.C_BENZENE,
+                  concentration=0.05, units=ConcentrationUnit.PPBV,
+                  date_on="2026-01-01 00:00")
+        mdl.units = None
+        with pytest.raises(sqlite3.IntegrityError, match="NOT NULL"):
+            insert_many(temp_db, [self._site(1), mdl])
+        assert get_table(temp_db, "sites").empty
+
+    def test_invalid_on_conflict_raises(self, temp_db):
+        with pytest.raises(ValueError, match="on_conflict"):
+            insert_many(temp_db, [self._site(1)], on_conflict="update")
+
+    def test_raises_for_unknown_type(self, temp_db):
+        with pytest.raises(TypeError):
+            insert_many(temp_db, [{"not": "a model"}])
+
+
 class TestGetTable:
     def test_returns_dataframe(self, temp_db):
         result = get_table(temp_db, "voc_info")
@@ -120,6 +192,113 @@ class TestTransaction:
         assert 77 not in result["site_id"].values
 
 
+class TestSession:
+    def test_reuses_connection_within_thread(self, temp_db):
+        with Session(temp_db) as db:
+            with connection(db) as first:
+                pass
+            with transaction(db) as second:
+                pass
+            assert first is second
+
+    def test_separate_connection_per_thread(self, temp_db):
+        with Session(temp_db) as db:
+            main = db.connect()
+            with ThreadPoolExecutor(max_workers=1) as pool:
+                other = pool.submit(db.connect).result()
+            assert other is not main
+
+    def test_pragmas_applied(self, temp_db):
+        with Session(temp_db) as db:
+            conn = db.connect()
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+            assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+            assert conn.execute("PRAGMA foreign_keys").fetchone()[0] == 1
+
+    def test_operations_accept_session(self, temp_db):
+        with Session(temp_db) as db:
+            insert(db, Site(
+                site_id=5, name_short="SS", name_long="Session Site",
+                lat=35.0, long=-119.0, date_started="2026-01-01 00:00:00",
+            ))
+            assert 5 in get_table(db, "sites")["site_id"].values
+        assert 5 in get_table(temp_db, "sites")["site_id"].values
+
+    def test_rollback_keeps_connection_usable(self, temp_db):
+        with Session(temp_db) as db:
+            with pytest.raises(RuntimeError):
+                with transaction(db) as conn:
+                    conn.execute(
+                        "INSERT INTO sites (site_id, name_short, name_long, lat, long, date_started) "
+                        "VALUES (?, ?, ?, ?, ?, ?)",
+                        (66, "RB", "Rollback", 36.0, -120.0, "2026-01-01 00:00:00"),
+                    )
+                    raise RuntimeError("Force rollback")
+            assert 66 not in get_table(db, "sites")["site_id"].values
+
+    def test_closed_session_raises(self, temp_db):
+        db = Session(temp_db)
+        db.close()
+        with pytest.raises(sqlite3.ProgrammingError):
+            db.connect()
+
+
+class TestReadOnly:
+    def _site(self, site_id):
+        return Site(
+            site_id=site_id, name_short=f"R{site_id}", name_long=f"Read Only {site_id}",
+            lat=35.0, long=-119.0, date_started="2026-01-01 00:00:00",
+        )
+
+    def test_read_only_session_rejects_writes(self, temp_db):
+        with Session(temp_db, read_only=True) as db:
+            assert not get_table(db, "canister_types").empty
+            with pytest.raises(sqlite3.OperationalError):
+                insert(db, self._site(7))
+        assert 7 not in get_table(temp_db, "sites")["site_id"].values
+
+    def test_reader_sees_writer_commits_without_blocking(self, temp_db):
+        with Session(temp_db, read_only=True) as reader:
+            with transaction(temp_db) as conn:
+                conn.execute(
+                    "INSERT INTO sites (site_id, name_short, name_long, lat, long, date_started) "
+                    "VALUES (8, 'R8', 'Read Only 8', 35.0, -119.0, '2026-01-01 00:00:00')"
+                )
+                # The writer's uncommitted row is invisible, and the read does not block
+                assert 8 not in get_table(reader, "sites")["site_id"].values
+            assert 8 in get_table(reader, "sites")["site_id"].values
+
+    def test_immutable_requires_read_only(self, temp_db):
+        with pytest.raises(ValueError):
+            Session(temp_db, immutable=True)
+
+    def test_writer_uses_wal(self, temp_db):
+        with transaction(temp_db) as conn:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+    def test_reads_leave_journal_mode_alone(self, tmp_path):
+        path = tmp_path / "plain.db"
+        with sqlite3.connect(path) as conn:
+            conn.execute("CREATE TABLE t (x INTEGER)")
+        conn.close()
+        with connection(path) as conn:
+            assert conn.execute("SELECT COUNT(*) FROM t").fetchone()[0] == 0
+        with sqlite3.connect(path) as conn:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "delete"
+        conn.close()
+
+    def test_snapshot_is_isolated_and_removed(self, temp_db, tmp_path):
+        insert(temp_db, self._site(9))
+        with snapshot(temp_db, directory=tmp_path) as db:
+            copy_path = db.database
+            insert(temp_db, self._site(10))
+            sites = get_table(db, "sites")["site_id"].values
+            assert 9 in sites and 10 not in sites
+            with pytest.raises(sqlite3.OperationalError):
+                insert(db, self._site(11))
+        assert not os.path.exists(copy_path)
+
+
 class TestGetActiveCanisterConcentrations:
     def _seed_canister_data(self, temp_db):
         """Insert a site, canister type, primary canister, concentrations, and site canister."""
@@ -244,6 +423,38 @@ class TestGetMdlPeriods:
         )
         assert result.attrs["units"] == ConcentrationUnit.PPBV
 
+    def test_matches_active_mdls_at_each_breakpoint(self, temp_db):
+        self._seed_mdl_data(temp_db)
+        insert(temp_db, MDL(
+            site_id=1, aqs_code=CompoundAQSCode.C_TOLUENE,
+            concentration=0.7, units=ConcentrationUnit.PPBC,
+            date_on="2026-01-10 00:00", date_off="2026-01-20 00:00",
+        ))
+        result = get_mdl_periods(
+            temp_db, site_id=1,
+            start_date="2026-01-01 00:00", end_date="2026-01-31 23:59",
+            output_unit=ConcentrationUnit.PPBV,
+        )
+        assert list(result.index) == [
+            pd.Timestamp("2026-01-01 00:00"), pd.Timestamp("2026-01-10 00:00"),
+        ]
+        toluene = int(CompoundAQSCode.C_TOLUENE)
+        assert pd.isna(result.loc[pd.Timestamp("2026-01-01 00:00"), toluene])
+        for date in ("2026-01-01 00:00", "2026-01-10 00:00"):
+            active = get_active_mdls(temp_db, 1, date, ConcentrationUnit.PPBV)
+            for code, value in active.iloc[0].items():
+                assert result.loc[pd.Timestamp(date), code] == pytest.approx(value)
+
+    def test_no_active_mdls_returns_empty_row(self, temp_db):
+        self._seed_mdl_data(temp_db)
+        result = get_mdl_periods(
+            temp_db, site_id=1,
+            start_date="2025-06-01 00:00", end_date="2025-06-30 23:59",
+            output_unit=ConcentrationUnit.PPBV,
+        )
+        assert list(result.index) == [pd.Timestamp("2025-06-01 00:00")]
+        assert result.empty or result.isna().all().all()
+
 
 class TestGetCanisterPeriods:
     def _seed_canister_data(self, temp_db):
@@ -320,4 +531,300 @@ class TestGetCanisterPeriods:
         )
         assert result.attrs["units"] == ConcentrationUnit.PPBV
 
+    def test_by_type_returns_frame_per_type(self, temp_db):
+        self._seed_canister_data(temp_db)
+        insert(temp_db, CanisterTypes(canister_type="LCS"))
+        insert(temp_db, PrimaryCanister(
+            primary_canister_id="CAN-101", canister_type="LCS",
+        ))
+        insert(temp_db, CanisterConcentration(
+            primary_canister_id="CAN-101", aqs_code=45201,
+            concentration=4.0, units="ppbv", canister_type="LCS",
+        ))
+        insert(temp_db, SiteCanister(
+            site_canister_id="SC-101", site_id=1,
+            primary_canister_id="CAN-101", dilution_ratio=1.0,
+            blend_date="2026-01-10 00:00:00", date_on="2026-01-10 00:00:00",
+        ))
+        result = get_canister_periods_by_type(
+            temp_db, site_id=1,
+            start_date="2026-01-01 00:00", end_date="2026-01-31 23:59",
+            output_unit=ConcentrationUnit.PPBC,
+        )
+        assert set(result) == {"CVS", "RTS", "LCS"}
+        # CVS: 20 ppbV x 0.5 dilution x 6 carbons
+        assert result["CVS"].loc[pd.Timestamp("2026-01-01 00:00"), 45201] == pytest.approx(60.0)
+        assert list(result["LCS"].index) == [
+            pd.Timestamp("2026-01-01 00:00"), pd.Timestamp("2026-01-10 00:00"),
+        ]
+        assert pd.isna(result["LCS"].iloc[0]).all()
+        assert result["LCS"].iloc[1][45201] == pytest.approx(24.0)
+        assert result["RTS"].isna().all().all()
+        assert all(df.attrs["units"] == ConcentrationUnit.PPBC for df in result.values())
+
+    def test_canister_without_concentrations_starts_empty_period(self, temp_db):
+        self._seed_canister_data(temp_db)
+        with transaction(temp_db) as conn:
+            conn.execute(
+                "UPDATE site_canisters SET date_off = ? WHERE site_canister_id = ?",
+                ("2026-01-15 00:00:00", "SC-001"),
+            )
+        insert(temp_db, PrimaryCanister(
+            primary_canister_id="CAN-002", canister_type="CVS",
+        ))
+        insert(temp_db, SiteCanister(
+            site_canister_id="SC-002", site_id=1,
+            primary_canister_id="CAN-002", dilution_ratio=0.5,
+            blend_date="2026-01-15 00:00:00", date_on="2026-01-15 00:00:00",
+        ))
+        result = get_canister_periods(
+            temp_db, site_id=1, canister_type="CVS",
+            start_date="2026-01-01 00:00", end_date="2026-01-31 23:59",
+            output_unit=ConcentrationUnit.PPBV,
+        )
+        assert list(result.index) == [
+            pd.Timestamp("2026-01-01 00:00"), pd.Timestamp("2026-01-15 00:00"),
+        ]
+        assert result.iloc[0][45201] == pytest.approx(10.0)
+        assert pd.isna(result.iloc[1]).all()
+
+
+class TestMigrations:
+    def test_new_database_is_current(self, temp_db):
+        assert get_applied_versions(temp_db) == {v for v, _, _ in MIGRATIONS}
+        assert migrate_database(temp_db) == []
 
+    def test_migrates_database_without_indexes(self, temp_db):
+        with transaction(temp_db) as conn:
+            for name in ("idx_mdls_site_date", "idx_site_canisters_site_date", "idx_pcc_canister"):
+                conn.execute(f"DROP INDEX {name}")
+            conn.execute("DELETE FROM SchemaVersion WHERE version = ?", ("2",))
+
+        assert migrate_database(temp_db) == ["2"]
+        with connection(temp_db) as conn:
+            indexes = {
+                row[0] for row in conn.execute(
+                    "SELECT name FROM sqlite_master WHERE type = 'index'"
+                )
+            }
+        assert {"idx_mdls_site_date", "idx_site_canisters_site_date", "idx_pcc_canister"} <= indexes
+
+
+class TestQueryPlans:
+    """Period lookups must reach base tables through indexes, never a full scan."""
+
+    _BASE_TABLES = {
+        "mdls", "m", "site_canisters", "sc",
+        "primary_canisters", "p", "primary_canister_concentration", "pc",
+    }
+
+    def _plans(self, temp_db, *calls):
+        with Session(temp_db) as db:
+            conn = db.connect()
+            statements = []
+            conn.set_trace_callback(statements.append)
+            for call in calls:
+                call(db)
+            conn.set_trace_callback(None)
+            return [
+                [row["detail"] for row in conn.execute("EXPLAIN QUERY PLAN " + sql)]
+                for sql in statements
+                if sql.lstrip().upper().startswith(("SELECT", "WITH"))
+            ]
+
+    def test_period_queries_use_indexes(self, temp_db):
+        start, end = "2026-01-01 00:00", "2026-01-31 23:59"
+        plans = self._plans(
+            temp_db,
+            lambda db: get_mdl_periods(db, 1, start, end, ConcentrationUnit.PPBC),
+            lambda db: get_canister_periods_by_type(db, 1, start, end, ConcentrationUnit.PPBC),
+            lambda db: get_active_mdls(db, 1, start, ConcentrationUnit.PPBC),
+            lambda db: get_active_canister_concentrations(db, 1, "CVS", start, ConcentrationUnit.PPBC),
+        )
+        assert len(plans) == 4
+        for plan in plans:
+            scans = [
+                line for line in plan
+                if line.startswith("SCAN ") and line.split()[1] in self._BASE_TABLES
+            ]
+            assert not scans, plan
+        flat = "\n".join(line for plan in plans for line in plan)
+        assert "idx_mdls_site_date" in flat
+        assert "idx_site_canisters_site_date" in flat
+
+
+class TestReferenceCache:
+    def _seed(self, temp_db):
+        insert(temp_db, Site(
+            site_id=1, name_short="HW", name_long="Hawthorne",
+            lat=33.9, long=-118.3, date_started="2020-01-01 00:00:00",
+        ))
+        insert(temp_db, MDL(
+            site_id=1, aqs_code=CompoundAQSCode.C_BENZENE,
+            concentration=0.05, units=ConcentrationUnit.PPBV,
+            date_on="2026-01-01 00:00",
+        ))
+
+    def _periods(self, db):
+        return get_mdl_periods(
+            db, 1, "2026-01-01 00:00", "2026-01-31 23:59", ConcentrationUnit.PPBV,
+        )
+
+    def test_repeat_call_served_from_memory(self, temp_db):
+        self._seed(temp_db)
+        with Session(temp_db) as db:
+            statements = []
+            db.connect().set_trace_callback(statements.append)
+            first = self._periods(db)
+            n_first = len(statements)
+            second = self._periods(db)
+            assert len(statements) == n_first
+            pd.testing.assert_frame_equal(first, second)
+
+    def test_returned_frame_is_a_copy(self, temp_db):
+        self._seed(temp_db)
+        result = self._periods(temp_db)
+        result.iloc[0, 0] = 999.0
+        assert self._periods(temp_db).iloc[0, 0] == pytest.approx(0.05)
+
+    def test_invalidated_by_retire_and_insert(self, temp_db):
+        self._seed(temp_db)
+        assert len(self._periods(temp_db)) == 1
+        retire_mdl(temp_db, 1, CompoundAQSCode.C_BENZENE, "2026-01-01 00:00", "2026-01-15 00:00")
+        insert(temp_db, MDL(
+            site_id=1, aqs_code=CompoundAQSCode.C_BENZENE,
+            concentration=0.10, units=ConcentrationUnit.PPBV,
+            date_on="2026-01-15 00:00",
+        ))
+        result = self._periods(temp_db)
+        assert len(result) == 2
+        assert result.iloc[1, 0] == pytest.approx(0.10)
+
+    def test_invalidated_by_external_write(self, temp_db):
+        self._seed(temp_db)
+        self._periods(temp_db)
+        with sqlite3.connect(temp_db) as conn:
+            conn.execute("UPDATE mdls SET concentration = 0.07")
+        assert self._periods(temp_db).iloc[0, 0] == pytest.approx(0.07)
+
+
+class TestResults:
+    def _seed_site(self, temp_db):
+        insert(temp_db, Site(
+            site_id=1, name_short="HW", name_long="Hawthorne",
+            lat=33.9, long=-118.3, date_started="2020-01-01 00:00:00",
+        ))
+
+    def _frames(self, make_dataset_df):
+        benzene, toluene = int(CompoundAQSCode.C_BENZENE), int(CompoundAQSCode.C_TOLUENE)
+        data = make_dataset_df(values={benzene: 1.5, toluene: float("nan")}, n_rows=3)
+        rt = data.copy()
+        rt[benzene] = 10.1
+        rt[toluene] = float("nan")
+        return data, rt
+
+    def test_load_and_query_roundtrip(self, temp_db, make_dataset_df):
+        self._seed_site(temp_db)
+        data, rt = self._frames(make_dataset_df)
+        counts = load_results(temp_db, 1, data, rt)
+        # Toluene has neither value nor RT, so only benzene rows are stored
+        assert counts == InsertCounts(inserted=3, duplicates=0)
+
+        wide = get_results_wide(temp_db, 1, "2026-01-15 00:00", "2026-01-15 23:59")
+        benzene = int(CompoundAQSCode.C_BENZENE)
+        assert list(wide.index) == list(data.index)
+        assert list(wide["filename"]) == list(data["filename"])
+        assert (wide[benzene] == 1.5).all()
+        rts = get_results_wide(temp_db, 1, "2026-01-15 00:00", "2026-01-15 23:59", field="rt")
+        assert (rts[benzene] == 10.1).all()
+
+    def test_reload_replaces(self, temp_db, make_dataset_df):
+        self._seed_site(temp_db)
+        data, rt = self._frames(make_dataset_df)
+        load_results(temp_db, 1, data, rt)
+        data[int(CompoundAQSCode.C_BENZENE)] = 2.0
+        counts = load_results(temp_db, 1, data, rt)
+        assert counts == InsertCounts(inserted=0, duplicates=3)
+        long = get_results(temp_db, 1, "2026-01-15 00:00", "2026-01-15 23:59")
+        assert (long["value"] == 2.0).all()
+
+    def test_qualifiers_and_filters(self, temp_db, make_dataset_df):
+        self._seed_site(temp_db)
+        data, rt = self._frames(make_dataset_df)
+        benzene = int(CompoundAQSCode.C_BENZENE)
+        qualifiers = pd.DataFrame("", index=data.index, columns=[benzene])
+        qualifiers.iloc[1, 0] = "LB"
+        load_results(temp_db, 1, data, rt, qualifiers=qualifiers)
+
+        long = get_results(
+            temp_db, 1, "2026-01-15 09:00", "2026-01-15 09:00",
+            aqs_codes=[benzene], sample_types=["s"],
+        )
+        assert len(long) == 1
+        assert long.iloc[0]["qualifiers"] == "LB"
+        assert get_results(temp_db, 1, "2026-01-15 00:00", "2026-01-15 23:59", sample_types=["b"]).empty
+
+    def test_date_only_range_includes_whole_last_day(self, temp_db, make_dataset_df):
+        self._seed_site(temp_db)
+        data, rt = self._frames(make_dataset_df)
+        load_results(temp_db, 1, data, rt)
+        long = get_results(temp_db, 1, "2026-01-15", "2026-01-15")
+        assert len(long) == len(data)
+        wide = get_results_wide(temp_db, 1, "2026-01-01", "2026-01-15")
+        assert list(wide.index) == list(data.index)
+
+    def test_date_range_query_uses_primary_key(self, temp_db):
+        with connection(temp_db) as conn:
+            plan = [row["detail"] for row in conn.execute(
+                "EXPLAIN QUERY PLAN SELECT * FROM results "
+                "WHERE site_id = 1 AND date_time >= '2026-01-01' AND date_time <= '2026-02-01'"
+            )]
+        assert any(line.startswith("SEARCH results USING PRIMARY KEY") for line in plan), plan
+
+
+class TestBackup:
+    def _seed(self, temp_db):
+        insert(temp_db, Site(
+            site_id=1, name_short="HW", name_long="Hawthorne\nStation",
+            lat=33.9, long=-118.3, date_started="2020-01-01 00:00:00",
+        ))
+
+    def _sites(self, db):
+        with connection(db) as conn:
+            return [tuple(r) for r in conn.execute("SELECT * FROM sites")]
+
+    def test_dump_restore_roundtrip(self, temp_db, tmp_path):
+        self._seed(temp_db)
+        sql_path = dump_database(temp_db, tmp_path / "dump.sql")
+        restored = tmp_path / "restored.db"
+        restore_database(sql_path, restored)
+        # The multi-line name survives statement-by-statement restore
+        assert self._sites(str(restored)) == self._sites(temp_db)
+
+    def test_restore_refuses_overwrite(self, temp_db, tmp_path):
+        sql_path = dump_database(temp_db, tmp_path / "dump.sql")
+        with pytest.raises(FileExistsError):
+            restore_database(sql_path, temp_db)
+        with pytest.raises(FileExistsError):
+            restore_backup(temp_db, temp_db)
+
+    def test_online_backup_reports_progress(self, temp_db, tmp_path):
+        self._seed(temp_db)
+        steps = []
+        with Session(temp_db) as db:
+            # A reader holding an open connection does not block the backup
+            get_table(db, "sites")
+            out = backup_database(temp_db, tmp_path / "backup.db", pages=1,
+                                  progress=lambda done, total: steps.append((done, total)))
+        assert len(steps) > 1
+        assert steps[-1][0] == steps[-1][1]
+        assert self._sites(str(out)) == self._sites(temp_db)
+
+    def test_restore_backup_replaces_database(self, temp_db, tmp_path):
+        self._seed(temp_db)
+        backup = backup_database(temp_db, tmp_path / "backup.db")
+        target = tmp_path / "target.db"
+        initialize_database(str(target))
+        restore_backup(backup, target, force=True)
+        assert self._sites(str(target)) == self._sites(temp_db)
+        assert not (tmp_path / ".target.db.tmp").exists()
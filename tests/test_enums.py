@@ -3,7 +3,9 @@
 
 import pytest
 
+from autogc_validation.database.config import VOC_DATA
 from autogc_validation.database.enums import (
+    COMPOUND_REGISTRY,
     CompoundAQSCode,
     CompoundName,
     ColumnType,
@@ -94,3 +96,39 @@ class TestGetCodesByCategory:
     def test_alkene_contains_ethylene(self):
         codes = get_codes_by_category(VOCCategory.ALKENE)
         assert CompoundAQSCode.C_ETHYLENE in codes
+
+
+class TestCompoundRegistry:
+    def test_matches_voc_data(self):
+        for i, v in enumerate(VOC_DATA):
+            assert COMPOUND_REGISTRY.index(v["aqs_code"]) == i
+            assert COMPOUND_REGISTRY.carbon_count[i] == v["carbon_count"]
+            assert COMPOUND_REGISTRY.molecular_weight[i] == v["molecular_weight"]
+            assert COMPOUND_REGISTRY.column[i] == v["column"]
+            assert COMPOUND_REGISTRY.category[i] == v["category"]
+
+    def test_vectorized_indices(self):
+        codes = [int(CompoundAQSCode.C_TOLUENE), int(CompoundAQSCode.C_ETHANE)]
+        idx = COMPOUND_REGISTRY.indices(codes)
+        assert list(COMPOUND_REGISTRY.codes[idx]) == codes
+        assert list(COMPOUND_REGISTRY.carbon_count[idx]) == [7, 2]
+
+    def test_unknown_codes(self):
+        assert 99999 not in COMPOUND_REGISTRY
+        with pytest.raises(ValueError, match="99999"):
+            COMPOUND_REGISTRY.indices([45201, 99999])
+        assert list(COMPOUND_REGISTRY.indices([-1, 99999, 10000], strict=False)) == [-1, -1, -1]
+        with pytest.raises(ValueError):
+            COMPOUND_REGISTRY.index(99999)
+
+    def test_read_only(self):
+        with pytest.raises(AttributeError):
+            COMPOUND_REGISTRY.codes = None
+        with pytest.raises(ValueError):
+            COMPOUND_REGISTRY.carbon_count[0] = 99
+
+    def test_codes_by_column_in_elution_order(self):
+        bp = COMPOUND_REGISTRY.codes_by_column(ColumnType.BP)
+        orders = COMPOUND_REGISTRY.elution_order[COMPOUND_REGISTRY.indices(bp)]
+        assert list(orders) == sorted(orders)
+        assert set(bp) == BP_CODES
@@ -0,0 +1,576 @@
+# -*- coding: utf-8 -*-
+"""Tests for workspace.files — unzipping and copying data files."""
+
+import errno
+import os
+import shutil
+import sys
+import threading
+import zipfile
+from datetime import datetime
+
+import pytest
+
+from autogc_validation.workspace import converter as converter_module
+from autogc_validation.workspace import copier, files, placement
+from autogc_validation.workspace.content_index import ContentIndex
+from autogc_validation.workspace.converter import SubprocessConverter, open_converter
+from autogc_validation.workspace.copier import CopyJob, copy_files
+from autogc_validation.workspace.files import (
+    ExtensionRoutes,
+    convert_file_to_pdf,
+    convert_folder_contents_to_pdf,
+    move_files_by_extension,
+    move_files_by_week,
+    unzip_files,
+)
+from autogc_validation.workspace.placement import place_file
+
+
+def _make_zip(path, members, date_time=(2026, 1, 15, 8, 30, 0)):
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as zf:
+        for name, data in members.items():
+            info = zipfile.ZipInfo(name, date_time=date_time)
+            zf.writestr(info, data)
+    return path
+
+
+class TestUnzipFiles:
+    @pytest.fixture
+    def temp_dir(self, tmp_path):
+        temp = tmp_path / "temp"
+        temp.mkdir()
+        for i in range(3):
+            _make_zip(temp / f"site{i}.zip", {
+                f"RBA{i}15A.dat": b"dat" * 1000,
+                f"sub/RBA{i}15A.dat.tx1": b"tx1",
+            })
+        return temp
+
+    @pytest.mark.parametrize("workers", [1, 3])
+    def test_extracts_every_archive(self, temp_dir, workers):
+        extracted = unzip_files(temp_dir, temp_dir, max_workers=workers)
+        assert [z.name for z in extracted] == ["site0.zip", "site1.zip", "site2.zip"]
+        for i in range(3):
+            assert (temp_dir / f"site{i}" / f"RBA{i}15A.dat").read_bytes() == b"dat" * 1000
+            assert (temp_dir / f"site{i}" / "sub" / f"RBA{i}15A.dat.tx1").exists()
+
+    def test_preserves_modification_dates(self, temp_dir):
+        unzip_files(temp_dir, temp_dir)
+        mtime = os.stat(temp_dir / "site0" / "RBA015A.dat").st_mtime
+        assert mtime == datetime(2026, 1, 15, 8, 30, 0).timestamp()
+
+    def test_skip_existing_leaves_identical_files(self, temp_dir):
+        unzip_files(temp_dir, temp_dir)
+        target = temp_dir / "site0" / "RBA015A.dat"
+        changed = temp_dir / "site1" / "RBA115A.dat"
+        os.utime(target, (0, 0))
+        changed.write_bytes(b"different")
+
+        unzip_files(temp_dir, temp_dir, skip_existing=True)
+        assert os.stat(target).st_mtime == 0
+        assert changed.read_bytes() == b"dat" * 1000
+
+    def test_bad_zip_is_reported_not_raised(self, temp_dir):
+        (temp_dir / "broken.zip").write_bytes(b"not a zip")
+        extracted = unzip_files(temp_dir, temp_dir)
+        assert "broken.zip" not in [z.name for z in extracted]
+        assert len(extracted) == 3
+
+    def test_shared_folder_extracts_same_named_members_in_order(self, tmp_path, monkeypatch):
+        source, dest = tmp_path / "zips", tmp_path / "out"
+        source.mkdir()
+        dest.mkdir()
+        for i in range(4):
+            _make_zip(source / f"site{i}.zip", {"shared.txt": bytes([65 + i]) * 100_000},
+                      date_time=(2026, 1, 10 + i, 8, 30, 0))
+
+        running, peak = 0, 0
+        lock = threading.Lock()
+        extract = files._extract_archive
+
+        def tracking(*args, **kwargs):
+            nonlocal running, peak
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            try:
+                return extract(*args, **kwargs)
+            finally:
+                with lock:
+                    running -= 1
+
+        monkeypatch.setattr(files, "_extract_archive", tracking)
+        extracted = unzip_files(source, dest, create_subfolders=False, max_workers=4)
+        assert len(extracted) == 4
+        assert peak == 1
+        assert (dest / "shared.txt").read_bytes() == b"D" * 100_000
+        assert os.stat(dest / "shared.txt").st_mtime == datetime(2026, 1, 13, 8, 30, 0).timestamp()
+
+    def test_unsafe_member_paths_stay_inside(self, tmp_path):
+        temp = tmp_path / "temp"
+        temp.mkdir()
+        _make_zip(temp / "evil.zip", {"../../escape.dat": b"x"})
+        unzip_files(temp, temp)
+        assert not (tmp_path / "escape.dat").exists()
+        assert (temp / "evil" / "escape.dat").exists()
+
+
+class TestUnzipRoutes:
+    @pytest.fixture
+    def temp_dir(self, tmp_path):
+        temp = tmp_path / "temp"
+        temp.mkdir()
+        _make_zip(temp / "week1.zip", {
+            "RBSA15I.dat": b"one",
+            "nested/RBSA15I.dat.tx1": b"tx1",
+            "report.xlsx": b"xlsx",
+            "notes.log": b"log",
+        })
+        _make_zip(temp / "week2.zip", {"RBSA15I.DAT": b"dup", "RBSA16I.dat": b"two"})
+        return temp
+
+    def test_routes_members_to_final_folders(self, temp_dir, tmp_path):
+        dat, tx1, docs = tmp_path / "dat", tmp_path / "tx1", tmp_path / "docs"
+        routes = ExtensionRoutes({".dat": dat, ".tx1": tx1, ".xlsx": docs})
+        extracted = unzip_files(temp_dir, temp_dir, routes=routes, extract_unrouted=False, max_workers=1)
+
+        assert len(extracted) == 2
+        assert (dat / "RBSA15I.dat").read_bytes() == b"one"
+        assert (dat / "RBSA16I.dat").exists()
+        assert (dat / "copies" / "RBSA15I.DAT").read_bytes() == b"dup"
+        assert (tx1 / "RBSA15I.dat.tx1").exists()
+        assert (docs / "report.xlsx").exists()
+        # Unrouted members are not extracted
+        assert not (temp_dir / "week1").exists()
+
+        summary = routes.summaries[".dat"]
+        assert summary["found"][0] == 3
+        assert summary["copied"] == (2, ["RBSA15I.dat", "RBSA16I.dat"])
+        assert summary["duplicates"] == (1, ["RBSA15I.DAT"])
+        assert summary["errors"] == (0, [])
+
+    def test_unrouted_members_extracted_when_asked(self, temp_dir, tmp_path):
+        unzip_files(temp_dir, temp_dir, routes={".dat": tmp_path / "dat"})
+        assert (temp_dir / "week1" / "notes.log").exists()
+        assert (temp_dir / "week1" / "nested" / "RBSA15I.dat.tx1").exists()
+        assert not (temp_dir / "week1" / "RBSA15I.dat").exists()
+
+    def test_same_zip_twice_is_skipped_with_index(self, temp_dir, tmp_path):
+        shutil.copy(temp_dir / "week1.zip", temp_dir / "week1 (resent).zip")
+        routes = ExtensionRoutes({".dat": tmp_path / "dat"}, content_index=ContentIndex())
+        unzip_files(temp_dir, temp_dir, routes=routes, extract_unrouted=False, max_workers=3)
+        summary = routes.summaries[".dat"]
+        # week1's RBSA15I.dat is identical in both copies; week2's .DAT differs
+        assert summary["identical"][0] == 1
+        assert summary["duplicates"] == (1, ["RBSA15I.DAT"])
+        assert summary["copied"][0] == 2
+
+    def test_rerun_with_skip_existing_makes_no_copies(self, temp_dir, tmp_path):
+        dat = tmp_path / "dat"
+        unzip_files(temp_dir, temp_dir, routes={".dat": dat}, extract_unrouted=False, max_workers=1)
+        routes = ExtensionRoutes({".dat": dat})
+        unzip_files(temp_dir, temp_dir, routes=routes, extract_unrouted=False,
+                    skip_existing=True, max_workers=1)
+        assert sorted(p.name for p in (dat / "copies").iterdir()) == ["RBSA15I.DAT"]
+        assert routes.summaries[".dat"]["copied"][0] == 2
+
+
+class TestContentIndex:
+    def test_hash_cached_until_file_changes(self, tmp_path, monkeypatch):
+        f = tmp_path / "a.dat"
+        f.write_bytes(b"abc")
+        index = ContentIndex()
+        first = index.hash(f)
+
+        import autogc_validation.workspace.content_index as module
+        calls = []
+        real = module.hash_stream
+        monkeypatch.setattr(module, "hash_stream", lambda s: calls.append(1) or real(s))
+        assert index.hash(f) == first
+        assert calls == []
+
+        f.write_bytes(b"abcd")
+        os.utime(f, ns=(0, 10**9))
+        assert index.hash(f) != first
+        assert calls == [1]
+
+    def test_persists_relative_to_workspace(self, tmp_path):
+        f = tmp_path / "data" / "a.dat"
+        f.parent.mkdir()
+        f.write_bytes(b"abc")
+        index = ContentIndex(tmp_path / ".content_index.json")
+        digest = index.hash(f)
+        index.save()
+
+        reloaded = ContentIndex(tmp_path / ".content_index.json")
+        assert len(reloaded) == 1
+        assert reloaded.hash(f) == digest
+
+
+class TestMoveFilesByExtension:
+    @pytest.fixture
+    def source(self, tmp_path):
+        src = tmp_path / "src"
+        (src / "a").mkdir(parents=True)
+        (src / "b").mkdir()
+        (src / "a" / "RBSA15I.dat").write_bytes(b"same")
+        (src / "b" / "RBSA15I.dat").write_bytes(b"same")
+        (src / "b" / "rbsa15i.DAT").write_bytes(b"conflict")
+        (tmp_path / "dest").mkdir()
+        return src
+
+    def test_stem_duplicates_copied_without_index(self, source, tmp_path):
+        out, summary = move_files_by_extension(source, tmp_path / "dest", ".dat", "dat")
+        assert summary["copied"][0] == 1
+        assert summary["duplicates"][0] == 2
+        assert summary["identical"] == (0, [])
+
+    def test_identical_files_skipped_with_index(self, source, tmp_path):
+        out, summary = move_files_by_extension(
+            source, tmp_path / "dest", ".dat", "dat", content_index=ContentIndex(),
+        )
+        assert summary["copied"][0] == 1
+        assert summary["identical"][0] == 1
+        # The true conflict is kept, whichever file arrived first
+        assert summary["duplicates"][0] == 1
+        kept = sorted(p.read_bytes() for p in out.rglob("*") if p.is_file())
+        assert kept == [b"conflict", b"same"]
+
+    def test_rerun_with_index_copies_nothing(self, source, tmp_path):
+        index = ContentIndex()
+        move_files_by_extension(source, tmp_path / "dest", ".dat", "dat", content_index=index)
+        _, summary = move_files_by_extension(source, tmp_path / "dest", ".dat", "dat", content_index=index)
+        assert summary["identical"][0] == 3
+        assert summary["copied"][0] == summary["duplicates"][0] == 0
+
+
+class TestPlaceFile:
+    @pytest.fixture(autouse=True)
+    def _forget_unsupported(self):
+        placement._unsupported.clear()
+        yield
+        placement._unsupported.clear()
+
+    @pytest.fixture
+    def src(self, tmp_path):
+        path = tmp_path / "RBSA15I.dat"
+        path.write_bytes(b"data")
+        return path
+
+    def test_hardlink_shares_the_file(self, src, tmp_path):
+        assert place_file(src, tmp_path / "linked.dat", "hardlink") == "hardlink"
+        assert os.path.samefile(src, tmp_path / "linked.dat")
+
+    def test_symlink_points_at_source(self, src, tmp_path):
+        assert place_file(src, tmp_path / "sym.dat", "symlink") == "symlink"
+        assert (tmp_path / "sym.dat").is_symlink()
+        assert (tmp_path / "sym.dat").read_bytes() == b"data"
+
+    def test_replaces_existing_target(self, src, tmp_path):
+        (tmp_path / "linked.dat").write_bytes(b"old")
+        place_file(src, tmp_path / "linked.dat", "hardlink")
+        assert (tmp_path / "linked.dat").read_bytes() == b"data"
+
+    def test_copy_replaces_hardlinked_target(self, src, tmp_path):
+        target = tmp_path / "linked.dat"
+        place_file(src, target, "hardlink")
+        assert place_file(src, target, "copy") == "copy"
+        assert not os.path.samefile(src, target)
+        assert target.read_bytes() == b"data"
+
+    def test_copy_does_not_write_through_links(self, src, tmp_path):
+        other = tmp_path / "other.dat"
+        other.write_bytes(b"other")
+        for strategy, name in (("hardlink", "hard.dat"), ("symlink", "sym.dat")):
+            place_file(other, tmp_path / name, strategy)
+            place_file(src, tmp_path / name, "copy")
+            assert (tmp_path / name).read_bytes() == b"data"
+            assert not (tmp_path / name).is_symlink()
+        assert other.read_bytes() == b"other"
+
+    def test_falls_back_to_copy_once_unsupported(self, src, tmp_path, monkeypatch):
+        calls = []
+
+        def cross_device(a, b):
+            calls.append(b)
+            raise OSError(errno.EXDEV, "Invalid cross-device link")
+
+        monkeypatch.setattr(placement.os, "link", cross_device)
+        assert place_file(src, tmp_path / "a.dat", "hardlink") == "copy"
+        assert place_file(src, tmp_path / "b.dat", "hardlink") == "copy"
+        assert len(calls) == 1
+        assert not os.path.samefile(src, tmp_path / "a.dat")
+        assert (tmp_path / "b.dat").read_bytes() == b"data"
+
+    def test_per_file_errors_fall_back_for_that_file_only(self, src, tmp_path, monkeypatch):
+        link = os.link
+
+        def at_link_limit(a, b):
+            if "a.dat" in str(b):
+                raise OSError(errno.EMLINK, "Too many links")
+            return link(a, b)
+
+        monkeypatch.setattr(placement.os, "link", at_link_limit)
+        assert place_file(src, tmp_path / "a.dat", "hardlink") == "copy"
+        assert place_file(src, tmp_path / "b.dat", "hardlink") == "hardlink"
+        assert not placement._unsupported
+
+    def test_failed_link_keeps_existing_target(self, src, tmp_path, monkeypatch):
+        target = tmp_path / "linked.dat"
+        target.write_bytes(b"old")
+
+        def io_error(a, b):
+            raise OSError(errno.EIO, "I/O error")
+
+        monkeypatch.setattr(placement.os, "link", io_error)
+        with pytest.raises(OSError):
+            place_file(src, target, "hardlink")
+        assert target.read_bytes() == b"old"
+        assert sorted(f.name for f in tmp_path.iterdir()) == ["RBSA15I.dat", "linked.dat"]
+
+    def test_reflink_always_produces_a_file(self, src, tmp_path):
+        used = place_file(src, tmp_path / "clone.dat", "reflink")
+        assert used in ("reflink", "copy")
+        assert (tmp_path / "clone.dat").read_bytes() == b"data"
+        assert not (tmp_path / "clone.dat").is_symlink()
+
+    def test_unknown_strategy_raises(self, src, tmp_path):
+        with pytest.raises(ValueError):
+            place_file(src, tmp_path / "x.dat", "move")
+
+    def test_sort_by_week_with_hardlinks(self, tmp_path):
+        dat = tmp_path / "dat"
+        dat.mkdir()
+        (dat / "RBSA15I.dat").write_bytes(b"x")
+        counts = move_files_by_week(dat, tmp_path / "FINAL", 1, 2026, placement="hardlink")
+        assert counts["week 3"] == 1
+        assert os.path.samefile(dat / "RBSA15I.dat", tmp_path / "FINAL" / "week 3" / "RBSA15I.dat")
+
+
+class TestCopyFiles:
+    @pytest.fixture
+    def jobs(self, tmp_path):
+        (tmp_path / "src").mkdir()
+        (tmp_path / "dst").mkdir()
+        jobs = []
+        for i in range(6):
+            src = tmp_path / "src" / f"f{i}.dat"
+            src.write_bytes(b"x" * 100)
+            jobs.append(CopyJob(src, tmp_path / "dst" / src.name))
+        return jobs
+
+    def test_copies_in_job_order_with_progress(self, jobs):
+        reports = []
+        outcomes = copy_files(jobs, max_workers=4, progress=lambda done, total: reports.append((done, total)))
+        assert [o.job for o in outcomes] == jobs
+        assert all(o.ok and o.placement == "copy" for o in outcomes)
+        assert all(job.dst.read_bytes() == b"x" * 100 for job in jobs)
+        assert reports[-1] == (600, 600)
+        assert len(reports) == 6
+
+    def test_in_flight_bytes_are_bounded(self, jobs, monkeypatch):
+        lock, active, peak = threading.Lock(), [0], [0]
+        original = copier.place_file
+
+        def slow_place(src, dst, strategy):
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            threading.Event().wait(0.02)
+            with lock:
+                active[0] -= 1
+            return original(src, dst, strategy)
+
+        monkeypatch.setattr(copier, "place_file", slow_place)
+        copy_files(jobs, max_workers=6, max_in_flight_bytes=250)
+        assert peak[0] == 2
+
+    def test_transient_errors_are_retried(self, jobs, monkeypatch):
+        original, failures = copier.place_file, []
+
+        def flaky(src, dst, strategy):
+            if src not in failures:
+                failures.append(src)
+                raise OSError(errno.EIO, "I/O error")
+            return original(src, dst, strategy)
+
+        monkeypatch.setattr(copier, "place_file", flaky)
+        outcomes = copy_files(jobs[:2], retries=1, retry_delay=0)
+        assert all(o.ok and o.attempts == 2 for o in outcomes)
+
+    def test_failures_are_returned_not_raised(self, jobs):
+        jobs[0].src.unlink()
+        outcomes = copy_files(jobs, retry_delay=0)
+        assert isinstance(outcomes[0].error, FileNotFoundError)
+        assert outcomes[0].attempts == 1
+        assert all(o.ok for o in outcomes[1:])
+
+    def test_jobs_sharing_a_target_run_in_order(self, tmp_path, monkeypatch):
+        original = copier.place_file
+
+        def slow_first(src, dst, strategy):
+            # Without ordering, the later jobs would finish first
+            threading.Event().wait(0.05 if src.name == "v0.dat" else 0)
+            return original(src, dst, strategy)
+
+        monkeypatch.setattr(copier, "place_file", slow_first)
+        target = tmp_path / "copies.dat"
+        jobs = []
+        for i in range(4):
+            src = tmp_path / f"v{i}.dat"
+            src.write_bytes(bytes([48 + i]))
+            jobs.append(CopyJob(src, target))
+        outcomes = copy_files(jobs, max_workers=4)
+        assert [o.job for o in outcomes] == jobs
+        assert target.read_bytes() == b"3"
+
+
+class TestConvertToPdf:
+    @pytest.fixture
+    def documents(self, tmp_path):
+        src = tmp_path / "temp"
+        (src / "nested").mkdir(parents=True)
+        for name in ("notes.docx", "nested/log.v2.xlsx", "broken.xlsm"):
+            (src / name).write_bytes(b"doc")
+        return src
+
+    def test_converts_concurrently_and_copies_originals(self, documents, tmp_path, fake_converter):
+        out = tmp_path / "MDVR"
+        converted = convert_folder_contents_to_pdf(documents, out, converter=fake_converter)
+        assert len(fake_converter.calls) == 3
+        assert sorted(p.name.split(" modified ")[0] for p in converted) == ["log.v2", "notes"]
+        assert all(p.read_bytes().startswith(b"%PDF") for p in converted)
+        # The broken document gets neither a PDF nor a copy of its original
+        assert sorted(p.suffix for p in out.iterdir() if p.suffix != ".pdf") == [".docx", ".xlsx"]
+        assert not fake_converter.closed
+
+    def test_existing_pdfs_are_not_reconverted(self, documents, tmp_path, fake_converter):
+        out = tmp_path / "MDVR"
+        convert_folder_contents_to_pdf(documents, out, converter=fake_converter)
+        fake_converter.calls.clear()
+        convert_folder_contents_to_pdf(documents, out, converter=fake_converter)
+        assert [src.name for src, _ in fake_converter.calls] == ["broken.xlsm"]
+
+    def test_falls_back_to_subprocess_without_uno(self, documents, tmp_path, fake_soffice, monkeypatch):
+        monkeypatch.setitem(sys.modules, "uno", None)
+        with open_converter(fake_soffice, workers=2) as converter:
+            assert isinstance(converter, SubprocessConverter)
+            convert_file_to_pdf(documents / "notes.docx", tmp_path / "notes.pdf", converter=converter)
+        assert (tmp_path / "notes.pdf").read_bytes().startswith(b"%PDF")
+
+    def test_pool_falls_back_when_every_instance_dies(self, documents, tmp_path, fake_soffice, monkeypatch):
+        started = []
+
+        class DyingInstance:
+            def __init__(self, soffice, profile, start_timeout):
+                if started:
+                    raise RuntimeError("LibreOffice listener did not start")
+                started.append(self)
+                self.profile, self.pipe, self.alive = profile, "fake", True
+
+            def convert(self, src, dest):
+                threading.Event().wait(0.2)
+                self.alive = False
+                raise RuntimeError("crashed")
+
+            def terminate(self):
+                self.alive = False
+
+        monkeypatch.setitem(sys.modules, "uno", object())
+        monkeypatch.setattr(converter_module, "_Instance", DyingInstance)
+        results = {}
+
+        def convert(name):
+            try:
+                pool.convert(documents / name, tmp_path / f"{name}.pdf")
+                results[name] = "ok"
+            except RuntimeError:
+                results[name] = "failed"
+
+        with converter_module.LibreOfficePool(fake_soffice, workers=1) as pool:
+            # The second thread waits for the only instance, which dies
+            # and cannot be restarted.
+            threads = [threading.Thread(target=convert, args=(name,)) for name in ("notes.docx", "broken.xlsm")]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join(timeout=10)
+            assert not any(thread.is_alive() for thread in threads)
+        assert sorted(results.values()) == ["failed", "ok"]
+
+    def test_pool_kills_and_restarts_hung_instance(self, documents, tmp_path, fake_soffice, monkeypatch):
+        started = []
+
+        class FakeProcess:
+            def __init__(self):
+                self.killed = threading.Event()
+
+            def kill(self):
+                self.killed.set()
+
+        class HangingInstance:
+            def __init__(self, soffice, profile, start_timeout):
+                started.append(self)
+                self.profile, self.pipe = profile, "fake"
+                self.process = FakeProcess()
+
+            @property
+            def alive(self):
+                return not self.process.killed.is_set()
+
+            def convert(self, src, dest):
+                if not self.process.killed.wait(10):
+                    raise AssertionError("watchdog never fired")
+                raise RuntimeError("bridge disposed")
+
+            def terminate(self):
+                self.process.kill()
+
+        monkeypatch.setitem(sys.modules, "uno", object())
+        monkeypatch.setattr(converter_module, "_Instance", HangingInstance)
+        with converter_module.LibreOfficePool(fake_soffice, workers=1, timeout=0.2) as pool:
+            with pytest.raises(RuntimeError, match="Timed out converting"):
+                pool.convert(documents / "notes.docx", tmp_path / "notes.pdf")
+            assert len(started) == 2
+            assert started[1].alive
+
+    def test_missing_soffice_converts_nothing(self, documents, tmp_path):
+        assert convert_folder_contents_to_pdf(documents, tmp_path / "MDVR", soffice_path=tmp_path / "nope") == []
+
+
+class TestMoveFilesByWeek:
+    def test_sorts_only_given_paths(self, tmp_path):
+        dat = tmp_path / "dat"
+        dat.mkdir()
+        (dat / "RBSA08I.dat").write_bytes(b"week2")
+        (dat / "RBSA15I.dat").write_bytes(b"week3")
+        counts = move_files_by_week(dat, tmp_path / "FINAL", 1, 2026, paths=[dat / "RBSA15I.dat"])
+        assert counts["week 2"] == 0
+        assert counts["week 3"] == 1
+
+    @pytest.mark.parametrize("names", [[], ["notes.txt"]])
+    def test_no_parseable_files_with_paths(self, tmp_path, names):
+        dat = tmp_path / "dat"
+        dat.mkdir()
+        for name in names:
+            (dat / name).write_bytes(b"x")
+        counts = move_files_by_week(dat, tmp_path / "FINAL", 1, 2026, paths=[])
+        assert sum(counts.values()) == 0
+
+    def test_failed_copy_raises_after_the_rest(self, tmp_path, monkeypatch):
+        dat = tmp_path / "dat"
+        dat.mkdir()
+        (dat / "RBSA08I.dat").write_bytes(b"week2")
+        (dat / "RBSA15I.dat").write_bytes(b"week3")
+        original = copier.place_file
+
+        def failing(src, dst, strategy):
+            if src.name == "RBSA15I.dat":
+                raise FileNotFoundError(errno.ENOENT, "Removed while sorting", str(src))
+            return original(src, dst, strategy)
+
+        monkeypatch.setattr(copier, "place_file", failing)
+        with pytest.raises(OSError, match="RBSA15I.dat"):
+            move_files_by_week(dat, tmp_path / "FINAL", 1, 2026)
+        assert (tmp_path / "FINAL" / "week 2" / "RBSA08I.dat").exists()
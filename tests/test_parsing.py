@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+"""Tests for workspace.parsing — .dat filename scanning."""
+
+import os
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from autogc_validation.database.enums import SampleType
+from autogc_validation.workspace.files import move_files_by_week
+from autogc_validation.workspace.parsing import (
+    DAT_SCAN_COLUMNS,
+    invalidate_dat_scan,
+    list_by_sample_type,
+    parse_dat_file,
+    scan_dat_files,
+)
+
+_STATION = timezone(timedelta(hours=-7))
+
+
+def _touch(path, when):
+    path.write_bytes(b"dat")
+    ts = when.replace(tzinfo=_STATION).timestamp()
+    os.utime(path, (ts, ts))
+    return path
+
+
+@pytest.fixture
+def dat_folder(tmp_path):
+    folder = tmp_path / "dat"
+    folder.mkdir()
+    # Written in the hour after collection: RBSA15I = Jan 15, 08:00
+    _touch(folder / "RBSA15I.dat", datetime(2026, 1, 15, 9, 5))
+    _touch(folder / "RBBA02C.dat", datetime(2026, 1, 2, 3, 5))
+    _touch(folder / "RBSA22D.dat", datetime(2026, 1, 23, 4, 5))  # mismatched day
+    _touch(folder / "RBSB01A.dat", datetime(2026, 2, 1, 1, 5))  # February
+    (folder / "RBSA15I.dat.tx1").write_bytes(b"tx1")
+    (folder / "notes.txt").write_bytes(b"")
+    invalidate_dat_scan()
+    return folder
+
+
+class TestScanDatFiles:
+    def test_parses_every_dat_file(self, dat_folder):
+        scan = scan_dat_files(dat_folder)
+        assert list(scan.columns) == DAT_SCAN_COLUMNS
+        assert [p.name for p in scan["path"]] == [
+            "RBBA02C.dat", "RBSA15I.dat", "RBSA22D.dat", "RBSB01A.dat",
+        ]
+        row = scan.iloc[1]
+        assert (row["site"], row["sample_type"], row["month"], row["day"], row["hour"]) == ("RB", "s", 1, 15, 8)
+
+    def test_mismatch_agrees_with_parse_dat_file(self, dat_folder):
+        scan = scan_dat_files(dat_folder)
+        for path, mismatch in zip(scan["path"], scan["mismatch"]):
+            _, mismatched = parse_dat_file(path)
+            assert mismatch == (mismatched is not None)
+        assert scan.loc[scan["mismatch"], "path"].map(lambda p: p.name).tolist() == ["RBSA22D.dat"]
+
+    def test_cached_until_folder_changes(self, dat_folder, monkeypatch):
+        scan_dat_files(dat_folder)
+        monkeypatch.setattr(os, "scandir", lambda *a: pytest.fail("rescanned"))
+        assert len(scan_dat_files(dat_folder)) == 4
+        monkeypatch.undo()
+
+        _touch(dat_folder / "RBSA16I.dat", datetime(2026, 1, 16, 9, 5))
+        assert len(scan_dat_files(dat_folder)) == 5
+
+    def test_callers_get_copies(self, dat_folder):
+        scan = scan_dat_files(dat_folder)
+        scan["site"] = "XX"
+        assert (scan_dat_files(dat_folder)["site"] == "RB").all()
+
+
+class TestScanConsumers:
+    def test_list_by_sample_type(self, dat_folder, tmp_path):
+        mismatched = list_by_sample_type(dat_folder, SampleType("s"), 2026, output_dir=tmp_path / "out")
+        assert [p.name for p in mismatched] == ["RBSA22D.dat"]
+        lines = (tmp_path / "out" / "s.csv").read_text().splitlines()
+        assert lines == [
+            "date,hour,filename",
+            "01/15/2026,08:00,RBSA15I",
+            "01/22/2026,03:00,RBSA22D",
+            "02/01/2026,00:00,RBSB01A",
+        ]
+
+    def test_move_files_by_week_skips_other_months(self, dat_folder, tmp_path):
+        counts = move_files_by_week(dat_folder, tmp_path / "FINAL", 1, 2026)
+        assert counts == {"week 1": 1, "week 2": 0, "week 3": 1, "week 4": 1}
+        assert not (tmp_path / "FINAL" / "week 1" / "RBSB01A.dat").exists()
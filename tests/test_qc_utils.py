@@ -13,6 +13,7 @@ from autogc_validation.qc.utils import (
     _safe_name_to_aqs,
     get_compound_cols,
     align_period_index,
+    aligned_periods,
 )
 
 
@@ -143,3 +144,47 @@ class TestAlignPeriodIndex:
         result = align_period_index(samples, periods)
         assert result.min() >= 0
         assert result.max() <= len(periods) - 1
+
+
+class TestAlignedPeriods:
+    def _make_periods(self, dates, values):
+        return pd.DataFrame(
+            {45201: values, 45202: [v * 2 for v in values]},
+            index=pd.DatetimeIndex(dates),
+        )
+
+    def test_matrix_gathers_period_values(self):
+        periods = self._make_periods(["2026-01-01", "2026-01-15"], [1.0, 3.0])
+        samples = pd.DataFrame(index=pd.DatetimeIndex(["2026-01-05", "2026-01-20"]))
+        matrix = aligned_periods(samples, periods).matrix([45202, 45201])
+        np.testing.assert_array_equal(matrix, [[2.0, 1.0], [6.0, 3.0]])
+
+    def test_missing_code_is_nan(self):
+        periods = self._make_periods(["2026-01-01"], [1.0])
+        samples = pd.DataFrame(index=pd.DatetimeIndex(["2026-01-05"]))
+        matrix = aligned_periods(samples, periods).matrix([45201, 99999])
+        assert matrix[0, 0] == 1.0
+        assert np.isnan(matrix[0, 1])
+
+    def test_unsorted_periods(self):
+        periods = self._make_periods(["2026-01-15", "2026-01-01"], [3.0, 1.0])
+        samples = pd.DataFrame(index=pd.DatetimeIndex(["2026-01-05", "2026-01-20"]))
+        aligned = aligned_periods(samples, periods)
+        assert list(aligned.positions) == [1, 0]
+        np.testing.assert_array_equal(aligned.matrix([45201])[:, 0], [1.0, 3.0])
+
+    def test_tz_aware_samples(self):
+        periods = self._make_periods(["2026-01-01", "2026-01-15"], [1.0, 3.0])
+        samples = pd.DataFrame(index=pd.DatetimeIndex(
+            ["2026-01-14 23:00", "2026-01-15 00:00"], tz="Etc/GMT+7",
+        ))
+        assert list(aligned_periods(samples, periods).positions) == [0, 1]
+
+    def test_cached_per_samples_and_periods(self):
+        periods = self._make_periods(["2026-01-01"], [1.0])
+        samples = pd.DataFrame(index=pd.DatetimeIndex(["2026-01-05"]))
+        first = aligned_periods(samples, periods)
+        assert aligned_periods(samples, periods) is first
+        assert first.matrix([45201]) is first.matrix([45201])
+        other = self._make_periods(["2026-01-01"], [5.0])
+        assert aligned_periods(samples, other) is not first
@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+"""Tests for qc.rt_drift — rolling RT drift tracking and anchor-based flagging."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from autogc_validation.database.enums import CompoundAQSCode
+from autogc_validation.qc.rt_drift import (
+    _SortedWindow,
+    detect_rt_drift,
+    predict_expected_rt,
+    rolling_median_mad,
+)
+
+BENZENE = int(CompoundAQSCode.C_BENZENE)
+TOLUENE = int(CompoundAQSCode.C_TOLUENE)
+CYCLOHEXANE = int(CompoundAQSCode.C_CYCLOHEXANE)  # elutes between benzene and toluene
+PROPANE = int(CompoundAQSCode.C_PROPANE)
+N_PENTANE = int(CompoundAQSCode.C_N_PENTANE)
+
+
+def _make_rt_df(n=200, drift_per_hour=0.0, seed=0):
+    """Hourly ambient RT frame with a linear drift shared by every BP compound."""
+    rng = np.random.default_rng(seed)
+    index = pd.date_range("2026-01-01", periods=n, freq="h", name="date_time")
+    drift = np.arange(n) * drift_per_hour
+    base = {PROPANE: 3.0, N_PENTANE: 6.0, BENZENE: 10.0, CYCLOHEXANE: 12.0, TOLUENE: 15.0}
+    data = {
+        code: rt + drift + rng.normal(0, 0.002, n)
+        for code, rt in base.items()
+    }
+    df = pd.DataFrame(data, index=index)
+    df["sample_type"] = "s"
+    df["filename"] = [f"RBSA{i:04d}" for i in range(n)]
+    return df
+
+
+class TestSortedWindow:
+    def test_median_and_mad_match_numpy(self):
+        rng = np.random.default_rng(1)
+        win = _SortedWindow()
+        values = rng.normal(size=51)
+        for v in values:
+            win.add(v)
+        for size in (51, 50):
+            current = np.array(win._values)
+            med = win.median()
+            assert med == pytest.approx(np.median(current))
+            assert win.mad(med) == pytest.approx(np.median(np.abs(current - med)))
+            win.remove(values[0])
+
+    def test_duplicates_removed_one_at_a_time(self):
+        win = _SortedWindow()
+        for v in (1.0, 1.0, 2.0):
+            win.add(v)
+        win.remove(1.0)
+        assert win._values == [1.0, 2.0]
+
+
+class TestRollingMedianMad:
+    def test_integer_window_matches_pandas(self):
+        s = pd.Series(np.random.default_rng(2).normal(size=300))
+        s.iloc[[5, 40, 41]] = np.nan
+        med, mad = rolling_median_mad(s, window=24, min_periods=5)
+        expected_med = s.rolling(24, min_periods=5).median()
+        expected_mad = s.rolling(24, min_periods=5).apply(
+            lambda x: np.median(np.abs(x[~np.isnan(x)] - np.median(x[~np.isnan(x)]))),
+            raw=True,
+        )
+        np.testing.assert_allclose(med, expected_med.to_numpy(), equal_nan=True)
+        np.testing.assert_allclose(mad, expected_mad.to_numpy(), equal_nan=True)
+
+    def test_time_window_matches_pandas(self):
+        index = pd.date_range("2026-01-01", periods=200, freq="h")
+        index = index.delete([10, 11, 12, 90])  # gaps in the hourly record
+        s = pd.Series(np.random.default_rng(3).normal(size=len(index)), index=index)
+        med, _ = rolling_median_mad(s, s.index, window="1D", min_periods=3)
+        expected = s.rolling("1D", min_periods=3).median()
+        np.testing.assert_allclose(med, expected.to_numpy(), equal_nan=True)
+
+    def test_min_periods_leaves_nan(self):
+        med, mad = rolling_median_mad(np.arange(10.0), window=5, min_periods=5)
+        assert np.isnan(med[:4]).all()
+        assert med[4] == 2.0
+
+    def test_numpy_integer_window_counts_rows(self):
+        values = np.arange(10.0)
+        med, _ = rolling_median_mad(values, window=np.int64(5), min_periods=5)
+        expected, _ = rolling_median_mad(values, window=5, min_periods=5)
+        np.testing.assert_array_equal(med, expected)
+
+    def test_bool_window_raises(self):
+        with pytest.raises(ValueError, match="window"):
+            rolling_median_mad(np.arange(5.0), window=True)
+
+    def test_time_window_requires_index(self):
+        with pytest.raises(ValueError, match="DatetimeIndex"):
+            rolling_median_mad(np.arange(5.0), window="1D")
+
+
+class TestPredictExpectedRt:
+    def test_shared_drift_is_predicted(self):
+        df = _make_rt_df(drift_per_hour=0.001)
+        expected, _ = predict_expected_rt(df, [CYCLOHEXANE], window="2D")
+        residual = (df[CYCLOHEXANE] - expected[CYCLOHEXANE]).dropna()
+        assert residual.abs().max() < 0.02
+
+    def test_anchor_predicted_from_other_anchor(self):
+        df = _make_rt_df()
+        df.loc[df.index[150], BENZENE] += 0.5
+        expected, _ = predict_expected_rt(df, [BENZENE], window="2D")
+        # Toluene did not shift, so benzene's expected RT stays near 10.0
+        assert expected[BENZENE].iloc[150] == pytest.approx(10.0, abs=0.02)
+
+
+class TestDetectRtDrift:
+    def test_no_flags_for_shared_drift(self):
+        df = _make_rt_df(drift_per_hour=0.002)
+        result = detect_rt_drift(df, [BENZENE, CYCLOHEXANE, TOLUENE], window="2D")
+        assert result.empty
+
+    def test_broken_relationship_flagged(self):
+        df = _make_rt_df(drift_per_hour=0.002)
+        df.loc[df.index[120], CYCLOHEXANE] += 0.3
+        result = detect_rt_drift(df, [BENZENE, CYCLOHEXANE, TOLUENE], window="2D")
+        assert list(result["compound"]) == [CYCLOHEXANE]
+        assert result.index[0] == df.index[120]
+        assert result.iloc[0]["filename"] == df["filename"].iloc[120]
+
+    def test_empty_result_has_expected_columns(self):
+        df = _make_rt_df()
+        result = detect_rt_drift(df, [CYCLOHEXANE], window="2D")
+        assert {"compound", "expected_rt", "delta", "mad"} <= set(result.columns)
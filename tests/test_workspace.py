@@ -0,0 +1,311 @@
+# -*- coding: utf-8 -*-
+"""Tests for workspace — the create/process orchestration."""
+
+import zipfile
+
+import pytest
+
+from autogc_validation.workspace import WorkspaceResult, create_workspace, process_workspace, run_month
+from autogc_validation.workspace import watch as watch_module
+from autogc_validation.workspace.manifest import MANIFEST_FILENAME, Manifest
+from autogc_validation.workspace.watch import WorkspaceWatcher
+
+
+def _write_zip(path, members, date_time=(2026, 1, 15, 9, 10, 0)):
+    with zipfile.ZipFile(path, "w") as zf:
+        for name, data in members.items():
+            zf.writestr(zipfile.ZipInfo(name, date_time=date_time), data)
+
+
+@pytest.fixture
+def workspace(tmp_path):
+    result = create_workspace(tmp_path, "RB", 2026, 1)
+    temp = result.base_dir / "temp"
+    _write_zip(temp / "RB_week3.zip", {
+        "RBSA15I.dat": b"dat",
+        "RBSA15I.dat.tx1": b"tx1",
+        "RBSA15I-Front Signal.cdf": b"cdf",
+        "readme.txt": b"not needed",
+    })
+    return result.base_dir
+
+
+class TestProcessWorkspace:
+    def test_routes_zip_members_and_sorts_weeks(self, workspace):
+        result = process_workspace(workspace)
+
+        original = workspace / "Original"
+        assert (original / "original_dat_files" / "RBSA15I.dat").exists()
+        assert (original / "original_tx1_files" / "RBSA15I.dat.tx1").exists()
+        assert (original / "original_cdf_files" / "RBSA15I-Front Signal.cdf").exists()
+        # Only members that are not routed are extracted next to the zip
+        assert [f.name for f in (workspace / "temp" / "RB_week3").iterdir()] == ["readme.txt"]
+        assert (workspace / "temp" / "RB_week3" / "readme.txt").read_bytes() == b"not needed"
+
+        assert result.dat_summary["copied"] == (1, ["RBSA15I.dat"])
+        assert result.tx1_summary["copied"][0] == 1
+        assert result.cdf_summary["copied"] == (1, ["RBSA15I-Front Signal.cdf"])
+        assert result.week_counts["week 3"] == 1
+        assert (workspace / "FINAL" / "week 3" / "RBSA15I.dat").exists()
+
+    def test_loose_files_are_merged_into_summary(self, workspace):
+        (workspace / "temp" / "RBSA16I.dat").write_bytes(b"loose")
+        result = process_workspace(workspace)
+        assert result.dat_summary["copied"][0] == 2
+        assert sorted(result.dat_summary["copied"][1]) == ["RBSA15I.dat", "RBSA16I.dat"]
+
+    def test_state_round_trips(self, workspace):
+        result = process_workspace(workspace)
+        loaded = WorkspaceResult.load(workspace)
+        assert loaded.dat_summary == result.dat_summary
+        assert "unzip_files" in loaded.steps_completed
+
+    def test_resent_zip_is_recognised_as_identical(self, workspace):
+        temp = workspace / "temp"
+        (temp / "RB_week3_resent.zip").write_bytes((temp / "RB_week3.zip").read_bytes())
+        result = process_workspace(workspace)
+        assert result.dat_summary["identical"][0] == 1
+        assert result.dat_summary["duplicates"][0] == 0
+        assert not any((workspace / "Original" / "original_dat_files" / "copies").iterdir())
+
+
+class TestIncrementalProcessing:
+    def test_rerun_with_nothing_new_does_no_work(self, workspace):
+        first = process_workspace(workspace)
+        second = process_workspace(workspace)
+        assert not second.errors
+        assert second.dat_summary == first.dat_summary
+        assert second.week_counts == first.week_counts
+        assert all(n == 0 for n in second.step_bytes.values())
+        assert set(second.step_durations) >= {"unzip_files", "sort_by_week"}
+
+    def test_only_new_zip_is_processed(self, workspace):
+        process_workspace(workspace)
+        new_zip = workspace / "temp" / "RB_week4.zip"
+        _write_zip(new_zip, {"RBSA22I.dat": b"week4"}, date_time=(2026, 1, 22, 9, 10, 0))
+
+        result = process_workspace(workspace)
+        assert result.step_bytes["unzip_files"] == new_zip.stat().st_size
+        assert result.dat_summary["copied"] == (2, ["RBSA15I.dat", "RBSA22I.dat"])
+        assert result.week_counts["week 3"] == 1
+        assert result.week_counts["week 4"] == 1
+        assert (workspace / "FINAL" / "week 4" / "RBSA22I.dat").exists()
+
+    def test_new_loose_file_is_copied_and_sorted(self, workspace):
+        process_workspace(workspace)
+        (workspace / "temp" / "RBSA08I.dat").write_bytes(b"loose")
+        result = process_workspace(workspace)
+        assert result.dat_summary["copied"][0] == 2
+        assert result.week_counts["week 2"] == 1
+        assert result.step_bytes["move_dat_files"] == len(b"loose")
+
+    def test_manifest_records_sources_and_destinations(self, workspace):
+        process_workspace(workspace)
+        manifest = Manifest(workspace)
+        member = manifest.get(Manifest.member_key("temp/RB_week3.zip", "RBSA15I.dat"))
+        assert member.source == "temp/RB_week3.zip"
+        assert member.destinations == ["Original/original_dat_files/RBSA15I.dat"]
+        original = manifest.get(workspace / "Original" / "original_dat_files" / "RBSA15I.dat")
+        assert original.destinations == ["FINAL/week 3/RBSA15I.dat"]
+        assert original.hash is not None
+        archive = manifest.get(workspace / "temp" / "RB_week3.zip")
+        assert len(archive.destinations) == 3
+
+    def test_force_reprocesses_everything(self, workspace):
+        process_workspace(workspace)
+        result = process_workspace(workspace, force=True)
+        assert result.step_bytes["unzip_files"] == (workspace / "temp" / "RB_week3.zip").stat().st_size
+        assert result.week_counts["week 3"] == 1
+
+    @pytest.mark.parametrize("manifest_state", ["deleted", "unreadable"])
+    def test_lost_manifest_keeps_edited_week_files(self, workspace, manifest_state):
+        process_workspace(workspace)
+        week_file = workspace / "FINAL" / "week 3" / "RBSA15I.dat"
+        week_file.write_bytes(b"EDITED BY ANALYST")
+        manifest_path = workspace / MANIFEST_FILENAME
+        if manifest_state == "deleted":
+            manifest_path.unlink()
+        else:
+            manifest_path.write_text("{not json")
+
+        result = process_workspace(workspace)
+        assert not result.errors
+        assert week_file.read_bytes() == b"EDITED BY ANALYST"
+        assert result.week_counts["week 3"] == 1
+        assert all(n == 0 for n in result.step_bytes.values())
+        assert Manifest(workspace).loaded
+
+    def test_changed_original_does_not_replace_week_file(self, workspace):
+        process_workspace(workspace)
+        week_file = workspace / "FINAL" / "week 3" / "RBSA15I.dat"
+        week_file.write_bytes(b"EDITED BY ANALYST")
+        (workspace / "Original" / "original_dat_files" / "RBSA15I.dat").write_bytes(b"resent")
+
+        result = process_workspace(workspace)
+        assert not result.errors
+        assert week_file.read_bytes() == b"EDITED BY ANALYST"
+
+        process_workspace(workspace, force=True)
+        assert week_file.read_bytes() == b"resent"
+
+    def test_step_metrics_round_trip(self, workspace):
+        result = process_workspace(workspace)
+        loaded = WorkspaceResult.load(workspace)
+        assert loaded.step_bytes == result.step_bytes
+        assert loaded.step_durations == result.step_durations
+
+
+class TestSteps:
+    def test_only_restricts_inputs(self, workspace):
+        other = workspace / "temp" / "RB_week4.zip"
+        _write_zip(other, {"RBSA22I.dat": b"week4"}, date_time=(2026, 1, 22, 9, 10, 0))
+        result = process_workspace(workspace, only=[other])
+        assert result.unzipped == [other]
+        assert result.week_counts["week 3"] == 0
+        assert result.week_counts["week 4"] == 1
+
+    def test_loose_cdf_files_are_copied(self, workspace):
+        (workspace / "temp" / "RBSA16I-Back Signal.cdf").write_bytes(b"cdf")
+        result = process_workspace(workspace, steps=["move_cdf_files"])
+        assert result.cdf_summary["copied"] == (1, ["RBSA16I-Back Signal.cdf"])
+        assert (workspace / "Original" / "original_cdf_files" / "RBSA16I-Back Signal.cdf").exists()
+        assert "unzip_files" not in result.steps_completed
+
+    def test_unknown_step_raises(self, workspace):
+        with pytest.raises(ValueError):
+            process_workspace(workspace, steps=["unzip_files", "validate"])
+
+
+class TestWorkspaceWatcher:
+    def test_ingests_existing_and_new_arrivals(self, workspace):
+        with WorkspaceWatcher(workspace, settle_seconds=0, use_inotify=False) as watcher:
+            assert watcher.poll_once() == [workspace / "temp" / "RB_week3.zip"]
+            assert watcher.poll_once() == []
+
+            loose = workspace / "temp" / "RBSA08I.dat"
+            loose.write_bytes(b"loose")
+            assert watcher.poll_once() == [loose]
+        assert watcher.result.week_counts["week 2"] == 1
+        assert watcher.result.week_counts["week 3"] == 1
+        assert "convert_documents" not in watcher.result.steps_completed
+
+    def test_waits_for_file_to_settle(self, workspace):
+        watcher = WorkspaceWatcher(workspace, settle_seconds=60, use_inotify=False)
+        assert watcher.poll_once() == []
+        assert not (workspace / "Original" / "original_dat_files" / "RBSA15I.dat").exists()
+
+    def test_partial_zip_is_skipped_until_complete(self, workspace):
+        watcher = WorkspaceWatcher(workspace, settle_seconds=0, use_inotify=False)
+        watcher.poll_once()
+        arriving = workspace / "temp" / "RB_week4.zip"
+        _write_zip(arriving, {"RBSA22I.dat": b"week4"}, date_time=(2026, 1, 22, 9, 10, 0))
+        complete = arriving.read_bytes()
+        arriving.write_bytes(complete[: len(complete) // 2])
+        assert watcher.poll_once() == []
+
+        arriving.write_bytes(complete)
+        assert watcher.poll_once() == [arriving]
+        assert (workspace / "FINAL" / "week 4" / "RBSA22I.dat").exists()
+
+    def test_skips_files_already_processed(self, workspace):
+        process_workspace(workspace)
+        watcher = WorkspaceWatcher(workspace, settle_seconds=0, use_inotify=False)
+        assert watcher.poll_once() == []
+
+    def test_failed_ingest_is_logged_and_retried(self, workspace, monkeypatch):
+        calls = []
+
+        def flaky_process_workspace(*args, **kwargs):
+            calls.append(kwargs["only"])
+            if len(calls) == 1:
+                raise OSError("disk full")
+            return process_workspace(*args, **kwargs)
+
+        monkeypatch.setattr(watch_module, "process_workspace", flaky_process_workspace)
+        archive = workspace / "temp" / "RB_week3.zip"
+        watcher = WorkspaceWatcher(workspace, settle_seconds=0, use_inotify=False, retry_seconds=0)
+        assert watcher.run(max_batches=1) == 1
+        assert not (workspace / "Original" / "original_dat_files" / "RBSA15I.dat").exists()
+
+        assert watcher.poll_once() == [archive]
+        assert (workspace / "FINAL" / "week 3" / "RBSA15I.dat").exists()
+        assert watcher.poll_once() == []
+        assert len(calls) == 2
+
+    def test_failed_ingest_waits_before_retrying(self, workspace, monkeypatch):
+        def failing_process_workspace(*args, **kwargs):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(watch_module, "process_workspace", failing_process_workspace)
+        watcher = WorkspaceWatcher(workspace, settle_seconds=0, use_inotify=False, retry_seconds=60)
+        assert watcher.poll_once() == [workspace / "temp" / "RB_week3.zip"]
+        assert watcher.poll_once() == []
+
+    def test_ignores_zips_extracted_from_other_zips(self, workspace):
+        nested = workspace / "temp" / "RB_week3" / "inner.zip"
+        nested.parent.mkdir()
+        _write_zip(nested, {"RBSA22I.dat": b"week4"})
+        watcher = WorkspaceWatcher(workspace, settle_seconds=0, use_inotify=False)
+        assert watcher.poll_once() == [workspace / "temp" / "RB_week3.zip"]
+
+    def test_inotify_wakes_on_new_file(self, workspace):
+        watcher = WorkspaceWatcher(workspace, settle_seconds=0, poll_interval=30)
+        if watcher._inotify is None:
+            pytest.skip("inotify unavailable")
+        with watcher:
+            watcher.poll_once()
+            (workspace / "temp" / "RBSA08I.dat").write_bytes(b"loose")
+            assert watcher._inotify.wait(5)
+
+
+class TestRunMonth:
+    def test_sites_start_and_process_in_parallel(self, tmp_path):
+        report = run_month(["RB", "HW"], tmp_path, 2026, 1, phases=("start", "process"), max_workers=2)
+        assert report.failed == []
+        assert list(report.runs) == ["RB", "HW"]
+        for site in ("RB", "HW"):
+            run = report.runs[site]
+            assert run.result.base_dir == tmp_path / "validation" / site / f"{site}202601v1"
+            assert "sort_by_week" in run.result.steps_completed
+            # Each site's records go to its own log only
+            log = run.log_path.read_text()
+            assert f"{site}202601v1" in log
+            assert f"{'HW' if site == 'RB' else 'RB'}202601v1" not in log
+        assert list(report.summary().index) == ["RB", "HW"]
+
+    def test_process_uses_latest_workspace(self, tmp_path):
+        run_month(["RB"], tmp_path, 2026, 1, max_workers=1)
+        workspace = tmp_path / "validation" / "RB" / "RB202601v1"
+        _write_zip(workspace / "temp" / "RB_week3.zip", {"RBSA15I.dat": b"dat"})
+
+        report = run_month(["RB"], tmp_path, 2026, 1, phases=["process"], max_workers=1)
+        assert report.summary().loc["RB", "dat_copied"] == 1
+        assert (workspace / "FINAL" / "week 3" / "RBSA15I.dat").exists()
+
+    def test_failed_site_does_not_stop_others(self, tmp_path):
+        run_month(["RB"], tmp_path, 2026, 1, max_workers=1)
+        report = run_month(["RB", "HW"], tmp_path, 2026, 1, phases=["process"], max_workers=2)
+        assert report.failed == ["HW"]
+        assert report.runs["HW"].error.startswith("FileNotFoundError")
+        assert report.runs["RB"].ok
+
+    def test_errors_from_earlier_runs_do_not_fail_site(self, tmp_path):
+        run_month(["RB"], tmp_path, 2026, 1, max_workers=1)
+        workspace = tmp_path / "validation" / "RB" / "RB202601v1"
+        state = WorkspaceResult.load(workspace)
+        state.errors.append("unzip_files: old failure")
+        state.save()
+
+        report = run_month(["RB"], tmp_path, 2026, 1, phases=["process"], max_workers=1)
+        assert report.failed == []
+        assert report.runs["RB"].errors == []
+        assert report.runs["RB"].result.errors == ["unzip_files: old failure"]
+        assert report.summary().loc["RB", "errors"] == ""
+
+    def test_unknown_site_or_phase_raises(self, tmp_path):
+        with pytest.raises(ValueError):
+            run_month(["XX"], tmp_path, 2026, 1)
+        with pytest.raises(ValueError):
+            run_month(["RB"], tmp_path, 2026, 1, phases=["sort"])
+        with pytest.raises(ValueError):
+            run_month(["RB"], tmp_path, 2026, 1, phases=[])